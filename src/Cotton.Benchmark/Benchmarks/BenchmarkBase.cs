@@ -11,6 +11,8 @@ namespace Cotton.Benchmark.Benchmarks
     {
         protected readonly BenchmarkConfiguration _configuration = configuration ?? throw new ArgumentNullException(nameof(configuration));
 
+        private double? _coldIterationMs;
+
         public abstract string Name { get; }
 
         public abstract string Description { get; }
@@ -20,11 +22,16 @@ namespace Cotton.Benchmark.Benchmarks
             var stopwatch = Stopwatch.StartNew();
             try
             {
-                // Warmup
+                // Warmup; the first pass pays JIT, tiering and pool growth and is kept apart as the cold start
                 for (int i = 0; i < _configuration.WarmupIterations; i++)
                 {
                     cancellationToken.ThrowIfCancellationRequested();
+                    long warmupStartedAt = Stopwatch.GetTimestamp();
                     await ExecuteIterationAsync(cancellationToken);
+                    if (i == 0)
+                    {
+                        _coldIterationMs = Stopwatch.GetElapsedTime(warmupStartedAt).TotalMilliseconds;
+                    }
                 }
 
                 // Actual measurement
@@ -32,6 +39,9 @@ namespace Cotton.Benchmark.Benchmarks
                 for (int i = 0; i < _configuration.MeasuredIterations; i++)
                 {
                     cancellationToken.ThrowIfCancellationRequested();
+                    int gen0Before = GC.CollectionCount(0);
+                    int gen1Before = GC.CollectionCount(1);
+                    int gen2Before = GC.CollectionCount(2);
                     long allocatedBefore = GC.GetTotalAllocatedBytes(precise: false);
                     PerformanceMetrics iterationMetrics = await MeasureIterationAsync(cancellationToken);
                     long managedAllocatedBytes = Math.Max(0, GC.GetTotalAllocatedBytes(precise: false) - allocatedBefore);
@@ -40,7 +50,10 @@ namespace Cotton.Benchmark.Benchmarks
                     metrics.Add(iterationMetrics.WithMemory(
                         managedAllocatedBytes,
                         process.WorkingSet64,
-                        process.PeakWorkingSet64));
+                        process.PeakWorkingSet64,
+                        GC.CollectionCount(0) - gen0Before,
+                        GC.CollectionCount(1) - gen1Before,
+                        GC.CollectionCount(2) - gen2Before));
                 }
 
                 stopwatch.Stop();
@@ -64,6 +77,9 @@ namespace Cotton.Benchmark.Benchmarks
             var avgThroughput = metrics.Average(m => m.MegabytesPerSecond);
             var minThroughput = metrics.Min(m => m.MegabytesPerSecond);
             var maxThroughput = metrics.Max(m => m.MegabytesPerSecond);
+            var stdDevThroughput = metrics.Count > 1
+                ? Math.Sqrt(metrics.Sum(m => Math.Pow(m.MegabytesPerSecond - avgThroughput, 2)) / (metrics.Count - 1))
+                : 0;
             var avgDuration = TimeSpan.FromMilliseconds(metrics.Average(m => m.Duration.TotalMilliseconds));
             var durationsMs = metrics
                 .Select(m => m.Duration.TotalMilliseconds)
@@ -75,6 +91,7 @@ namespace Cotton.Benchmark.Benchmarks
                 ["AvgThroughputMBps"] = avgThroughput,
                 ["MinThroughputMBps"] = minThroughput,
                 ["MaxThroughputMBps"] = maxThroughput,
+                ["StdDevThroughputMBps"] = stdDevThroughput,
                 ["AvgDurationMs"] = avgDuration.TotalMilliseconds,
                 ["P50DurationMs"] = Percentile(durationsMs, 0.50),
                 ["P95DurationMs"] = Percentile(durationsMs, 0.95),
@@ -83,6 +100,12 @@ namespace Cotton.Benchmark.Benchmarks
                 ["DataSize"] = FormatBytes(_configuration.DataSizeBytes)
             };
 
+            if (_coldIterationMs is double coldIterationMs)
+            {
+                aggregated["ColdIterationMs"] = coldIterationMs;
+                aggregated["ColdStartPenaltyMs"] = Math.Max(0, coldIterationMs - Percentile(durationsMs, 0.50));
+            }
+
             AddMemoryMetrics(aggregated, metrics);
             return aggregated;
         }
@@ -95,9 +118,17 @@ namespace Cotton.Benchmark.Benchmarks
             target["MaxManagedAllocatedBytes"] = metrics.Max(m => m.ManagedAllocatedBytes);
             target["MaxWorkingSetBytes"] = metrics.Max(m => m.WorkingSetBytes);
             target["MaxPeakWorkingSetBytes"] = metrics.Max(m => m.PeakWorkingSetBytes);
+
+            // Normalized by data processed so profiles with different data sizes stay comparable.
+            double processedMiB = metrics.Sum(m => m.TotalBytes) / (1024.0 * 1024.0);
+            target["AllocatedBytesPerMiB"] = processedMiB > 0 ? metrics.Sum(m => m.ManagedAllocatedBytes) / processedMiB : 0;
+            target["Gen0Collections"] = metrics.Sum(m => m.Gen0Collections);
+            target["Gen1Collections"] = metrics.Sum(m => m.Gen1Collections);
+            target["Gen2Collections"] = metrics.Sum(m => m.Gen2Collections);
+            target["Gen2CollectionsPerGiB"] = processedMiB > 0 ? metrics.Sum(m => m.Gen2Collections) * 1024 / processedMiB : 0;
         }
 
-        private static double Percentile(IReadOnlyList<double> sortedValues, double percentile)
+        protected static double Percentile(IReadOnlyList<double> sortedValues, double percentile)
         {
             if (sortedValues.Count == 0)
             {
@@ -0,0 +1,210 @@
+﻿// SPDX-License-Identifier: MIT
+// Copyright (c) 2025–2026 Vadim Belov <https://belov.us>
+
+using Cotton.Benchmark.Infrastructure;
+using Cotton.Benchmark.Models;
+using Cotton.Storage.Backends;
+using Cotton.Storage.Helpers;
+using Microsoft.Extensions.Logging.Abstractions;
+using System.Collections.Concurrent;
+using System.Diagnostics;
+
+namespace Cotton.Benchmark.Benchmarks
+{
+    public enum FileSystemSweepOperation
+    {
+        Write,
+        Read
+    }
+
+    /// <summary>
+    /// One cell of the filesystem sweep: a fixed object size written or read by a fixed number of concurrent workers.
+    /// </summary>
+    /// <remarks>
+    /// Reads are only meaningful as a device measurement when the objects are not in the page cache, so on Linux
+    /// every object is fsynced and evicted before the timed read ("cold"). Elsewhere, or when an eviction call
+    /// fails, the read is labelled "page cache" and the chart tooling keeps it out of the saturation recommendation.
+    /// </remarks>
+    public class FileSystemSweepBenchmark : BenchmarkBase
+    {
+        private const int MaxObjectsPerIteration = 4096;
+
+        private static readonly ConcurrentDictionary<int, byte[]> BlockCache = new();
+
+        private readonly FileSystemStorageBackend _backend;
+        private readonly FileSystemSweepOperation _operation;
+        private readonly int _blockSizeBytes;
+        private readonly int _concurrency;
+        private readonly bool _durable;
+        private readonly int _objectCount;
+        private readonly string _storagePath;
+        private readonly ConcurrentQueue<double> _operationLatenciesMs = new();
+        private bool _evictionFailed;
+
+        public FileSystemSweepBenchmark(
+            BenchmarkConfiguration configuration,
+            FileSystemSweepOperation operation,
+            int blockSizeBytes,
+            int concurrency,
+            bool durable,
+            string? storageDirectory)
+            : base(configuration)
+        {
+            ArgumentOutOfRangeException.ThrowIfNegativeOrZero(blockSizeBytes);
+            ArgumentOutOfRangeException.ThrowIfNegativeOrZero(concurrency);
+
+            _operation = operation;
+            _blockSizeBytes = blockSizeBytes;
+            _concurrency = concurrency;
+            _durable = durable;
+            _objectCount = Math.Clamp(configuration.DataSizeBytes / blockSizeBytes, concurrency, Math.Max(concurrency, MaxObjectsPerIteration));
+            _storagePath = storageDirectory ?? Path.Combine(AppContext.BaseDirectory, "files");
+            _backend = new FileSystemStorageBackend(NullLogger<FileSystemStorageBackend>.Instance, _storagePath, flushToDisk: durable);
+        }
+
+        public override string Name => $"Filesystem Sweep {_operation} - {FormatBytes(_blockSizeBytes)} x {_concurrency} ({DurabilityLabel})";
+
+        public override string Description =>
+            $"Measures filesystem backend {_operation.ToString().ToLowerInvariant()} throughput for {_objectCount} objects of {FormatBytes(_blockSizeBytes)} with {_concurrency} concurrent workers";
+
+        private string DurabilityLabel => _operation == FileSystemSweepOperation.Read
+            ? PageCache.IsEvictionSupported && !_evictionFailed ? "cold" : "page cache"
+            : _durable ? "fsync" : "buffered";
+
+        protected override async Task ExecuteIterationAsync(CancellationToken cancellationToken)
+        {
+            await RunOnceAsync(measure: false, cancellationToken).ConfigureAwait(false);
+        }
+
+        protected override Task<PerformanceMetrics> MeasureIterationAsync(CancellationToken cancellationToken)
+        {
+            return RunOnceAsync(measure: true, cancellationToken);
+        }
+
+        protected override Dictionary<string, object> AggregateMetrics(List<PerformanceMetrics> metrics)
+        {
+            Dictionary<string, object> baseMetrics = base.AggregateMetrics(metrics);
+            long bytesPerIteration = (long)_objectCount * _blockSizeBytes;
+            double[] latenciesMs = _operationLatenciesMs.Order().ToArray();
+
+            baseMetrics["DataSizeBytes"] = bytesPerIteration;
+            baseMetrics["DataSize"] = FormatBytes(bytesPerIteration);
+            baseMetrics["Backend"] = "Cotton.Storage.Backends.FileSystemStorageBackend";
+            baseMetrics["StoragePath"] = _storagePath;
+            baseMetrics["Operation"] = _operation.ToString();
+            baseMetrics["Durability"] = DurabilityLabel;
+            baseMetrics["BlockSizeBytes"] = _blockSizeBytes;
+            baseMetrics["Concurrency"] = _concurrency;
+            baseMetrics["ObjectsPerIteration"] = _objectCount;
+            baseMetrics["OperationsPerSecond"] = metrics.Average(m => _objectCount / m.Duration.TotalSeconds);
+            baseMetrics["P50OperationLatencyMs"] = Percentile(latenciesMs, 0.50);
+            baseMetrics["P99OperationLatencyMs"] = Percentile(latenciesMs, 0.99);
+            return baseMetrics;
+        }
+
+        private async Task<PerformanceMetrics> RunOnceAsync(bool measure, CancellationToken cancellationToken)
+        {
+            cancellationToken.ThrowIfCancellationRequested();
+
+            byte[] block = BlockCache.GetOrAdd(_blockSizeBytes, TestDataGenerator.GenerateMixedData);
+            string[] uids = CreateUids(_objectCount);
+            Stopwatch stopwatch = new();
+
+            try
+            {
+                if (_operation == FileSystemSweepOperation.Read)
+                {
+                    await ForEachConcurrentAsync(uids, uid => WriteObjectAsync(uid, block), measure: false, cancellationToken).ConfigureAwait(false);
+                    EvictFromPageCache(uids);
+                    stopwatch.Start();
+                    await ForEachConcurrentAsync(uids, ReadObjectAsync, measure, cancellationToken).ConfigureAwait(false);
+                }
+                else
+                {
+                    stopwatch.Start();
+                    await ForEachConcurrentAsync(uids, uid => WriteObjectAsync(uid, block), measure, cancellationToken).ConfigureAwait(false);
+                }
+
+                stopwatch.Stop();
+            }
+            finally
+            {
+                foreach (string uid in uids)
+                {
+                    await _backend.DeleteAsync(uid).ConfigureAwait(false);
+                }
+            }
+
+            return PerformanceMetrics.Create(
+                (long)_objectCount * _blockSizeBytes,
+                measure ? stopwatch.Elapsed : TimeSpan.Zero);
+        }
+
+        private Task ForEachConcurrentAsync(
+            string[] uids,
+            Func<string, Task> operation,
+            bool measure,
+            CancellationToken cancellationToken)
+        {
+            var options = new ParallelOptions
+            {
+                MaxDegreeOfParallelism = _concurrency,
+                CancellationToken = cancellationToken
+            };
+
+            return Parallel.ForEachAsync(uids, options, async (uid, _) =>
+            {
+                long startedAt = Stopwatch.GetTimestamp();
+                await operation(uid).ConfigureAwait(false);
+                if (measure)
+                {
+                    _operationLatenciesMs.Enqueue(Stopwatch.GetElapsedTime(startedAt).TotalMilliseconds);
+                }
+            });
+        }
+
+        private async Task WriteObjectAsync(string uid, byte[] block)
+        {
+            await using var writeStream = new MemoryStream(block, writable: false);
+            await _backend.WriteAsync(uid, writeStream).ConfigureAwait(false);
+        }
+
+        private async Task ReadObjectAsync(string uid)
+        {
+            await using Stream readStream = await _backend.ReadAsync(uid).ConfigureAwait(false);
+            await readStream.CopyToAsync(Stream.Null).ConfigureAwait(false);
+        }
+
+        private void EvictFromPageCache(string[] uids)
+        {
+            if (!PageCache.IsEvictionSupported)
+            {
+                return;
+            }
+
+            foreach (string uid in uids)
+            {
+                var (part1, part2, fileName) = StorageKeyHelper.GetSegments(uid);
+                foreach (string path in Directory.EnumerateFiles(Path.Combine(_storagePath, part1, part2), fileName + ".*"))
+                {
+                    // A failed eviction leaves the object cached, so the cell is reported as a page-cache read.
+                    if (!PageCache.TryEvict(path))
+                    {
+                        _evictionFailed = true;
+                    }
+                }
+            }
+        }
+
+        private static string[] CreateUids(int count)
+        {
+            var uids = new string[count];
+            for (int i = 0; i < uids.Length; i++)
+            {
+                uids[i] = Guid.NewGuid().ToString("N");
+            }
+
+            return uids;
+        }
+    }
+}
@@ -0,0 +1,132 @@
+﻿// SPDX-License-Identifier: MIT
+// Copyright (c) 2025–2026 Vadim Belov <https://belov.us>
+
+using Cotton.Benchmark.Infrastructure;
+using Cotton.Benchmark.Models;
+using System.Collections.Concurrent;
+using System.Diagnostics;
+using System.Security.Cryptography;
+
+namespace Cotton.Benchmark.Benchmarks
+{
+    /// <summary>
+    /// One cell of the hashing sweep: chunks of a fixed size hashed with SHA-256, a fixed number of chunks at a time.
+    /// </summary>
+    /// <remarks>
+    /// Every chunk gets its own <see cref="IncrementalHash"/> fed in the same 128 KiB reads as
+    /// <see cref="ChunkUploadProcessingBenchmark"/>, so a cell is the hashing cost of uploading that many chunks in
+    /// parallel. Chunks are distinct slices of one shared buffer of at least the profile's data size, grown to fit
+    /// every chunk of a cell when the chunks outnumber it, so no two workers hash the same bytes and large chunks
+    /// come from memory rather than from a cache-resident copy.
+    /// </remarks>
+    public class HashSweepBenchmark : BenchmarkBase
+    {
+        private const int MaxChunksPerIteration = 4096;
+        private const int UploadReadBufferSize = 128 * 1024;
+
+        // Cells only ever need a prefix of the largest buffer so far, so one buffer replaces a cache per size.
+        private static readonly object DataLock = new();
+        private static byte[] _sharedData = [];
+
+        private readonly int _chunkSizeBytes;
+        private readonly int _concurrency;
+        private readonly int _chunkCount;
+        private readonly int _dataSizeBytes;
+        private readonly ConcurrentQueue<double> _chunkLatenciesUs = new();
+
+        public HashSweepBenchmark(BenchmarkConfiguration configuration, int chunkSizeBytes, int concurrency)
+            : base(configuration)
+        {
+            ArgumentOutOfRangeException.ThrowIfNegativeOrZero(chunkSizeBytes);
+            ArgumentOutOfRangeException.ThrowIfNegativeOrZero(concurrency);
+
+            _chunkSizeBytes = chunkSizeBytes;
+            _concurrency = concurrency;
+            _chunkCount = Math.Clamp(configuration.DataSizeBytes / chunkSizeBytes, concurrency, Math.Max(concurrency, MaxChunksPerIteration));
+            _dataSizeBytes = (int)Math.Max(configuration.DataSizeBytes, (long)_chunkCount * chunkSizeBytes);
+        }
+
+        public override string Name => $"Hash Sweep SHA-256 - {FormatBytes(_chunkSizeBytes)} x {_concurrency}";
+
+        public override string Description =>
+            $"Hashes {_chunkCount} chunks of {FormatBytes(_chunkSizeBytes)} with SHA-256 (IncrementalHash), {_concurrency} at a time";
+
+        protected override Task ExecuteIterationAsync(CancellationToken cancellationToken)
+        {
+            RunOnce(measure: false, cancellationToken);
+            return Task.CompletedTask;
+        }
+
+        protected override Task<PerformanceMetrics> MeasureIterationAsync(CancellationToken cancellationToken)
+        {
+            return Task.FromResult(RunOnce(measure: true, cancellationToken));
+        }
+
+        protected override Dictionary<string, object> AggregateMetrics(List<PerformanceMetrics> metrics)
+        {
+            Dictionary<string, object> baseMetrics = base.AggregateMetrics(metrics);
+            long bytesPerIteration = (long)_chunkCount * _chunkSizeBytes;
+            double[] latenciesUs = _chunkLatenciesUs.Order().ToArray();
+
+            baseMetrics["DataSizeBytes"] = bytesPerIteration;
+            baseMetrics["DataSize"] = FormatBytes(bytesPerIteration);
+            baseMetrics["Algorithm"] = "SHA-256";
+            baseMetrics["ChunkSizeBytes"] = _chunkSizeBytes;
+            baseMetrics["Concurrency"] = _concurrency;
+            baseMetrics["ChunksPerIteration"] = _chunkCount;
+            baseMetrics["ChunksPerSecond"] = metrics.Average(m => _chunkCount / m.Duration.TotalSeconds);
+            baseMetrics["P50ChunkLatencyUs"] = Percentile(latenciesUs, 0.50);
+            baseMetrics["P99ChunkLatencyUs"] = Percentile(latenciesUs, 0.99);
+            return baseMetrics;
+        }
+
+        private PerformanceMetrics RunOnce(bool measure, CancellationToken cancellationToken)
+        {
+            byte[] data = GetSharedData(_dataSizeBytes);
+            var options = new ParallelOptions
+            {
+                MaxDegreeOfParallelism = _concurrency,
+                CancellationToken = cancellationToken
+            };
+
+            long startedAt = Stopwatch.GetTimestamp();
+            Parallel.For(0, _chunkCount, options, i =>
+            {
+                long chunkStartedAt = Stopwatch.GetTimestamp();
+                HashChunk(data.AsSpan(i * _chunkSizeBytes, _chunkSizeBytes));
+                if (measure)
+                {
+                    _chunkLatenciesUs.Enqueue(Stopwatch.GetElapsedTime(chunkStartedAt).TotalMicroseconds);
+                }
+            });
+            TimeSpan elapsed = Stopwatch.GetElapsedTime(startedAt);
+
+            return PerformanceMetrics.Create((long)_chunkCount * _chunkSizeBytes, measure ? elapsed : TimeSpan.Zero);
+        }
+
+        private static byte[] GetSharedData(int minimumSize)
+        {
+            lock (DataLock)
+            {
+                if (_sharedData.Length < minimumSize)
+                {
+                    _sharedData = TestDataGenerator.GenerateMixedData(minimumSize);
+                }
+
+                return _sharedData;
+            }
+        }
+
+        private static void HashChunk(ReadOnlySpan<byte> chunk)
+        {
+            using var hasher = IncrementalHash.CreateHash(HashAlgorithmName.SHA256);
+            for (int offset = 0; offset < chunk.Length; offset += UploadReadBufferSize)
+            {
+                hasher.AppendData(chunk.Slice(offset, Math.Min(UploadReadBufferSize, chunk.Length - offset)));
+            }
+
+            Span<byte> hash = stackalloc byte[SHA256.HashSizeInBytes];
+            hasher.GetHashAndReset(hash);
+        }
+    }
+}
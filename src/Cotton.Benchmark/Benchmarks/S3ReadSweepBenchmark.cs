@@ -0,0 +1,262 @@
+﻿// SPDX-License-Identifier: MIT
+// Copyright (c) 2025–2026 Vadim Belov <https://belov.us>
+
+using Cotton.Benchmark.Infrastructure;
+using Cotton.Benchmark.Models;
+using Cotton.Crypto;
+using Cotton.Storage.Backends;
+using Cotton.Storage.Extensions;
+using Cotton.Storage.Pipelines;
+using Cotton.Storage.Processors;
+using Microsoft.Extensions.Logging.Abstractions;
+using System.Collections.Concurrent;
+using System.Diagnostics;
+using System.Globalization;
+using System.Security.Cryptography;
+using System.Text;
+
+namespace Cotton.Benchmark.Benchmarks
+{
+    /// <summary>
+    /// One cell of the S3 read-path sweep: a file of <c>chunkCount</c> chunks of <c>chunkSizeBytes</c> downloaded
+    /// through <c>S3StorageBackend</c>, the storage pipeline and <c>GetBlobStream</c> with a read-ahead window.
+    /// </summary>
+    /// <remarks>
+    /// Each read is traced per chunk and split along the reader's critical path, so the parts add up to the wall time:
+    /// fetch is the wait for response headers and body that decryption could not hide, decrypt is the wait for
+    /// plaintext beyond what the network explains, decompress is the time inside Zstd, and the rest is the reader.
+    /// Fetch time hidden by read-ahead is reported separately. The last measured read is kept as a per-chunk
+    /// waterfall for the chart tooling.
+    /// </remarks>
+    public class S3ReadSweepBenchmark : BenchmarkBase, IDisposable
+    {
+        private const int ReadBufferSize = 81920;
+
+        // Cells that differ only in chunk layout or read-ahead read the same bytes; one file per size is enough.
+        private static readonly ConcurrentDictionary<int, byte[]> FileCache = new();
+
+        private readonly S3StandInServer _server;
+        private readonly int _chunkCount;
+        private readonly int _chunkSizeBytes;
+        private readonly int _prefetchDepth;
+        private readonly AesGcmStreamCipher _cipher;
+        private readonly ReadPathTrace _trace = new();
+        private readonly TracingStorageBackend _backend;
+        private readonly FileStoragePipeline _pipeline;
+        private readonly List<ReadBreakdown> _breakdowns = [];
+        private string _waterfall = string.Empty;
+
+        internal S3ReadSweepBenchmark(
+            BenchmarkConfiguration configuration,
+            S3StandInServer server,
+            int chunkCount,
+            int chunkSizeBytes,
+            int prefetchDepth)
+            : base(configuration)
+        {
+            ArgumentOutOfRangeException.ThrowIfNegativeOrZero(chunkCount);
+            ArgumentOutOfRangeException.ThrowIfNegativeOrZero(chunkSizeBytes);
+            ArgumentOutOfRangeException.ThrowIfNegative(prefetchDepth);
+
+            _server = server;
+            _chunkCount = chunkCount;
+            _chunkSizeBytes = chunkSizeBytes;
+            _prefetchDepth = prefetchDepth;
+
+            var key = new byte[configuration.EncryptionKeySize];
+            RandomNumberGenerator.Fill(key);
+            _cipher = new AesGcmStreamCipher(key, keyId: 1, threads: configuration.EncryptionThreads);
+
+            _backend = new TracingStorageBackend(new S3StorageBackend(server), _trace);
+            _pipeline = new FileStoragePipeline(
+                NullLogger<FileStoragePipeline>.Instance,
+                new StaticStorageBackendProvider(_backend),
+                [
+                    new CryptoProcessor(_cipher),
+                    new ReadStageProbe(_trace, ReadStage.Decrypt, priority: 5000),
+                    new CompressionProcessor(new FixedCompressionLevelProvider(configuration.CompressionLevel)),
+                    new ReadStageProbe(_trace, ReadStage.Decompress, priority: 20000)
+                ],
+                new StorageWriteAdmissionGate(Environment.ProcessorCount));
+        }
+
+        public override string Name => $"S3 Read Sweep - {_chunkCount} x {FormatBytes(_chunkSizeBytes)}, prefetch {_prefetchDepth}";
+
+        public override string Description =>
+            $"Downloads {_chunkCount} chunks of {FormatBytes(_chunkSizeBytes)} from the S3 stand-in ({NetworkLabel}) with {_prefetchDepth} chunks of read-ahead";
+
+        private string NetworkLabel => _server.BytesPerSecond > 0
+            ? FormattableString.Invariant($"{_server.Latency.TotalMilliseconds:F0} ms, {_server.BytesPerSecond / (1024.0 * 1024.0):F0} MiB/s")
+            : FormattableString.Invariant($"{_server.Latency.TotalMilliseconds:F0} ms, unthrottled");
+
+        protected override async Task ExecuteIterationAsync(CancellationToken cancellationToken)
+        {
+            await ReadOnceAsync(measure: false, cancellationToken).ConfigureAwait(false);
+        }
+
+        protected override Task<PerformanceMetrics> MeasureIterationAsync(CancellationToken cancellationToken)
+        {
+            return ReadOnceAsync(measure: true, cancellationToken);
+        }
+
+        protected override Dictionary<string, object> AggregateMetrics(List<PerformanceMetrics> metrics)
+        {
+            Dictionary<string, object> baseMetrics = base.AggregateMetrics(metrics);
+            long fileBytes = (long)_chunkCount * _chunkSizeBytes;
+            double[] timeToFirstByteMs = _breakdowns.Select(b => b.TimeToFirstByteMs).Order().ToArray();
+
+            baseMetrics["DataSizeBytes"] = fileBytes;
+            baseMetrics["DataSize"] = FormatBytes(fileBytes);
+            baseMetrics["Backend"] = "Cotton.Storage.Backends.S3StorageBackend (loopback stand-in)";
+            baseMetrics["Processors"] = "CryptoProcessor + CompressionProcessor";
+            baseMetrics["ChunkCount"] = _chunkCount;
+            baseMetrics["ChunkSizeBytes"] = _chunkSizeBytes;
+            baseMetrics["PrefetchDepth"] = _prefetchDepth;
+            baseMetrics["LatencyMs"] = _server.Latency.TotalMilliseconds;
+            baseMetrics["BandwidthMiBps"] = _server.BytesPerSecond / (1024.0 * 1024.0);
+            baseMetrics["P50TimeToFirstByteMs"] = Percentile(timeToFirstByteMs, 0.50);
+            baseMetrics["P95TimeToFirstByteMs"] = Percentile(timeToFirstByteMs, 0.95);
+            baseMetrics["AvgFetchMs"] = _breakdowns.Average(b => b.FetchMs);
+            baseMetrics["AvgDecryptMs"] = _breakdowns.Average(b => b.DecryptMs);
+            baseMetrics["AvgDecompressMs"] = _breakdowns.Average(b => b.DecompressMs);
+            baseMetrics["AvgReaderMs"] = _breakdowns.Average(b => b.ReaderMs);
+            baseMetrics["AvgHiddenFetchMs"] = _breakdowns.Average(b => b.HiddenFetchMs);
+            baseMetrics["Waterfall"] = _waterfall;
+            return baseMetrics;
+        }
+
+        public void Dispose()
+        {
+            _cipher.Dispose();
+        }
+
+        private async Task<PerformanceMetrics> ReadOnceAsync(bool measure, CancellationToken cancellationToken)
+        {
+            cancellationToken.ThrowIfCancellationRequested();
+
+            string[] uids = await WriteChunksAsync().ConfigureAwait(false);
+            _trace.Clear();
+
+            byte[] buffer = new byte[ReadBufferSize];
+            long firstByteAt = 0;
+            long startedAt = Stopwatch.GetTimestamp();
+            TimeSpan elapsed;
+            try
+            {
+                await using (Stream stream = _pipeline.GetBlobStream(uids, new PipelineContext(), _prefetchDepth))
+                {
+                    int read;
+                    while ((read = await stream.ReadAsync(buffer, cancellationToken).ConfigureAwait(false)) > 0)
+                    {
+                        if (firstByteAt == 0)
+                        {
+                            firstByteAt = Stopwatch.GetTimestamp();
+                        }
+                    }
+                }
+
+                elapsed = Stopwatch.GetElapsedTime(startedAt);
+            }
+            finally
+            {
+                foreach (string uid in uids)
+                {
+                    await _backend.DeleteAsync(uid).ConfigureAwait(false);
+                }
+            }
+
+            if (measure)
+            {
+                _breakdowns.Add(ReadBreakdown.Create(_trace, uids, startedAt, firstByteAt, elapsed));
+                _waterfall = FormatWaterfall(uids, startedAt);
+            }
+
+            return PerformanceMetrics.Create((long)_chunkCount * _chunkSizeBytes, measure ? elapsed : TimeSpan.Zero);
+        }
+
+        private async Task<string[]> WriteChunksAsync()
+        {
+            byte[] fileData = FileCache.GetOrAdd(_chunkCount * _chunkSizeBytes, TestDataGenerator.GenerateMixedData);
+            var uids = new string[_chunkCount];
+            for (int i = 0; i < uids.Length; i++)
+            {
+                uids[i] = Guid.NewGuid().ToString("N");
+                await using var chunk = new MemoryStream(fileData, i * _chunkSizeBytes, _chunkSizeBytes, writable: false);
+                await _pipeline.WriteAsync(uids[i], chunk, new PipelineContext()).ConfigureAwait(false);
+            }
+
+            return uids;
+        }
+
+        // "requested,responded,fetched,decrypted,decompressed" per chunk in ms since the read started, ';' between chunks.
+        private string FormatWaterfall(string[] uids, long startedAt)
+        {
+            var builder = new StringBuilder();
+            foreach (string uid in uids)
+            {
+                if (!_trace.TryGet(uid, out ChunkReadTiming? timing) || timing is null)
+                {
+                    continue;
+                }
+
+                if (builder.Length > 0)
+                {
+                    builder.Append(';');
+                }
+
+                long[] marks = [timing.RequestedAt, timing.RespondedAt, timing.Fetch.CompletedAt, timing.Decrypt.CompletedAt, timing.Decompress.CompletedAt];
+                builder.AppendJoin(',', marks.Select(mark => mark == 0
+                    ? "nan"
+                    : Stopwatch.GetElapsedTime(startedAt, mark).TotalMilliseconds.ToString("F2", CultureInfo.InvariantCulture)));
+            }
+
+            return builder.ToString();
+        }
+
+        private readonly record struct ReadBreakdown(
+            double TimeToFirstByteMs,
+            double FetchMs,
+            double DecryptMs,
+            double DecompressMs,
+            double ReaderMs,
+            double HiddenFetchMs)
+        {
+            public static ReadBreakdown Create(ReadPathTrace trace, string[] uids, long startedAt, long firstByteAt, TimeSpan elapsed)
+            {
+                double fetch = 0;
+                double decrypt = 0;
+                double decompress = 0;
+                double network = 0;
+                foreach (string uid in uids)
+                {
+                    if (!trace.TryGet(uid, out ChunkReadTiming? timing) || timing is null)
+                    {
+                        continue;
+                    }
+
+                    // Network time of the chunk, waited on by the decryptor; the decompressor waits on the
+                    // decryptor, and the reader on the decompressor. Each wait contains the one below it.
+                    double networkWait = ToMs(timing.RespondedAt - timing.RequestedAt + timing.Fetch.BusyTicks);
+                    double plaintextWait = ToMs(timing.Decrypt.BusyTicks);
+                    double readerWait = ToMs(timing.Decompress.BusyTicks);
+
+                    network += networkWait;
+                    fetch += Math.Min(networkWait, plaintextWait);
+                    decrypt += Math.Max(0, plaintextWait - networkWait);
+                    decompress += Math.Max(0, readerWait - plaintextWait);
+                }
+
+                double total = elapsed.TotalMilliseconds;
+                return new ReadBreakdown(
+                    firstByteAt == 0 ? total : Stopwatch.GetElapsedTime(startedAt, firstByteAt).TotalMilliseconds,
+                    fetch,
+                    decrypt,
+                    decompress,
+                    Math.Max(0, total - fetch - decrypt - decompress),
+                    Math.Max(0, network - fetch));
+            }
+
+            private static double ToMs(long ticks) => ticks * 1000.0 / Stopwatch.Frequency;
+        }
+    }
+}
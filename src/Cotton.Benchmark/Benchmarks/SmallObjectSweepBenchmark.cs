@@ -0,0 +1,221 @@
+﻿// SPDX-License-Identifier: MIT
+// Copyright (c) 2025–2026 Vadim Belov <https://belov.us>
+
+using Cotton.Benchmark.Infrastructure;
+using Cotton.Benchmark.Models;
+using Cotton.Crypto;
+using Cotton.Storage.Pipelines;
+using Cotton.Storage.Processors;
+using Microsoft.Extensions.Logging.Abstractions;
+using System.Diagnostics;
+using System.Security.Cryptography;
+
+namespace Cotton.Benchmark.Benchmarks
+{
+    public enum SmallObjectStage
+    {
+        Encrypt,
+        Decrypt,
+        PipelineWrite,
+        PipelineRead
+    }
+
+    /// <summary>
+    /// One cell of the small-object sweep: many objects of one size pushed one at a time through a single stage.
+    /// </summary>
+    /// <remarks>
+    /// Objects are processed sequentially so each latency is the cost of one object, not of a queue. Encrypt and
+    /// Decrypt go through <c>CryptoProcessor</c> only; PipelineWrite hashes the object with SHA-256 as the upload
+    /// path does and writes it through the crypto and compression pipeline, and PipelineRead reads it back.
+    /// The chart tooling fits latency = fixed + size / bandwidth across object sizes per stage.
+    /// </remarks>
+    public class SmallObjectSweepBenchmark : BenchmarkBase, IDisposable
+    {
+        private const int MinObjectsPerIteration = 64;
+        private const int MaxObjectsPerIteration = 2048;
+
+        private readonly SmallObjectStage _stage;
+        private readonly int _objectSizeBytes;
+        private readonly int _objectCount;
+        private readonly byte[] _object;
+        private readonly byte[] _encryptedObject;
+        private readonly AesGcmStreamCipher _cipher;
+        private readonly CryptoProcessor _cryptoProcessor;
+        private readonly InMemoryStorageBackend _backend;
+        private readonly FileStoragePipeline _pipeline;
+        private readonly List<double> _objectLatenciesUs = [];
+        private long _outputBytes;
+        private long _outputObjects;
+
+        public SmallObjectSweepBenchmark(BenchmarkConfiguration configuration, SmallObjectStage stage, int objectSizeBytes)
+            : base(configuration)
+        {
+            ArgumentOutOfRangeException.ThrowIfNegativeOrZero(objectSizeBytes);
+
+            _stage = stage;
+            _objectSizeBytes = objectSizeBytes;
+            _objectCount = Math.Clamp(configuration.DataSizeBytes / objectSizeBytes, MinObjectsPerIteration, MaxObjectsPerIteration);
+            _object = TestDataGenerator.GenerateMixedData(objectSizeBytes);
+
+            var key = new byte[configuration.EncryptionKeySize];
+            RandomNumberGenerator.Fill(key);
+            _cipher = new AesGcmStreamCipher(key, keyId: 1, threads: configuration.EncryptionThreads);
+            _cryptoProcessor = new CryptoProcessor(_cipher);
+
+            _backend = new InMemoryStorageBackend();
+            _pipeline = new FileStoragePipeline(
+                NullLogger<FileStoragePipeline>.Instance,
+                new StaticStorageBackendProvider(_backend),
+                [_cryptoProcessor, new CompressionProcessor(new FixedCompressionLevelProvider(configuration.CompressionLevel))],
+                new StorageWriteAdmissionGate(Environment.ProcessorCount));
+
+            using var plain = new MemoryStream(_object, writable: false);
+            using Stream encrypted = _cryptoProcessor.WriteAsync("small-object", plain).GetAwaiter().GetResult();
+            using var encryptedCopy = new MemoryStream();
+            encrypted.CopyTo(encryptedCopy);
+            _encryptedObject = encryptedCopy.ToArray();
+        }
+
+        public override string Name => $"Small Object Sweep {_stage} - {FormatBytes(_objectSizeBytes)}";
+
+        public override string Description =>
+            $"Processes {_objectCount} objects of {FormatBytes(_objectSizeBytes)} one at a time through {StageLabel}";
+
+        private string StageLabel => _stage switch
+        {
+            SmallObjectStage.Encrypt => "CryptoProcessor encryption",
+            SmallObjectStage.Decrypt => "CryptoProcessor decryption",
+            SmallObjectStage.PipelineWrite => "SHA-256 + the storage pipeline write (compression + encryption)",
+            SmallObjectStage.PipelineRead => "the storage pipeline read (decryption + decompression)",
+            _ => throw new ArgumentOutOfRangeException(nameof(_stage), _stage, "Unsupported stage.")
+        };
+
+        protected override async Task ExecuteIterationAsync(CancellationToken cancellationToken)
+        {
+            await RunOnceAsync(measure: false, cancellationToken).ConfigureAwait(false);
+        }
+
+        protected override Task<PerformanceMetrics> MeasureIterationAsync(CancellationToken cancellationToken)
+        {
+            return RunOnceAsync(measure: true, cancellationToken);
+        }
+
+        protected override Dictionary<string, object> AggregateMetrics(List<PerformanceMetrics> metrics)
+        {
+            Dictionary<string, object> baseMetrics = base.AggregateMetrics(metrics);
+            long bytesPerIteration = (long)_objectCount * _objectSizeBytes;
+            double[] latenciesUs = _objectLatenciesUs.Order().ToArray();
+
+            baseMetrics["DataSizeBytes"] = bytesPerIteration;
+            baseMetrics["DataSize"] = FormatBytes(bytesPerIteration);
+            baseMetrics["Stage"] = _stage.ToString();
+            baseMetrics["Path"] = StageLabel;
+            baseMetrics["ObjectSizeBytes"] = _objectSizeBytes;
+            baseMetrics["ObjectsPerIteration"] = _objectCount;
+            baseMetrics["ObjectsPerSecond"] = metrics.Average(m => _objectCount / m.Duration.TotalSeconds);
+            baseMetrics["AvgObjectLatencyUs"] = latenciesUs.Average();
+            baseMetrics["P50ObjectLatencyUs"] = Percentile(latenciesUs, 0.50);
+            baseMetrics["P99ObjectLatencyUs"] = Percentile(latenciesUs, 0.99);
+            if (_outputObjects > 0)
+            {
+                // Stored or produced bytes per object, so header and tag overhead shows up next to the latency.
+                baseMetrics["AvgOutputBytesPerObject"] = _outputBytes / (double)_outputObjects;
+            }
+
+            return baseMetrics;
+        }
+
+        public void Dispose()
+        {
+            _cipher.Dispose();
+        }
+
+        private async Task<PerformanceMetrics> RunOnceAsync(bool measure, CancellationToken cancellationToken)
+        {
+            cancellationToken.ThrowIfCancellationRequested();
+
+            string[] uids = [.. Enumerable.Range(0, _objectCount).Select(_ => Guid.NewGuid().ToString("N"))];
+            if (_stage == SmallObjectStage.PipelineRead)
+            {
+                foreach (string uid in uids)
+                {
+                    await WriteThroughPipelineAsync(uid).ConfigureAwait(false);
+                }
+            }
+
+            long startedAt = Stopwatch.GetTimestamp();
+            try
+            {
+                foreach (string uid in uids)
+                {
+                    long objectStartedAt = Stopwatch.GetTimestamp();
+                    long outputBytes = await ProcessObjectAsync(uid, cancellationToken).ConfigureAwait(false);
+                    if (measure)
+                    {
+                        _objectLatenciesUs.Add(Stopwatch.GetElapsedTime(objectStartedAt).TotalMicroseconds);
+                        _outputBytes += outputBytes;
+                        _outputObjects++;
+                    }
+                }
+            }
+            finally
+            {
+                foreach (string uid in uids)
+                {
+                    await _backend.DeleteAsync(uid).ConfigureAwait(false);
+                }
+            }
+
+            TimeSpan elapsed = Stopwatch.GetElapsedTime(startedAt);
+            return PerformanceMetrics.Create((long)_objectCount * _objectSizeBytes, measure ? elapsed : TimeSpan.Zero);
+        }
+
+        private async Task<long> ProcessObjectAsync(string uid, CancellationToken cancellationToken)
+        {
+            switch (_stage)
+            {
+                case SmallObjectStage.Encrypt:
+                    {
+                        await using var input = new MemoryStream(_object, writable: false);
+                        await using Stream encrypted = await _cryptoProcessor.WriteAsync(uid, input).ConfigureAwait(false);
+                        await using var output = new MemoryStream();
+                        await encrypted.CopyToAsync(output, cancellationToken).ConfigureAwait(false);
+                        return output.Length;
+                    }
+                case SmallObjectStage.Decrypt:
+                    {
+                        await using var input = new MemoryStream(_encryptedObject, writable: false);
+                        await using Stream decrypted = await _cryptoProcessor.ReadAsync(uid, input).ConfigureAwait(false);
+                        await using var output = new MemoryStream(capacity: _objectSizeBytes);
+                        await decrypted.CopyToAsync(output, cancellationToken).ConfigureAwait(false);
+                        return output.Length;
+                    }
+                case SmallObjectStage.PipelineWrite:
+                    await WriteThroughPipelineAsync(uid).ConfigureAwait(false);
+                    return await _backend.GetSizeAsync(uid).ConfigureAwait(false);
+                case SmallObjectStage.PipelineRead:
+                    {
+                        await using Stream stream = await _pipeline.ReadAsync(uid, new PipelineContext()).ConfigureAwait(false);
+                        await using var output = new MemoryStream(capacity: _objectSizeBytes);
+                        await stream.CopyToAsync(output, cancellationToken).ConfigureAwait(false);
+                        return output.Length;
+                    }
+                default:
+                    throw new ArgumentOutOfRangeException(nameof(_stage), _stage, "Unsupported stage.");
+            }
+        }
+
+        // Same per-object work as the upload path: a fresh SHA-256 over the object, then the pipeline write.
+        private async Task WriteThroughPipelineAsync(string uid)
+        {
+            using (var hasher = IncrementalHash.CreateHash(HashAlgorithmName.SHA256))
+            {
+                hasher.AppendData(_object);
+                _ = hasher.GetHashAndReset();
+            }
+
+            await using var input = new MemoryStream(_object, writable: false);
+            await _pipeline.WriteAsync(uid, input, new PipelineContext()).ConfigureAwait(false);
+        }
+    }
+}
@@ -17,6 +17,9 @@ namespace Cotton.Benchmark.Infrastructure
             string baselineDirectory = BenchmarkPathDefaults.BaselineDirectory;
             string resultsDirectory = BenchmarkPathDefaults.ResultsDirectory;
             int? compressionLevel = null;
+            string? storageDirectory = null;
+            int s3LatencyMs = 20;
+            int s3BandwidthMiBps = 100;
             var scenarioFilters = new List<string>();
 
             for (int i = 0; i < args.Length; i++)
@@ -58,6 +61,15 @@ namespace Cotton.Benchmark.Infrastructure
                     case "--compression-level":
                         compressionLevel = ParseIntValue(ReadValue(args, ref i, arg), arg);
                         break;
+                    case "--storage-dir":
+                        storageDirectory = ReadValue(args, ref i, arg);
+                        break;
+                    case "--s3-latency-ms":
+                        s3LatencyMs = ParseNonNegativeIntValue(ReadValue(args, ref i, arg), arg);
+                        break;
+                    case "--s3-bandwidth-mibps":
+                        s3BandwidthMiBps = ParseNonNegativeIntValue(ReadValue(args, ref i, arg), arg);
+                        break;
                     default:
                         throw new ArgumentException($"Unknown benchmark option: {arg}");
                 }
@@ -69,20 +81,25 @@ namespace Cotton.Benchmark.Infrastructure
                 Profile = profile,
                 ListBenchmarks = list,
                 CompareBaseline = compare,
-                UpdateBaseline = update ?? ShouldUpdateBaselineByDefault(list, compare, scenarioFilters),
+                UpdateBaseline = update ?? ShouldUpdateBaselineByDefault(mode, list, compare, scenarioFilters),
                 BaselineDirectory = baselineDirectory,
                 ResultsDirectory = resultsDirectory,
                 CompressionLevel = compressionLevel,
+                StorageDirectory = storageDirectory,
+                S3LatencyMs = s3LatencyMs,
+                S3BandwidthMiBps = s3BandwidthMiBps,
                 ScenarioFilters = scenarioFilters
             };
         }
 
         private static bool ShouldUpdateBaselineByDefault(
+            BenchmarkMode mode,
             bool list,
             bool compare,
             IReadOnlyCollection<string> scenarioFilters)
         {
-            return !list
+            return mode == BenchmarkMode.StoragePaths
+                && !list
                 && !compare
                 && scenarioFilters.Count == 0;
         }
@@ -97,6 +114,17 @@ namespace Cotton.Benchmark.Infrastructure
             throw new ArgumentException($"Invalid {optionName} value '{value}'. Expected an integer.");
         }
 
+        private static int ParseNonNegativeIntValue(string value, string optionName)
+        {
+            int parsed = ParseIntValue(value, optionName);
+            if (parsed < 0)
+            {
+                throw new ArgumentException($"Invalid {optionName} value '{value}'. Expected a non-negative integer.");
+            }
+
+            return parsed;
+        }
+
         private static TEnum ParseEnumValue<TEnum>(string value, string optionName)
             where TEnum : struct, Enum
         {
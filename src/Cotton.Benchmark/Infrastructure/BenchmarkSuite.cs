@@ -0,0 +1,32 @@
+﻿// SPDX-License-Identifier: MIT
+// Copyright (c) 2025–2026 Vadim Belov <https://belov.us>
+
+using Cotton.Benchmark.Abstractions;
+
+namespace Cotton.Benchmark.Infrastructure
+{
+    /// <summary>
+    /// The benchmarks selected for a run plus everything created to build them, disposed together after the run.
+    /// </summary>
+    /// <remarks>
+    /// Benchmarks removed by scenario filters are still owned by the suite, and so are shared resources such as the
+    /// S3 stand-in, which benchmarks only borrow.
+    /// </remarks>
+    internal sealed class BenchmarkSuite(List<IBenchmark> benchmarks, IReadOnlyList<IBenchmark> created, IReadOnlyList<IDisposable> resources) : IDisposable
+    {
+        public List<IBenchmark> Benchmarks => benchmarks;
+
+        public void Dispose()
+        {
+            foreach (IDisposable benchmark in created.OfType<IDisposable>())
+            {
+                benchmark.Dispose();
+            }
+
+            foreach (IDisposable resource in resources)
+            {
+                resource.Dispose();
+            }
+        }
+    }
+}
@@ -9,15 +9,66 @@ namespace Cotton.Benchmark.Infrastructure
 {
     internal static class BenchmarkSuiteFactory
     {
-        public static List<IBenchmark> Create(BenchmarkConfiguration configuration, BenchmarkOptions options)
+        private static readonly int[] FilesystemSweepBlockSizes =
+        [
+            4 * 1024,
+            64 * 1024,
+            256 * 1024,
+            1024 * 1024,
+            4 * 1024 * 1024,
+            16 * 1024 * 1024
+        ];
+
+        private static readonly int[] FilesystemSweepConcurrency = [1, 2, 4, 8, 16, 32];
+
+        private static readonly int[] S3ReadSweepChunkSizes =
+        [
+            256 * 1024,
+            1024 * 1024,
+            4 * 1024 * 1024,
+            16 * 1024 * 1024
+        ];
+
+        private static readonly int[] S3ReadSweepChunkCounts = [1, 4, 16, 64];
+
+        private static readonly int[] S3ReadSweepPrefetchDepths = [0, 1, 2, 4, 8];
+
+        private static readonly int[] SmallObjectSweepSizes =
+        [
+            256,
+            1024,
+            4 * 1024,
+            16 * 1024,
+            64 * 1024,
+            256 * 1024
+        ];
+
+        private static readonly int[] HashSweepChunkSizes =
+        [
+            16 * 1024,
+            64 * 1024,
+            256 * 1024,
+            1024 * 1024,
+            4 * 1024 * 1024,
+            16 * 1024 * 1024
+        ];
+
+        private static readonly int[] HashSweepConcurrency = [1, 2, 4, 8, 16, 32];
+
+        public static BenchmarkSuite Create(BenchmarkConfiguration configuration, BenchmarkOptions options)
         {
-            if (options.Mode != BenchmarkMode.StoragePaths)
+            var resources = new List<IDisposable>();
+            List<IBenchmark> benchmarks = options.Mode switch
             {
-                throw new ArgumentOutOfRangeException(nameof(options), options.Mode, "Unsupported benchmark mode.");
-            }
+                BenchmarkMode.StoragePaths => CreateStoragePathBenchmarks(configuration),
+                BenchmarkMode.FilesystemSweep => CreateFilesystemSweepBenchmarks(configuration, options.StorageDirectory),
+                BenchmarkMode.S3ReadSweep => CreateS3ReadSweepBenchmarks(configuration, options, resources),
+                BenchmarkMode.SmallObjectSweep => CreateSmallObjectSweepBenchmarks(configuration),
+                BenchmarkMode.HashSweep => CreateHashSweepBenchmarks(configuration),
+                _ => throw new ArgumentOutOfRangeException(nameof(options), options.Mode, "Unsupported benchmark mode.")
+            };
 
-            List<IBenchmark> benchmarks = CreateStoragePathBenchmarks(configuration);
-            return ApplyScenarioFilters(benchmarks, options.ScenarioFilters);
+            return new BenchmarkSuite(ApplyScenarioFilters(benchmarks, options.ScenarioFilters), benchmarks, resources);
         }
 
         private static List<IBenchmark> CreateStoragePathBenchmarks(BenchmarkConfiguration configuration)
@@ -36,6 +87,78 @@ namespace Cotton.Benchmark.Infrastructure
             ];
         }
 
+        private static List<IBenchmark> CreateFilesystemSweepBenchmarks(BenchmarkConfiguration configuration, string? storageDirectory)
+        {
+            var benchmarks = new List<IBenchmark>();
+            foreach (int blockSize in FilesystemSweepBlockSizes)
+            {
+                foreach (int concurrency in FilesystemSweepConcurrency)
+                {
+                    benchmarks.Add(new FileSystemSweepBenchmark(configuration, FileSystemSweepOperation.Write, blockSize, concurrency, durable: false, storageDirectory));
+                    benchmarks.Add(new FileSystemSweepBenchmark(configuration, FileSystemSweepOperation.Write, blockSize, concurrency, durable: true, storageDirectory));
+                    benchmarks.Add(new FileSystemSweepBenchmark(configuration, FileSystemSweepOperation.Read, blockSize, concurrency, durable: false, storageDirectory));
+                }
+            }
+
+            return benchmarks;
+        }
+
+        // Files larger than the profile's data size are skipped, and so is read-ahead deeper than the file.
+        // The stand-in server is shared by every cell and owned by the suite, which disposes it after the run.
+        private static List<IBenchmark> CreateS3ReadSweepBenchmarks(BenchmarkConfiguration configuration, BenchmarkOptions options, List<IDisposable> resources)
+        {
+            var server = new S3StandInServer(
+                TimeSpan.FromMilliseconds(options.S3LatencyMs),
+                options.S3BandwidthMiBps * 1024L * 1024L);
+            resources.Add(server);
+            var benchmarks = new List<IBenchmark>();
+            foreach (int chunkSize in S3ReadSweepChunkSizes)
+            {
+                foreach (int chunkCount in S3ReadSweepChunkCounts)
+                {
+                    if ((long)chunkSize * chunkCount > configuration.DataSizeBytes)
+                    {
+                        continue;
+                    }
+
+                    foreach (int prefetchDepth in S3ReadSweepPrefetchDepths.Where(depth => depth < chunkCount || depth == 0))
+                    {
+                        benchmarks.Add(new S3ReadSweepBenchmark(configuration, server, chunkCount, chunkSize, prefetchDepth));
+                    }
+                }
+            }
+
+            return benchmarks;
+        }
+
+        private static List<IBenchmark> CreateSmallObjectSweepBenchmarks(BenchmarkConfiguration configuration)
+        {
+            var benchmarks = new List<IBenchmark>();
+            foreach (SmallObjectStage stage in Enum.GetValues<SmallObjectStage>())
+            {
+                foreach (int objectSize in SmallObjectSweepSizes)
+                {
+                    benchmarks.Add(new SmallObjectSweepBenchmark(configuration, stage, objectSize));
+                }
+            }
+
+            return benchmarks;
+        }
+
+        private static List<IBenchmark> CreateHashSweepBenchmarks(BenchmarkConfiguration configuration)
+        {
+            var benchmarks = new List<IBenchmark>();
+            foreach (int chunkSize in HashSweepChunkSizes)
+            {
+                foreach (int concurrency in HashSweepConcurrency)
+                {
+                    benchmarks.Add(new HashSweepBenchmark(configuration, chunkSize, concurrency));
+                }
+            }
+
+            return benchmarks;
+        }
+
         private static List<IBenchmark> ApplyScenarioFilters(IEnumerable<IBenchmark> benchmarks, IReadOnlyList<string> filters)
         {
             var benchmarkList = benchmarks.ToList();
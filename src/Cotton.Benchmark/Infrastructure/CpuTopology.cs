@@ -0,0 +1,104 @@
+﻿// SPDX-License-Identifier: MIT
+// Copyright (c) 2025–2026 Vadim Belov <https://belov.us>
+
+namespace Cotton.Benchmark.Infrastructure
+{
+    /// <summary>
+    /// Physical/logical core layout of the host, read from Linux sysfs.
+    /// On Intel hybrid parts the P-core/E-core split comes from the cpu_core/cpu_atom PMU device lists.
+    /// Also compiled into Cotton.Crypto.Tests (linked file) for the sweep headers.
+    /// </summary>
+    public sealed class CpuTopology
+    {
+        private const string PerformanceCpuList = "/sys/devices/cpu_core/cpus";
+        private const string EfficiencyCpuList = "/sys/devices/cpu_atom/cpus";
+
+        public int LogicalProcessors { get; init; }
+
+        public int PhysicalCores { get; init; }
+
+        public int ThreadsPerCore { get; init; }
+
+        public int PerformanceCores { get; init; }
+
+        public int EfficiencyCores { get; init; }
+
+        public bool IsHybrid => PerformanceCores > 0 && EfficiencyCores > 0;
+
+        public string Describe()
+        {
+            string description = $"{PhysicalCores} physical / {LogicalProcessors} logical, {ThreadsPerCore} thread(s) per core";
+            return IsHybrid
+                ? $"{description}, {PerformanceCores} P-cores + {EfficiencyCores} E-cores"
+                : description;
+        }
+
+        public void AddProperties(IDictionary<string, string> properties)
+        {
+            properties["physicalCores"] = PhysicalCores.ToString();
+            properties["threadsPerCore"] = ThreadsPerCore.ToString();
+            if (IsHybrid)
+            {
+                properties["performanceCores"] = PerformanceCores.ToString();
+                properties["efficiencyCores"] = EfficiencyCores.ToString();
+            }
+        }
+
+        public static CpuTopology? TryReadLinux()
+        {
+            if (!OperatingSystem.IsLinux())
+            {
+                return null;
+            }
+
+            string? online = SysFs.TryRead(Path.Combine(SysFs.CpuRoot, "online"));
+            if (online is null)
+            {
+                return null;
+            }
+
+            var coreByCpu = new Dictionary<int, string>();
+            foreach (int cpu in SysFs.ParseCpuList(online))
+            {
+                string topologyPath = Path.Combine(SysFs.CpuRoot, $"cpu{cpu}", "topology");
+                string? coreId = SysFs.TryRead(Path.Combine(topologyPath, "core_id"));
+                if (coreId is null)
+                {
+                    return null;
+                }
+
+                string package = SysFs.TryRead(Path.Combine(topologyPath, "physical_package_id")) ?? "0";
+                coreByCpu[cpu] = $"{package}:{coreId}";
+            }
+
+            if (coreByCpu.Count == 0)
+            {
+                return null;
+            }
+
+            return new CpuTopology
+            {
+                LogicalProcessors = coreByCpu.Count,
+                PhysicalCores = coreByCpu.Values.Distinct().Count(),
+                ThreadsPerCore = coreByCpu.Values.GroupBy(core => core).Max(group => group.Count()),
+                PerformanceCores = CountCores(coreByCpu, PerformanceCpuList),
+                EfficiencyCores = CountCores(coreByCpu, EfficiencyCpuList)
+            };
+        }
+
+        private static int CountCores(Dictionary<int, string> coreByCpu, string cpuListPath)
+        {
+            string? cpuList = SysFs.TryRead(cpuListPath);
+            if (cpuList is null)
+            {
+                return 0;
+            }
+
+            return SysFs.ParseCpuList(cpuList)
+                .Where(coreByCpu.ContainsKey)
+                .Select(cpu => coreByCpu[cpu])
+                .Distinct()
+                .Count();
+        }
+    }
+}
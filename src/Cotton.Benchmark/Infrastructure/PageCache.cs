@@ -0,0 +1,41 @@
+﻿// SPDX-License-Identifier: MIT
+// Copyright (c) 2025–2026 Vadim Belov <https://belov.us>
+
+using Microsoft.Win32.SafeHandles;
+using System.Runtime.InteropServices;
+
+namespace Cotton.Benchmark.Infrastructure
+{
+    /// <summary>
+    /// Drops a file's pages from the Linux page cache so the next read is served by the device.
+    /// </summary>
+    public static class PageCache
+    {
+        private const int POSIX_FADV_DONTNEED = 4;
+
+        [DllImport("libc", SetLastError = true)]
+        private static extern int fsync(int fd);
+
+        // off_t is pointer-sized in the default (non-LFS) glibc ABI, so nint matches it on 32-bit ARM/x86 as well.
+        [DllImport("libc")]
+        private static extern int posix_fadvise(int fd, nint offset, nint len, int advice);
+
+        public static bool IsEvictionSupported => OperatingSystem.IsLinux();
+
+        /// <summary>
+        /// Writes back dirty pages (DONTNEED only drops clean ones) and evicts the file from the page cache.
+        /// </summary>
+        /// <returns><see langword="true"/> only when both calls returned 0.</returns>
+        public static bool TryEvict(string path)
+        {
+            if (!IsEvictionSupported)
+            {
+                return false;
+            }
+
+            using SafeFileHandle handle = File.OpenHandle(path, FileMode.Open, FileAccess.Read);
+            int fd = (int)handle.DangerousGetHandle();
+            return fsync(fd) == 0 && posix_fadvise(fd, 0, 0, POSIX_FADV_DONTNEED) == 0;
+        }
+    }
+}
@@ -0,0 +1,54 @@
+﻿// SPDX-License-Identifier: MIT
+// Copyright (c) 2025–2026 Vadim Belov <https://belov.us>
+
+using System.Collections.Concurrent;
+
+namespace Cotton.Benchmark.Infrastructure
+{
+    /// <summary>
+    /// Stopwatch timestamps and blocked time of one stream in the read path (fetch, decrypt or decompress output).
+    /// </summary>
+    internal class StageTiming
+    {
+        public long FirstByteAt { get; set; }
+
+        public long CompletedAt { get; set; }
+
+        /// <summary>
+        /// Stopwatch ticks the reader of this stream spent inside its reads, i.e. waiting for this stage.
+        /// </summary>
+        public long BusyTicks { get; set; }
+
+        public long Bytes { get; set; }
+    }
+
+    /// <summary>
+    /// Timeline of one chunk: the backend request and the three streams layered on top of its response.
+    /// </summary>
+    internal class ChunkReadTiming
+    {
+        public long RequestedAt { get; set; }
+
+        public long RespondedAt { get; set; }
+
+        public StageTiming Fetch { get; } = new();
+
+        public StageTiming Decrypt { get; } = new();
+
+        public StageTiming Decompress { get; } = new();
+    }
+
+    /// <summary>
+    /// Collects <see cref="ChunkReadTiming"/> per chunk UID for one read of a file.
+    /// </summary>
+    internal class ReadPathTrace
+    {
+        private readonly ConcurrentDictionary<string, ChunkReadTiming> _chunks = new(StringComparer.Ordinal);
+
+        public ChunkReadTiming For(string uid) => _chunks.GetOrAdd(uid, _ => new ChunkReadTiming());
+
+        public bool TryGet(string uid, out ChunkReadTiming? timing) => _chunks.TryGetValue(uid, out timing);
+
+        public void Clear() => _chunks.Clear();
+    }
+}
@@ -0,0 +1,35 @@
+﻿// SPDX-License-Identifier: MIT
+// Copyright (c) 2025–2026 Vadim Belov <https://belov.us>
+
+using Cotton.Storage.Abstractions;
+using Cotton.Storage.Pipelines;
+
+namespace Cotton.Benchmark.Infrastructure
+{
+    internal enum ReadStage
+    {
+        Decrypt,
+        Decompress
+    }
+
+    /// <summary>
+    /// Pass-through processor placed right after a real processor on the read path so the stream that processor
+    /// produced is timed. Priorities decide the position: read applies processors in ascending order.
+    /// </summary>
+    internal class ReadStageProbe(ReadPathTrace trace, ReadStage stage, int priority) : IStorageProcessor
+    {
+        public int Priority => priority;
+
+        public Task<Stream> ReadAsync(string uid, Stream stream, PipelineContext? context = null)
+        {
+            ChunkReadTiming timing = trace.For(uid);
+            StageTiming stageTiming = stage == ReadStage.Decrypt ? timing.Decrypt : timing.Decompress;
+            return Task.FromResult<Stream>(new TimedReadStream(stream, stageTiming));
+        }
+
+        public Task<Stream> WriteAsync(string uid, Stream stream, PipelineContext? context = null)
+        {
+            return Task.FromResult(stream);
+        }
+    }
+}
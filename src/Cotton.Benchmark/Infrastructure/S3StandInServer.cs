@@ -0,0 +1,261 @@
+﻿// SPDX-License-Identifier: MIT
+// Copyright (c) 2025–2026 Vadim Belov <https://belov.us>
+
+using Amazon.S3;
+using Cotton.Storage.Abstractions;
+using Cotton.Storage.Helpers;
+using System.Collections.Concurrent;
+using System.Diagnostics;
+using System.Globalization;
+using System.Net;
+using System.Net.Sockets;
+using System.Security.Cryptography;
+using System.Text;
+
+namespace Cotton.Benchmark.Infrastructure
+{
+    /// <summary>
+    /// In-process S3-compatible endpoint on loopback, so <c>S3StorageBackend</c> runs through the real AWS SDK
+    /// and HTTP stack without an external object store.
+    /// </summary>
+    /// <remarks>
+    /// Only the calls the backend makes are served (path-style PUT, GET with a byte range, HEAD, DELETE).
+    /// Every GET waits <c>latency</c> before the response headers and then streams the body through one link
+    /// of <c>bytesPerSecond</c> shared by all concurrent responses, the way a download from a remote bucket
+    /// is bounded by round trip and bandwidth. Writes that prepare a benchmark are not slowed down.
+    /// </remarks>
+    internal sealed class S3StandInServer(TimeSpan latency, long bytesPerSecond) : IS3Provider, IDisposable
+    {
+        private const string BucketName = "cotton-benchmark";
+        private const int SliceSize = 64 * 1024;
+
+        private readonly ConcurrentDictionary<string, byte[]> _objects = new(StringComparer.Ordinal);
+        private readonly Lock _startLock = new();
+        private readonly Lock _linkLock = new();
+        private readonly CancellationTokenSource _stopping = new();
+        private HttpListener? _listener;
+        private AmazonS3Client? _client;
+        private long _linkFreeAt;
+
+        public TimeSpan Latency => latency;
+
+        public long BytesPerSecond => bytesPerSecond;
+
+        public string GetBucketName() => BucketName;
+
+        public IAmazonS3 GetS3Client()
+        {
+            lock (_startLock)
+            {
+                if (_client is not null)
+                {
+                    return _client;
+                }
+
+                int port = GetFreeLoopbackPort();
+                _listener = new HttpListener();
+                _listener.Prefixes.Add($"http://127.0.0.1:{port}/");
+                _listener.Start();
+                _ = Task.Run(AcceptLoopAsync);
+
+                string endpoint = $"http://127.0.0.1:{port}";
+                _client = S3CompatibilityFactory.BuildClient(endpoint, "us-east-1", "cotton", "cotton", maxErrorRetry: 0);
+                return _client;
+            }
+        }
+
+        public void Dispose()
+        {
+            _stopping.Cancel();
+            _listener?.Close();
+            _client?.Dispose();
+        }
+
+        private static int GetFreeLoopbackPort()
+        {
+            var probe = new TcpListener(IPAddress.Loopback, 0);
+            probe.Start();
+            int port = ((IPEndPoint)probe.LocalEndpoint).Port;
+            probe.Stop();
+            return port;
+        }
+
+        private async Task AcceptLoopAsync()
+        {
+            while (!_stopping.IsCancellationRequested)
+            {
+                HttpListenerContext context;
+                try
+                {
+                    context = await _listener!.GetContextAsync().ConfigureAwait(false);
+                }
+                catch (Exception) when (_stopping.IsCancellationRequested)
+                {
+                    return;
+                }
+
+                _ = Task.Run(() => HandleAsync(context));
+            }
+        }
+
+        private async Task HandleAsync(HttpListenerContext context)
+        {
+            HttpListenerRequest request = context.Request;
+            HttpListenerResponse response = context.Response;
+            try
+            {
+                string key = GetObjectKey(request.Url!);
+                switch (request.HttpMethod)
+                {
+                    case "PUT":
+                        await PutAsync(key, request, response).ConfigureAwait(false);
+                        break;
+                    case "GET":
+                        await GetAsync(key, request, response).ConfigureAwait(false);
+                        break;
+                    case "HEAD":
+                        Head(key, response);
+                        break;
+                    case "DELETE":
+                        _objects.TryRemove(key, out _);
+                        response.StatusCode = (int)HttpStatusCode.NoContent;
+                        break;
+                    default:
+                        await WriteErrorAsync(response, HttpStatusCode.NotImplemented, "NotImplemented", key).ConfigureAwait(false);
+                        break;
+                }
+            }
+            catch (Exception) when (_stopping.IsCancellationRequested)
+            {
+                // The benchmark is shutting down; the client side is gone.
+            }
+            catch (Exception ex) when (ex is HttpListenerException or IOException)
+            {
+                // The client closed the connection mid-response (e.g. an abandoned read-ahead chunk).
+            }
+            finally
+            {
+                try
+                {
+                    response.Close();
+                }
+                catch (Exception)
+                {
+                    // Closing a connection the client already dropped.
+                }
+            }
+        }
+
+        private static string GetObjectKey(Uri url)
+        {
+            string path = Uri.UnescapeDataString(url.AbsolutePath).TrimStart('/');
+            return path.StartsWith(BucketName + "/", StringComparison.Ordinal) ? path[(BucketName.Length + 1)..] : path;
+        }
+
+        private async Task PutAsync(string key, HttpListenerRequest request, HttpListenerResponse response)
+        {
+            using var body = new MemoryStream(request.ContentLength64 > 0 ? (int)request.ContentLength64 : 0);
+            await request.InputStream.CopyToAsync(body).ConfigureAwait(false);
+            byte[] data = body.ToArray();
+            _objects[key] = data;
+            response.StatusCode = (int)HttpStatusCode.OK;
+            response.AddHeader("ETag", GetETag(data));
+        }
+
+        private void Head(string key, HttpListenerResponse response)
+        {
+            if (!_objects.TryGetValue(key, out byte[]? data))
+            {
+                response.StatusCode = (int)HttpStatusCode.NotFound;
+                return;
+            }
+
+            response.StatusCode = (int)HttpStatusCode.OK;
+            response.ContentLength64 = data.LongLength;
+            response.AddHeader("ETag", GetETag(data));
+            response.AddHeader("Last-Modified", DateTime.UtcNow.ToString("R", CultureInfo.InvariantCulture));
+        }
+
+        private async Task GetAsync(string key, HttpListenerRequest request, HttpListenerResponse response)
+        {
+            await Task.Delay(latency, _stopping.Token).ConfigureAwait(false);
+
+            if (!_objects.TryGetValue(key, out byte[]? data))
+            {
+                await WriteErrorAsync(response, HttpStatusCode.NotFound, "NoSuchKey", key).ConfigureAwait(false);
+                return;
+            }
+
+            // The backend always asks for "bytes=0-"; like S3, an empty object cannot satisfy that range.
+            bool ranged = request.Headers["Range"] is not null;
+            if (ranged && data.Length == 0)
+            {
+                await WriteErrorAsync(response, HttpStatusCode.RequestedRangeNotSatisfiable, "InvalidRange", key).ConfigureAwait(false);
+                return;
+            }
+
+            response.StatusCode = ranged ? (int)HttpStatusCode.PartialContent : (int)HttpStatusCode.OK;
+            if (ranged)
+            {
+                response.AddHeader("Content-Range", $"bytes 0-{data.Length - 1}/{data.Length}");
+            }
+
+            response.ContentType = "application/octet-stream";
+            response.ContentLength64 = data.LongLength;
+            response.AddHeader("ETag", GetETag(data));
+
+            Stream output = response.OutputStream;
+            for (int offset = 0; offset < data.Length; offset += SliceSize)
+            {
+                int length = Math.Min(SliceSize, data.Length - offset);
+                await WaitForLinkAsync(length).ConfigureAwait(false);
+                await output.WriteAsync(data.AsMemory(offset, length), _stopping.Token).ConfigureAwait(false);
+            }
+        }
+
+        /// <summary>
+        /// Reserves the next free slot on the shared link and waits until the slice would have been transmitted.
+        /// </summary>
+        /// <remarks>
+        /// The reservation is absolute, so a timer that oversleeps on one slice is made up by the next one and the
+        /// average rate stays at <c>bytesPerSecond</c> even though single delays are millisecond-grained.
+        /// </remarks>
+        private async Task WaitForLinkAsync(int bytes)
+        {
+            if (bytesPerSecond <= 0)
+            {
+                return;
+            }
+
+            long now = Stopwatch.GetTimestamp();
+            long transmittedAt;
+            lock (_linkLock)
+            {
+                long duration = (long)(bytes * (double)Stopwatch.Frequency / bytesPerSecond);
+                _linkFreeAt = Math.Max(now, _linkFreeAt) + duration;
+                transmittedAt = _linkFreeAt;
+            }
+
+            TimeSpan wait = Stopwatch.GetElapsedTime(now, transmittedAt);
+            if (wait > TimeSpan.FromMilliseconds(1))
+            {
+                await Task.Delay(wait, _stopping.Token).ConfigureAwait(false);
+            }
+        }
+
+        private static async Task WriteErrorAsync(HttpListenerResponse response, HttpStatusCode status, string code, string key)
+        {
+            byte[] body = Encoding.UTF8.GetBytes(
+                $"<?xml version=\"1.0\" encoding=\"UTF-8\"?><Error><Code>{code}</Code><Message>{code}</Message><Key>{key}</Key></Error>");
+            response.StatusCode = (int)status;
+            response.ContentType = "application/xml";
+            response.ContentLength64 = body.Length;
+            await response.OutputStream.WriteAsync(body).ConfigureAwait(false);
+        }
+
+        private static string GetETag(byte[] data)
+        {
+            return $"\"{Convert.ToHexStringLower(MD5.HashData(data))}\"";
+        }
+    }
+}
@@ -0,0 +1,54 @@
+﻿// SPDX-License-Identifier: MIT
+// Copyright (c) 2025–2026 Vadim Belov <https://belov.us>
+
+namespace Cotton.Benchmark.Infrastructure
+{
+    /// <summary>
+    /// Tolerant readers for Linux sysfs/procfs values. Also compiled into Cotton.Crypto.Tests (linked file),
+    /// so the sweep headers and the benchmark fingerprint read the host the same way.
+    /// </summary>
+    internal static class SysFs
+    {
+        public const string CpuRoot = "/sys/devices/system/cpu";
+
+        /// <summary>
+        /// Returns the trimmed file contents, or <see langword="null"/> when the file is missing or unreadable.
+        /// </summary>
+        public static string? TryRead(string path)
+        {
+            try
+            {
+                return File.Exists(path) ? File.ReadAllText(path).Trim() : null;
+            }
+            catch (IOException)
+            {
+                return null;
+            }
+            catch (UnauthorizedAccessException)
+            {
+                return null;
+            }
+        }
+
+        /// <summary>
+        /// Expands a kernel CPU list such as "0-3,8,10-11".
+        /// </summary>
+        public static IEnumerable<int> ParseCpuList(string cpuList)
+        {
+            foreach (string range in cpuList.Split(',', StringSplitOptions.RemoveEmptyEntries | StringSplitOptions.TrimEntries))
+            {
+                string[] bounds = range.Split('-');
+                if (!int.TryParse(bounds[0], out int first))
+                {
+                    continue;
+                }
+
+                int last = bounds.Length > 1 && int.TryParse(bounds[1], out int parsedLast) ? parsedLast : first;
+                for (int cpu = first; cpu <= last; cpu++)
+                {
+                    yield return cpu;
+                }
+            }
+        }
+    }
+}
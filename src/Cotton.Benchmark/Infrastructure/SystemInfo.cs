@@ -23,6 +23,11 @@ namespace Cotton.Benchmark.Infrastructure
             Console.WriteLine($"  Framework:    {Framework}");
             Console.WriteLine($"  Architecture: {Architecture}");
             Console.WriteLine($"  Processors:   {ProcessorCount}");
+            CpuTopology? topology = CpuTopology.TryReadLinux();
+            if (topology is not null)
+            {
+                Console.WriteLine($"  Topology:     {topology.Describe()}");
+            }
             Console.WriteLine($"  Memory:       {MemoryMonitor.FormatBytes(Environment.WorkingSet)}");
             Console.ResetColor();
             Console.WriteLine();
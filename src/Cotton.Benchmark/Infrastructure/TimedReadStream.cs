@@ -0,0 +1,103 @@
+﻿// SPDX-License-Identifier: MIT
+// Copyright (c) 2025–2026 Vadim Belov <https://belov.us>
+
+using System.Diagnostics;
+
+namespace Cotton.Benchmark.Infrastructure
+{
+    /// <summary>
+    /// Read-only pass-through that records into a <see cref="StageTiming"/> how long its reader was blocked,
+    /// when the first byte arrived and when the stream ended.
+    /// </summary>
+    internal class TimedReadStream(Stream inner, StageTiming timing) : Stream
+    {
+        public override bool CanRead => true;
+
+        public override bool CanSeek => false;
+
+        public override bool CanWrite => false;
+
+        public override long Length => throw new NotSupportedException();
+
+        public override long Position
+        {
+            get => throw new NotSupportedException();
+            set => throw new NotSupportedException();
+        }
+
+        public override int Read(byte[] buffer, int offset, int count)
+        {
+            long startedAt = Stopwatch.GetTimestamp();
+            int read = inner.Read(buffer, offset, count);
+            Record(startedAt, read);
+            return read;
+        }
+
+        public override Task<int> ReadAsync(byte[] buffer, int offset, int count, CancellationToken cancellationToken)
+        {
+            return ReadAsync(buffer.AsMemory(offset, count), cancellationToken).AsTask();
+        }
+
+        public override async ValueTask<int> ReadAsync(Memory<byte> buffer, CancellationToken cancellationToken = default)
+        {
+            long startedAt = Stopwatch.GetTimestamp();
+            int read = await inner.ReadAsync(buffer, cancellationToken).ConfigureAwait(false);
+            Record(startedAt, read);
+            return read;
+        }
+
+        private void Record(long startedAt, int read)
+        {
+            long now = Stopwatch.GetTimestamp();
+            timing.BusyTicks += now - startedAt;
+            timing.Bytes += read;
+            if (read > 0 && timing.FirstByteAt == 0)
+            {
+                timing.FirstByteAt = now;
+            }
+            else if (read == 0)
+            {
+                MarkCompleted(now);
+            }
+        }
+
+        // Readers that know the payload length (the cipher does) stop before reading the end of the stream,
+        // so closing the stream counts as completion too.
+        private void MarkCompleted(long now)
+        {
+            if (timing.CompletedAt == 0)
+            {
+                timing.CompletedAt = now;
+            }
+        }
+
+        protected override void Dispose(bool disposing)
+        {
+            if (disposing)
+            {
+                MarkCompleted(Stopwatch.GetTimestamp());
+                inner.Dispose();
+            }
+
+            base.Dispose(disposing);
+        }
+
+        public override async ValueTask DisposeAsync()
+        {
+            MarkCompleted(Stopwatch.GetTimestamp());
+            await inner.DisposeAsync().ConfigureAwait(false);
+            await base.DisposeAsync().ConfigureAwait(false);
+            GC.SuppressFinalize(this);
+        }
+
+        public override void Flush()
+        {
+        }
+
+        public override long Seek(long offset, SeekOrigin origin) => throw new NotSupportedException();
+
+        public override void SetLength(long value) => throw new NotSupportedException();
+
+        public override void Write(byte[] buffer, int offset, int count) => throw new NotSupportedException();
+    }
+}
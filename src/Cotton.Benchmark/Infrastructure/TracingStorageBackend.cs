@@ -0,0 +1,36 @@
+﻿// SPDX-License-Identifier: MIT
+// Copyright (c) 2025–2026 Vadim Belov <https://belov.us>
+
+using Cotton.Storage.Abstractions;
+using System.Diagnostics;
+
+namespace Cotton.Benchmark.Infrastructure
+{
+    /// <summary>
+    /// Backend decorator that records when each chunk was requested, when the backend answered and how long
+    /// the reader waited on the response body; everything else is passed through.
+    /// </summary>
+    internal class TracingStorageBackend(IStorageBackend inner, ReadPathTrace trace) : IStorageBackend
+    {
+        public void CleanupTempFiles(TimeSpan ttl) => inner.CleanupTempFiles(ttl);
+
+        public Task<bool> DeleteAsync(string uid) => inner.DeleteAsync(uid);
+
+        public Task<bool> ExistsAsync(string uid) => inner.ExistsAsync(uid);
+
+        public Task<long> GetSizeAsync(string uid) => inner.GetSizeAsync(uid);
+
+        public async Task<Stream> ReadAsync(string uid)
+        {
+            ChunkReadTiming timing = trace.For(uid);
+            timing.RequestedAt = Stopwatch.GetTimestamp();
+            Stream response = await inner.ReadAsync(uid).ConfigureAwait(false);
+            timing.RespondedAt = Stopwatch.GetTimestamp();
+            return new TimedReadStream(response, timing.Fetch);
+        }
+
+        public Task WriteAsync(string uid, Stream stream) => inner.WriteAsync(uid, stream);
+
+        public IAsyncEnumerable<string> ListAllKeysAsync(CancellationToken ct = default) => inner.ListAllKeysAsync(ct);
+    }
+}
@@ -5,6 +5,10 @@ namespace Cotton.Benchmark.Models
 {
     internal enum BenchmarkMode
     {
-        StoragePaths
+        StoragePaths,
+        FilesystemSweep,
+        S3ReadSweep,
+        SmallObjectSweep,
+        HashSweep
     }
 }
@@ -23,6 +23,12 @@ namespace Cotton.Benchmark.Models
 
         public int? CompressionLevel { get; init; }
 
+        public string? StorageDirectory { get; init; }
+
+        public int S3LatencyMs { get; init; } = 20;
+
+        public int S3BandwidthMiBps { get; init; } = 100;
+
         public IReadOnlyList<string> ScenarioFilters { get; init; } = [];
     }
 }
@@ -15,6 +15,12 @@ namespace Cotton.Benchmark.Models
 
         public long PeakWorkingSetBytes { get; init; }
 
+        public int Gen0Collections { get; init; }
+
+        public int Gen1Collections { get; init; }
+
+        public int Gen2Collections { get; init; }
+
         public double BytesPerSecond => TotalBytes / Duration.TotalSeconds;
 
         public double MegabytesPerSecond => BytesPerSecond / (1024 * 1024);
@@ -52,7 +58,10 @@ namespace Cotton.Benchmark.Models
         public PerformanceMetrics WithMemory(
             long managedAllocatedBytes,
             long workingSetBytes,
-            long peakWorkingSetBytes)
+            long peakWorkingSetBytes,
+            int gen0Collections,
+            int gen1Collections,
+            int gen2Collections)
         {
             return new PerformanceMetrics
             {
@@ -60,7 +69,10 @@ namespace Cotton.Benchmark.Models
                 Duration = Duration,
                 ManagedAllocatedBytes = managedAllocatedBytes,
                 WorkingSetBytes = workingSetBytes,
-                PeakWorkingSetBytes = peakWorkingSetBytes
+                PeakWorkingSetBytes = peakWorkingSetBytes,
+                Gen0Collections = gen0Collections,
+                Gen1Collections = gen1Collections,
+                Gen2Collections = gen2Collections
             };
         }
     }
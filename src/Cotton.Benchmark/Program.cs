@@ -39,7 +39,8 @@ namespace Cotton.Benchmark
                 BenchmarkConfigurationFactory.Create(options.Profile),
                 options);
             HardwareFingerprint hardwareFingerprint = new HardwareFingerprintProvider().Create();
-            List<IBenchmark> benchmarks = BenchmarkSuiteFactory.Create(configuration, options);
+            using BenchmarkSuite suite = BenchmarkSuiteFactory.Create(configuration, options);
+            List<IBenchmark> benchmarks = suite.Benchmarks;
 
             await using ServiceProvider serviceProvider = CreateServiceProvider();
 
@@ -145,6 +146,38 @@ namespace Cotton.Benchmark
         private static async Task<int> SaveAndCompareAsync(BenchmarkOptions options, BenchmarkRunDocument runDocument)
         {
             var artifactStore = new BenchmarkArtifactStore(options.BaselineDirectory, options.ResultsDirectory);
+            if (options.Mode == BenchmarkMode.StoragePaths)
+            {
+                await SaveStoragePathResultAsync(options, artifactStore, runDocument);
+            }
+            else
+            {
+                await SaveSweepResultAsync(options, artifactStore, runDocument);
+            }
+
+            if (!options.CompareBaseline)
+            {
+                return 0;
+            }
+
+            BenchmarkRunDocument? baseline = await artifactStore.LoadBaselineAsync(runDocument, CancellationToken.None);
+            if (baseline is null)
+            {
+                Console.Error.WriteLine($"No reviewed result found: {artifactStore.GetBaselinePath(runDocument)}");
+                Console.Error.WriteLine("Run again with --update-baseline after reviewing the result.");
+                return 2;
+            }
+
+            BenchmarkComparisonResult comparison = new BenchmarkRegressionComparer().Compare(baseline, runDocument);
+            PrintComparison(comparison);
+            return comparison.Passed ? 0 : 1;
+        }
+
+        private static async Task SaveStoragePathResultAsync(
+            BenchmarkOptions options,
+            BenchmarkArtifactStore artifactStore,
+            BenchmarkRunDocument runDocument)
+        {
             BenchmarkStoragePathSummaryDocument storagePathSummary = BenchmarkStoragePathSummaryDocument.Create(runDocument);
 
             if (options.UpdateBaseline)
@@ -164,23 +197,23 @@ namespace Cotton.Benchmark
                     CancellationToken.None);
                 Console.WriteLine($"Saved scratch storage path result: {resultSummaryPath}");
             }
+        }
 
-            if (!options.CompareBaseline)
+        private static async Task SaveSweepResultAsync(
+            BenchmarkOptions options,
+            BenchmarkArtifactStore artifactStore,
+            BenchmarkRunDocument runDocument)
+        {
+            if (options.UpdateBaseline)
             {
-                return 0;
+                string baselinePath = await artifactStore.SaveBaselineAsync(runDocument, CancellationToken.None);
+                Console.WriteLine($"Updated sweep result: {baselinePath}");
             }
-
-            BenchmarkRunDocument? baseline = await artifactStore.LoadBaselineAsync(runDocument, CancellationToken.None);
-            if (baseline is null)
+            else
             {
-                Console.Error.WriteLine($"No reviewed result found: {artifactStore.GetBaselinePath(runDocument)}");
-                Console.Error.WriteLine("Run again with --update-baseline after reviewing the result.");
-                return 2;
+                string resultPath = await artifactStore.SaveResultAsync(runDocument, CancellationToken.None);
+                Console.WriteLine($"Saved scratch sweep result: {resultPath}");
             }
-
-            BenchmarkComparisonResult comparison = new BenchmarkRegressionComparer().Compare(baseline, runDocument);
-            PrintComparison(comparison);
-            return comparison.Passed ? 0 : 1;
         }
 
         private static string FormatEnum<TEnum>(TEnum value)
@@ -225,6 +258,15 @@ namespace Cotton.Benchmark
             Console.WriteLine($"  • Hardware Key:        {hardwareFingerprint.Key}");
             Console.WriteLine($"  • Results Directory:   {options.BaselineDirectory}");
             Console.WriteLine($"  • Scratch Directory:   {options.ResultsDirectory}");
+            if (options.StorageDirectory is not null)
+            {
+                Console.WriteLine($"  • Storage Directory:   {options.StorageDirectory}");
+            }
+            if (options.Mode == BenchmarkMode.S3ReadSweep)
+            {
+                string bandwidth = options.S3BandwidthMiBps > 0 ? $"{options.S3BandwidthMiBps} MiB/s" : "unthrottled";
+                Console.WriteLine($"  • S3 Stand-in:         {options.S3LatencyMs} ms latency, {bandwidth}");
+            }
             Console.WriteLine();
             Console.WriteLine("Configuration:");
             Console.WriteLine($"  • Data Size:           {FormatBytes(configuration.DataSizeBytes)}");
@@ -268,7 +310,7 @@ namespace Cotton.Benchmark
             Console.WriteLine();
             Console.WriteLine("Options:");
             Console.WriteLine("  -h, --help              Show this help message");
-            Console.WriteLine("  --mode <value>          storage-paths");
+            Console.WriteLine("  --mode <value>          storage-paths | filesystem-sweep | s3-read-sweep | small-object-sweep | hash-sweep");
             Console.WriteLine("  --profile <value>       quick | standard | full");
             Console.WriteLine("  --scenario <filter>     Run only matching benchmark names; can be comma-separated");
             Console.WriteLine("  --compression-level <n> Override Zstd level for configured pipeline benchmarks");
@@ -278,9 +320,16 @@ namespace Cotton.Benchmark
             Console.WriteLine("  --no-update-baseline    Save only a scratch result");
             Console.WriteLine("  --baseline-dir <path>   Reviewed result directory; default <repo>/performance/results");
             Console.WriteLine("  --results-dir <path>    Scratch result directory; default <repo>/.temp/benchmark-results");
+            Console.WriteLine("  --storage-dir <path>    Directory on the device under test for filesystem sweeps");
+            Console.WriteLine("  --s3-latency-ms <n>     Delay before every GET response of the S3 stand-in; default 20");
+            Console.WriteLine("  --s3-bandwidth-mibps <n> Download bandwidth shared by all GETs of the S3 stand-in; 0 = unthrottled; default 100");
             Console.WriteLine();
             Console.WriteLine("Modes:");
-            Console.WriteLine("  storage-paths Public write/read storage-path benchmarks used for published results.");
+            Console.WriteLine("  storage-paths    Public write/read storage-path benchmarks used for published results.");
+            Console.WriteLine("  filesystem-sweep Filesystem backend write/read over object size, concurrency, and fsync; scratch only by default.");
+            Console.WriteLine("  s3-read-sweep    S3 backend read path over chunk count, chunk size, and read-ahead against a local stand-in; scratch only by default.");
+            Console.WriteLine("  small-object-sweep Cipher and storage pipeline over 256 B - 256 KiB objects, one object at a time; scratch only by default.");
+            Console.WriteLine("  hash-sweep       SHA-256 (IncrementalHash) over chunk size and concurrently hashed chunks; scratch only by default.");
         }
 
         private static string FormatBytes(long bytes)
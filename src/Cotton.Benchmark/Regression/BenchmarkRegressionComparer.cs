@@ -17,6 +17,10 @@ namespace Cotton.Benchmark.Regression
         private const double DurationRegressionRatio = 1.20;
         private const double DurationRegressionGraceMs = 10;
         private const double MemoryRegressionGraceBytes = 16 * 1024 * 1024;
+        private const double AllocationRegressionGraceBytesPerMiB = 16 * 1024;
+        // One stray full collection is ~1 per GiB over a standard run but ~21 per GiB over a quick one (48 MiB).
+        private const double Gen2CollectionRegressionGracePerGiB = 2;
+        private const double QuickGen2CollectionRegressionGracePerGiB = 32;
         private const double ThroughputRegressionRatio = 0.85;
         private const double ThroughputRegressionGraceMBps = 5;
         private const double MinimumDurationForThroughputGateMs = 100;
@@ -26,6 +30,8 @@ namespace Cotton.Benchmark.Regression
             double DurationRatio,
             double DurationGraceMs,
             double MemoryGraceBytes,
+            double AllocationGraceBytesPerMiB,
+            double Gen2CollectionGracePerGiB,
             double ThroughputRatio,
             double ThroughputGraceMBps,
             int MinimumIterationsForPercentileGate,
@@ -35,6 +41,8 @@ namespace Cotton.Benchmark.Regression
                 DurationRegressionRatio,
                 DurationRegressionGraceMs,
                 MemoryRegressionGraceBytes,
+                AllocationRegressionGraceBytesPerMiB,
+                Gen2CollectionRegressionGracePerGiB,
                 ThroughputRegressionRatio,
                 ThroughputRegressionGraceMBps,
                 BenchmarkRegressionComparer.MinimumIterationsForPercentileGate,
@@ -44,6 +52,8 @@ namespace Cotton.Benchmark.Regression
                 2.00,
                 50,
                 MemoryRegressionGraceBytes,
+                AllocationRegressionGraceBytesPerMiB,
+                QuickGen2CollectionRegressionGracePerGiB,
                 0.50,
                 ThroughputRegressionGraceMBps,
                 BenchmarkRegressionComparer.MinimumIterationsForPercentileGate,
@@ -63,7 +73,17 @@ namespace Cotton.Benchmark.Regression
             "AvgManagedAllocatedBytes",
             "MaxManagedAllocatedBytes",
             "MaxWorkingSetBytes",
-            "MaxPeakWorkingSetBytes"
+            "MaxPeakWorkingSetBytes",
+            "AllocatedBytesPerMiB",
+            "Gen2CollectionsPerGiB"
+        ];
+
+        // Allocation-free paths and runs without a full collection legitimately report zero, and growing
+        // from zero is exactly the regression these gates exist for.
+        private static readonly string[] ZeroBaselineMetrics =
+        [
+            "AllocatedBytesPerMiB",
+            "Gen2CollectionsPerGiB"
         ];
 
         private static readonly string[] HigherIsBetterMetrics =
@@ -97,7 +117,7 @@ namespace Cotton.Benchmark.Regression
                 foreach (string metricName in LowerIsBetterMetrics)
                 {
                     if (ShouldCompareMetric(baselineResult, currentResult, metricName, tolerance)
-                        && TryGetPair(baselineResult, currentResult, metricName, out double baselineValue, out double currentValue)
+                        && TryGetPair(baselineResult, currentResult, metricName, out double baselineValue, out double currentValue, ZeroBaselineMetrics.Contains(metricName))
                         && IsLowerIsBetterRegression(metricName, baselineValue, currentValue, tolerance))
                     {
                         passed = false;
@@ -152,11 +172,12 @@ namespace Cotton.Benchmark.Regression
             BenchmarkResultSnapshot current,
             string metricName,
             out double baselineValue,
-            out double currentValue)
+            out double currentValue,
+            bool allowZeroBaseline = false)
         {
             if (baseline.NumericMetrics.TryGetValue(metricName, out baselineValue)
                 && current.NumericMetrics.TryGetValue(metricName, out currentValue)
-                && baselineValue > 0
+                && (baselineValue > 0 || (allowZeroBaseline && baselineValue == 0))
                 && currentValue > 0)
             {
                 return true;
@@ -181,9 +202,13 @@ namespace Cotton.Benchmark.Regression
 
         private static bool IsLowerIsBetterRegression(string metricName, double baselineValue, double currentValue, RegressionTolerance tolerance)
         {
-            double grace = metricName.EndsWith("Bytes", StringComparison.Ordinal)
-                ? tolerance.MemoryGraceBytes
-                : tolerance.DurationGraceMs;
+            double grace = metricName switch
+            {
+                "AllocatedBytesPerMiB" => tolerance.AllocationGraceBytesPerMiB,
+                "Gen2CollectionsPerGiB" => tolerance.Gen2CollectionGracePerGiB,
+                _ when metricName.EndsWith("Bytes", StringComparison.Ordinal) => tolerance.MemoryGraceBytes,
+                _ => tolerance.DurationGraceMs
+            };
 
             return currentValue > baselineValue * tolerance.DurationRatio
                 && currentValue - baselineValue > grace;
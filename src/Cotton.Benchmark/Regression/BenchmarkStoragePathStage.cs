@@ -18,5 +18,15 @@ namespace Cotton.Benchmark.Regression
         public double? P95DurationMs { get; init; }
 
         public double? DataSizeBytes { get; init; }
+
+        public double? AllocatedBytesPerMiB { get; init; }
+
+        public double? Gen0Collections { get; init; }
+
+        public double? Gen1Collections { get; init; }
+
+        public double? Gen2Collections { get; init; }
+
+        public double? PeakWorkingSetBytes { get; init; }
     }
 }
@@ -9,6 +9,11 @@ namespace Cotton.Benchmark.Regression
         private const string P50DurationMetricName = "P50DurationMs";
         private const string P95DurationMetricName = "P95DurationMs";
         private const string DataSizeMetricName = "DataSizeBytes";
+        private const string AllocatedBytesPerMiBMetricName = "AllocatedBytesPerMiB";
+        private const string Gen0CollectionsMetricName = "Gen0Collections";
+        private const string Gen1CollectionsMetricName = "Gen1Collections";
+        private const string Gen2CollectionsMetricName = "Gen2Collections";
+        private const string PeakWorkingSetMetricName = "MaxPeakWorkingSetBytes";
 
         private static readonly BenchmarkStageMapping[] WriteStageMappings =
         [
@@ -116,7 +121,12 @@ namespace Cotton.Benchmark.Regression
                 SourceBenchmark = mapping.SourceBenchmark,
                 P50DurationMs = TryGetMetric(result, P50DurationMetricName),
                 P95DurationMs = TryGetMetric(result, P95DurationMetricName),
-                DataSizeBytes = TryGetMetric(result, DataSizeMetricName)
+                DataSizeBytes = TryGetMetric(result, DataSizeMetricName),
+                AllocatedBytesPerMiB = TryGetMetric(result, AllocatedBytesPerMiBMetricName),
+                Gen0Collections = TryGetMetric(result, Gen0CollectionsMetricName),
+                Gen1Collections = TryGetMetric(result, Gen1CollectionsMetricName),
+                Gen2Collections = TryGetMetric(result, Gen2CollectionsMetricName),
+                PeakWorkingSetBytes = TryGetMetric(result, PeakWorkingSetMetricName)
             };
         }
 
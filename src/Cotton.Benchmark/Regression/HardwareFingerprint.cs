@@ -3,6 +3,7 @@
 
 using System.Runtime.InteropServices;
 using System.Text;
+using Cotton.Benchmark.Infrastructure;
 using Microsoft.Win32;
 
 namespace Cotton.Benchmark.Regression
@@ -28,6 +29,9 @@ namespace Cotton.Benchmark.Regression
                 ["runtime"] = RuntimeInformation.FrameworkDescription.Trim()
             };
 
+            // Topology is recorded for analysis only; it is not part of the hardware key.
+            CpuTopology.TryReadLinux()?.AddProperties(properties);
+
             string key = string.Join(
                 '-',
                 Sanitize(GetOsFamily()),
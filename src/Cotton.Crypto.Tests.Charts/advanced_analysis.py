@@ -1,10 +1,14 @@
 """Generate the 6-panel advanced analysis figure (advanced_performance_analysis.png)."""
 
+import argparse
+import sys
 import traceback
+from pathlib import Path
+from typing import Optional
 
 import matplotlib.pyplot as plt
 
-from chart_common import create_advanced_plots, parse_test_results
+from chart_common import MYLIB_INPUT_DEFAULT, ROOT, create_advanced_plots, parse_sweeps, select
 
 
 def print_analysis_summary(encrypt_data, decrypt_data, encrypt_optimal, decrypt_optimal) -> None:
@@ -40,28 +44,34 @@ def print_analysis_summary(encrypt_data, decrypt_data, encrypt_optimal, decrypt_
     print("\n" + "=" * 60)
 
 
-def main() -> None:
-    """Parse input.txt, build the 6-panel figure and save it."""
+def main(argv: Optional[list[str]] = None) -> None:
+    """Parse the sweep log, build the 6-panel figure and save it."""
+    p = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    p.add_argument("input", nargs="?", type=Path, default=MYLIB_INPUT_DEFAULT, help="PerformanceTests output")
+    p.add_argument("--out", type=Path, default=ROOT / "advanced_performance_analysis.png", help="Output PNG path")
+    args = p.parse_args(sys.argv[1:] if argv is None else argv)
+
     try:
-        encrypt_data, decrypt_data = parse_test_results("input.txt")
+        sweeps = parse_sweeps(args.input)
+        encrypt_data, decrypt_data = select(sweeps, {"Op": "Encrypt"}), select(sweeps, {"Op": "Decrypt"})
 
         if encrypt_data.empty or decrypt_data.empty:
-            print("Error: failed to find data in input.txt")
+            print(f"Error: failed to find data in {args.input}")
             return
 
         print("Data loaded:")
         print(f"  Encryption: {len(encrypt_data)} records")
         print(f"  Decryption: {len(decrypt_data)} records")
 
-        fig, encrypt_optimal, decrypt_optimal = create_advanced_plots(encrypt_data, decrypt_data)
-        fig.savefig("advanced_performance_analysis.png", dpi=300, bbox_inches="tight")
-        print("\nAdvanced charts saved to advanced_performance_analysis.png")
+        fig, encrypt_optimal, decrypt_optimal = create_advanced_plots(sweeps)
+        fig.savefig(args.out, dpi=300, bbox_inches="tight")
+        print(f"\nAdvanced charts saved to {args.out}")
 
         print_analysis_summary(encrypt_data, decrypt_data, encrypt_optimal, decrypt_optimal)
         plt.show()
 
     except FileNotFoundError:
-        print("Error: file 'input.txt' not found")
+        print(f"Error: file '{args.input}' not found")
     except Exception as e:
         print(f"Error: {e}")
         traceback.print_exc()
@@ -1,4 +1,9 @@
-"""Orchestrator that runs the simple/advanced/mega chart generators on demand."""
+"""Orchestrator that runs the simple/advanced/mega chart generators on demand.
+
+Works from any directory: the input log and the output directory are passed to
+each generator explicitly. ``--batch DIR`` hands a whole tree of per-host logs
+to ``charts.run_batch`` instead.
+"""
 
 import os
 import sys
@@ -12,10 +17,15 @@ os.environ.setdefault("MPLBACKEND", "Agg")
 
 ROOT = Path(__file__).parent.resolve()
 INPUT_DEFAULT = ROOT / "input.txt"
+OUTPUTS = {
+    "simple": ("simple_charts", "performance_charts.png"),
+    "advanced": ("advanced_analysis", "advanced_performance_analysis.png"),
+    "mega": ("mega_advanced_analysis", "mega_performance_analysis.png"),
+}
 
 
-def _run_module_main(module_name: str) -> None:
-    """Import module, patch plt.show to no-op, then call its main()."""
+def _run_module_main(module_name: str, argv: list[str]) -> None:
+    """Import module, patch plt.show to no-op, then call its main(argv)."""
     mod = importlib.import_module(module_name)
     # Patch plt.show to avoid GUI blocking
     if hasattr(mod, "plt") and hasattr(mod.plt, "show"):
@@ -25,49 +35,28 @@ def _run_module_main(module_name: str) -> None:
             logging.debug("Failed to patch plt.show for %s: %s", module_name, exc)
     # Call module main()
     if hasattr(mod, "main"):
-        mod.main()
+        mod.main(argv)
     else:
         raise RuntimeError(f"Module '{module_name}' has no main() function")
 
 
-def generate_simple():
-    print("\n=== ✅ Generating simple charts ===")
-    _run_module_main("simple_charts")
-
-
-def generate_advanced():
-    print("\n=== ✅ Generating advanced charts ===")
-    _run_module_main("advanced_analysis")
-
-
-def generate_mega():
-    print("\n=== ✅ Generating MEGA charts ===")
-    _run_module_main("mega_advanced_analysis")
-
-
-def run_selected(sets: list[str]):
-    # Always run from script directory so child scripts find input.txt relative to this file
-    os.chdir(ROOT)
-
+def run_selected(sets: list[str], input_path: Path = INPUT_DEFAULT, out_dir: Path = ROOT):
     # Basic presence check for input
-    if not INPUT_DEFAULT.exists():
-        print(f"❌ Data file not found: {INPUT_DEFAULT}")
+    if not input_path.exists():
+        print(f"❌ Data file not found: {input_path}")
         sys.exit(1)
 
+    out_dir.mkdir(parents=True, exist_ok=True)
     for s in sets:
-        if s == "simple":
-            generate_simple()
-        elif s == "advanced":
-            generate_advanced()
-        elif s == "mega":
-            generate_mega()
-        else:
+        if s not in OUTPUTS:
             raise ValueError(f"Unknown set: {s}")
+        module_name, png = OUTPUTS[s]
+        print(f"\n=== ✅ Generating {s} charts ===")
+        _run_module_main(module_name, [str(input_path), "--out", str(out_dir / png)])
 
     print("\n🎉 Done. Files created (if enough data):")
-    print("  • performance_charts.png")
-    print("  • advanced_performance_analysis.png")
-    print("  • mega_performance_analysis.png")
+    for s in sets:
+        print(f"  • {out_dir / OUTPUTS[s][1]}")
 
 
 def interactive_menu() -> list[str]:
@@ -95,12 +84,21 @@ def parse_args(argv: list[str]):
     g.add_argument("--mega", action="store_true", help="Generate MEGA charts only")
     g.add_argument("--all", action="store_true", help="Generate all charts (default)")
     p.add_argument("--menu", action="store_true", help="Show interactive selection menu")
+    p.add_argument("input", nargs="?", type=Path, default=INPUT_DEFAULT, help="PerformanceTests output")
+    p.add_argument("--out-dir", type=Path, help="Output directory (default: next to this script; batch mode: <batch>/charts)")
+    p.add_argument("--batch", type=Path, help="Directory tree of per-host logs; runs charts.py batch mode instead")
+    p.add_argument("--workers", type=int, help="Parallel worker processes in batch mode (default: CPU count)")
     return p.parse_args(argv)
 
 
 def main(argv: list[str] | None = None):
     args = parse_args(sys.argv[1:] if argv is None else argv)
 
+    if args.batch:
+        from charts import run_batch
+
+        sys.exit(run_batch(args.batch.resolve(), (args.out_dir or args.batch / "charts").resolve(), workers=args.workers))
+
     if args.menu:
         sets = interactive_menu()
     else:
@@ -114,7 +112,7 @@ def main(argv: list[str] | None = None):
             # --all или по умолчанию
             sets = ["simple", "advanced", "mega"]
 
-    run_selected(sets)
+    run_selected(sets, args.input.resolve(), (args.out_dir or ROOT).resolve())
 
 
 if __name__ == "__main__":
@@ -0,0 +1,250 @@
+"""Change-point detection over benchmark history and a commit bisect helper (benchmark_history.png).
+
+``detect`` collects every version of the compact results in performance/results
+from git history (or run documents from directories), builds one series per
+hardware id and stage, and reports the commit range and magnitude of each step
+change. ``bisect`` lists the midpoint commits to benchmark next so a regression
+between two commits is narrowed to one commit in about log2(n) runs.
+"""
+
+import argparse
+import json
+import math
+import subprocess
+import sys
+from pathlib import Path
+from typing import Optional
+
+import matplotlib.pyplot as plt
+import pandas as pd
+
+from chart_common import BENCHMARK_RESULTS_DEFAULT, REPO_ROOT, ROOT, detect_change_points
+
+RESULTS_PATH = "performance/results"
+
+
+def _git(*args: str) -> str:
+    return subprocess.run(["git", *args], cwd=REPO_ROOT, capture_output=True, text=True, check=True).stdout
+
+
+def document_points(doc: dict) -> list[dict]:
+    """Flatten a compact summary or a full run document into (hardware, series, value) points."""
+    base = {
+        "Hardware": doc.get("hardwareId") or doc.get("hardwareKey", "unknown"),
+        "Commit": doc.get("gitCommit", "unknown"),
+        "CreatedAtUtc": doc.get("createdAtUtc", ""),
+    }
+    points = []
+    for direction in ("write", "read"):
+        section = doc.get(direction) or {}
+        for stage in section.get("stages", []) + ([section["pipeline"]] if section.get("pipeline") else []):
+            points.append({**base, "Series": f"{direction}.{stage['key']}", "Benchmark": stage.get("sourceBenchmark", ""), "Value": stage["mibPerSecond"]})
+    for result in doc.get("results", []):
+        value = (result.get("numericMetrics") or {}).get("AvgThroughputMBps")
+        if result.get("succeeded") and value is not None:
+            points.append({**base, "Series": result["name"], "Benchmark": result["name"], "Value": value})
+    return points
+
+
+def load_git_history(path: str = RESULTS_PATH) -> pd.DataFrame:
+    """Read every committed version of the compact results under ``path``."""
+    points = []
+    commit = None
+    for line in _git("log", "--format=commit %H", "--name-only", "--diff-filter=AM", "--", path).splitlines():
+        if line.startswith("commit "):
+            commit = line.split()[1]
+        elif line.endswith(".json") and commit:
+            try:
+                points.extend(document_points(json.loads(_git("show", f"{commit}:{line}").lstrip("\ufeff"))))
+            except (subprocess.CalledProcessError, json.JSONDecodeError) as exc:
+                print(f"[warn] Skipping {commit[:12]}:{line}: {exc}")
+    return _to_frame(points)
+
+
+def load_directories(directories: list[Path]) -> pd.DataFrame:
+    """Read run documents and compact summaries from result directories."""
+    points = []
+    for directory in directories:
+        for path in sorted(directory.glob("*.json")):
+            try:
+                points.extend(document_points(json.loads(path.read_text(encoding="utf-8-sig"))))
+            except json.JSONDecodeError as exc:
+                print(f"[warn] Skipping {path.name}: {exc}")
+    return _to_frame(points)
+
+
+def _to_frame(points: list[dict]) -> pd.DataFrame:
+    df = pd.DataFrame(points, columns=["Hardware", "Commit", "CreatedAtUtc", "Series", "Benchmark", "Value"])
+    df = df.drop_duplicates(subset=["Hardware", "Series", "CreatedAtUtc", "Commit"])
+    return df.sort_values(["Hardware", "Series", "CreatedAtUtc"]).reset_index(drop=True)
+
+
+def find_steps(history: pd.DataFrame, min_change: float = 5.0, penalty: Optional[float] = None, min_size: int = 2) -> pd.DataFrame:
+    """Run change-point detection per (hardware, series) and describe each step change.
+
+    GoodCommit is the last point before the step and BadCommit the first point after
+    it; the change landed in (GoodCommit, BadCommit]. Steps smaller than
+    ``min_change`` percent are dropped.
+    """
+    rows = []
+    for (hardware, series), data in history.groupby(["Hardware", "Series"], sort=True):
+        data = data.reset_index(drop=True)
+        cuts = detect_change_points(data["Value"], penalty, min_size)
+        bounds = [0] + cuts + [len(data)]
+        for i, cut in enumerate(cuts):
+            before = data["Value"].iloc[bounds[i]:cut].mean()
+            after = data["Value"].iloc[cut:bounds[i + 2]].mean()
+            change = (after - before) / before * 100.0
+            if abs(change) < min_change:
+                continue
+            rows.append({
+                "Hardware": hardware,
+                "Series": series,
+                "GoodCommit": data["Commit"].iloc[cut - 1],
+                "BadCommit": data["Commit"].iloc[cut],
+                "Since": data["CreatedAtUtc"].iloc[cut][:10],
+                "Before": before,
+                "After": after,
+                "ChangePct": change,
+                "Kind": "regression" if change < 0 else "improvement",
+            })
+    return pd.DataFrame(rows, columns=["Hardware", "Series", "GoodCommit", "BadCommit", "Since", "Before", "After", "ChangePct", "Kind"])
+
+
+def bisect_plan(good: str, bad: str, paths: list[str]) -> Optional[dict]:
+    """Describe the next bisect step for the commits in (good, bad], optionally limited to ``paths``."""
+    try:
+        commits = _git("rev-list", "--reverse", "--ancestry-path", f"{good}..{bad}", "--", *paths).split()
+    except subprocess.CalledProcessError:
+        return None
+    if not commits:
+        return None
+
+    def midpoint(candidates: list[str]) -> Optional[str]:
+        return candidates[(len(candidates) - 1) // 2] if len(candidates) > 1 else None
+
+    split = (len(commits) - 1) // 2
+    return {
+        "candidates": commits,
+        "steps": math.ceil(math.log2(len(commits))) if len(commits) > 1 else 0,
+        "midpoint": midpoint(commits),
+        "if_regressed": commits[:split + 1],
+        "if_fine": commits[split + 1:],
+    }
+
+
+def print_bisect(good: str, bad: str, paths: list[str], benchmark: str = "") -> None:
+    plan = bisect_plan(good, bad, paths)
+    if plan is None:
+        print(f"  [info] {good[:12]}..{bad[:12]} is not resolvable in this clone; fetch history and run: bisect {good} {bad}")
+        return
+    if plan["midpoint"] is None:
+        print(f"  Culprit: {plan['candidates'][0][:12]} {_subject(plan['candidates'][0])}")
+        return
+    scenario = f" --scenario \"{benchmark}\"" if benchmark else ""
+    mid = plan["midpoint"]
+    print(f"  {len(plan['candidates'])} candidate commits, ~{plan['steps']} benchmark runs")
+    print(f"  Benchmark next: {mid[:12]} {_subject(mid)}")
+    print(f"    git checkout {mid[:12]} && dotnet run --project src/Cotton.Benchmark -c Release -- --no-update-baseline{scenario}")
+    for outcome, half, next_range in (
+        ("If it regressed", plan["if_regressed"], f"{good[:12]} {mid[:12]}"),
+        ("If it is fine  ", plan["if_fine"], f"{mid[:12]} {bad[:12]}"),
+    ):
+        if len(half) == 1:
+            print(f"  {outcome}: culprit is {half[0][:12]} {_subject(half[0])}")
+        else:
+            print(f"  {outcome}: next {half[(len(half) - 1) // 2][:12]} (then bisect {next_range})")
+
+
+def _subject(commit: str) -> str:
+    return _git("log", "-1", "--format=%s", commit).strip()
+
+
+def create_history_plots(history: pd.DataFrame, steps: pd.DataFrame, hardware: str):
+    """One panel per series of ``hardware``: values in time order with step markers."""
+    data = history[history["Hardware"] == hardware]
+    series = sorted(data["Series"].unique())
+    cols = min(3, len(series))
+    rows = math.ceil(len(series) / cols)
+    fig, axes = plt.subplots(rows, cols, figsize=(6 * cols, 4 * rows), squeeze=False)
+    fig.suptitle(f"Benchmark History: {hardware}", fontsize=16, fontweight="bold")
+    for ax, name in zip(axes.flat, series):
+        d = data[data["Series"] == name].reset_index(drop=True)
+        ax.plot(d.index, d["Value"], marker="o", linewidth=1.5)
+        for _, step in steps[(steps["Hardware"] == hardware) & (steps["Series"] == name)].iterrows():
+            x = d.index[d["Commit"] == step["BadCommit"]].min() - 0.5
+            ax.axvline(x, color="red" if step["Kind"] == "regression" else "green", linestyle="--")
+            ax.annotate(f"{step['ChangePct']:+.1f}%", (x, 1), xycoords=("data", "axes fraction"), xytext=(3, -12),
+                        textcoords="offset points", fontsize=8)
+        ax.set_xticks(d.index)
+        ax.set_xticklabels([c[:7] for c in d["Commit"]], rotation=90, fontsize=7)
+        ax.set_title(name, fontsize=11, fontweight="bold")
+        ax.set_ylabel("MiB/s")
+        ax.grid(True, alpha=0.3)
+    for ax in list(axes.flat)[len(series):]:
+        ax.set_visible(False)
+    fig.tight_layout(rect=(0, 0, 1, 0.96))
+    return fig
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Detect step changes in benchmark history, or plan the next bisect step."""
+    p = argparse.ArgumentParser(description="Change-point detection and bisect helper over benchmark history")
+    sub = p.add_subparsers(dest="command", required=True)
+
+    d = sub.add_parser("detect", help="Report step changes per hardware id and stage")
+    d.add_argument("--dir", type=Path, action="append", help=f"Read result documents from a directory instead of git history (e.g. {BENCHMARK_RESULTS_DEFAULT})")
+    d.add_argument("--hardware", help="Only this hardware id")
+    d.add_argument("--min-change", type=float, default=5.0, help="Ignore steps smaller than this percent")
+    d.add_argument("--penalty", type=float, help="Split penalty (default: 3 * sigma^2 * ln n)")
+    d.add_argument("--min-size", type=int, default=2, help="Minimum points per segment")
+    d.add_argument("--bisect", action="store_true", help="Print the next bisect step for every regression")
+    d.add_argument("--path", action="append", default=[], help="Limit bisect candidates to commits touching this path")
+    d.add_argument("--out", type=Path, default=ROOT / "benchmark_history.png", help="Output PNG path (needs --hardware)")
+
+    b = sub.add_parser("bisect", help="List the midpoint commits to benchmark next")
+    b.add_argument("good", help="Last commit with the old performance")
+    b.add_argument("bad", help="First commit with the new performance")
+    b.add_argument("--path", action="append", default=[], help="Limit candidates to commits touching this path")
+    b.add_argument("--scenario", default="", help="Benchmark scenario to rerun at each step")
+
+    args = p.parse_args(sys.argv[1:] if argv is None else argv)
+
+    if args.command == "bisect":
+        print(f"Bisect {args.good[:12]}..{args.bad[:12]}:")
+        print_bisect(args.good, args.bad, args.path, args.scenario)
+        return 0
+
+    history = load_directories(args.dir) if args.dir else load_git_history()
+    if args.hardware:
+        history = history[history["Hardware"] == args.hardware]
+    if history.empty:
+        print("[error] No benchmark history found")
+        return 1
+
+    counts = history.groupby(["Hardware", "Series"]).size()
+    print(f"Loaded {len(history)} points: {history['Hardware'].nunique()} hardware ids, {len(counts)} series, up to {counts.max()} points each")
+    steps = find_steps(history, args.min_change, args.penalty, args.min_size)
+
+    if args.hardware:
+        fig = create_history_plots(history, steps, args.hardware)
+        fig.savefig(args.out, dpi=200, bbox_inches="tight")
+        print(f"[ok] Saved {args.out.name}")
+
+    if steps.empty:
+        print(f"\nNo step changes of {args.min_change:g}% or more.")
+        return 0
+
+    print("\nStep changes (landed in GoodCommit..BadCommit):")
+    print(steps.to_string(index=False, float_format=lambda v: f"{v:.1f}",
+                          formatters={"GoodCommit": lambda c: c[:12], "BadCommit": lambda c: c[:12]}))
+    if args.bisect:
+        benchmarks = history.drop_duplicates(["Hardware", "Series"]).set_index(["Hardware", "Series"])["Benchmark"]
+        for _, step in steps[steps["Kind"] == "regression"].iterrows():
+            print(f"\n{step['Hardware']} {step['Series']} ({step['ChangePct']:+.1f}%):")
+            print_bisect(step["GoodCommit"], step["BadCommit"], args.path, benchmarks[(step["Hardware"], step["Series"])])
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
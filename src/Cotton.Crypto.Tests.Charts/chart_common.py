@@ -1,6 +1,9 @@
 """Shared parsing, styling and plotting helpers for the benchmark chart scripts."""
 
+import json
+import math
 import re
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional, Tuple
 
@@ -16,11 +19,142 @@ except Exception:  # pragma: no cover
 
 
 ROOT = Path(__file__).parent.resolve()
+REPO_ROOT = ROOT.parents[1]
 MYLIB_INPUT_DEFAULT = ROOT / "input.txt"
 OPENSSL_INPUT_DEFAULT = ROOT / "input-openssl.txt"
+OPENSSL_SHA256_INPUT_DEFAULT = ROOT / "input-openssl-sha256.txt"
+BENCHMARK_RESULTS_DEFAULT = REPO_ROOT / ".temp" / "benchmark-results"
+PERFORMANCE_RESULTS_DEFAULT = REPO_ROOT / "performance" / "results"
 
 THREAD_HEX_COLORS = ["#1f77b4", "#ff7f0e", "#2ca02c", "#d62728", "#9467bd", "#8c564b"]
 CHUNK_HEX_COLORS = ["#e41a1c", "#377eb8", "#4daf4a", "#984ea3", "#ff7f00", "#a65628", "#f781bf"]
+SWEEP_COLUMNS = ["Threads", "ChunkMB", "Throughput"]
+SWEEP_SECTIONS = {
+    "Encrypt": "ENCRYPTION THREAD/CHUNK SWEEP",
+    "Decrypt": "DECRYPTION THREAD/CHUNK SWEEP",
+    "Memcpy": "MEMORY BANDWIDTH THREAD/CHUNK SWEEP",
+}
+CONTENTION_SECTION = "MULTI-STREAM CONTENTION SWEEP"
+# Tidy sweep schema: one row per cell, one column per dimension, then the measures.
+SWEEP_DIMENSIONS = ("Host", "Op", "Threads", "ChunkMB", "DataSizeMB", "Profile", "KeyDerivation", "Runtime")
+SWEEP_MEASURES = ("Throughput", "Samples", "SetupMs", "FirstThroughput", "Speedup", "Efficiency")
+TOPOLOGY_KEYS = ("logicalProcessors", "physicalCores", "threadsPerCore", "performanceCores", "efficiencyCores")
+# Assumed E-core throughput relative to a P-core; not measured. Override with --e-core-weight.
+E_CORE_WEIGHT = 0.6
+
+
+def parse_sweep_section(text: str, title: str) -> pd.DataFrame:
+    """Extract one ``=== <title> ===`` table (Threads | ChunkMB | Avg MB/s [| Samples MB/s [| Setup ms | First MB/s]]) from PerformanceTests output.
+
+    Newer output carries the per-iteration throughputs as a ``;``-separated fourth
+    column; when present they are returned as a list in a Samples column. Cold-start
+    output adds the per-cell setup time and the first (cold) pass as SetupMs and
+    FirstThroughput; Throughput and Samples then cover warm passes only.
+    """
+    section = _sweep_section_text(text, title)
+    if section is None:
+        return pd.DataFrame(columns=SWEEP_COLUMNS)
+    # threads | chunk (can be decimal) | throughput (decimal) [| sample;sample;... [| setup ms | first MB/s]]
+    pat = re.compile(r"^\s*(\d+)\s*\|\s*([\d.]+)\s*\|\s*([\d.]+)(?:\s*\|\s*([\d.;]+))?(?:\s*\|\s*([\d.]+)\s*\|\s*([\d.]+))?", re.MULTILINE)
+    if re.search(r"^\s*\d+\s*\|\s*\d+,\d", section, re.MULTILINE):
+        print(f"[warn] '{title}' uses comma decimals (non-invariant culture); those rows are skipped")
+    rows = []
+    for th, ch, thr, samples, setup, first in pat.findall(section):
+        row = {"Threads": int(th), "ChunkMB": float(ch), "Throughput": float(thr)}
+        if samples:
+            row["Samples"] = [float(v) for v in samples.split(";") if v]
+        if first:
+            row["SetupMs"], row["FirstThroughput"] = float(setup), float(first)
+        rows.append(row)
+    columns = SWEEP_COLUMNS + [c for c in ("Samples", "SetupMs", "FirstThroughput") if any(c in row for row in rows)]
+    return pd.DataFrame(rows, columns=columns)
+
+
+def parse_contention_section(text: str) -> pd.DataFrame:
+    """Extract the ``=== MULTI-STREAM CONTENTION SWEEP ===`` table from PerformanceTests output.
+
+    Returns one row per cell: Streams, ThreadsPerStream, Throughput (aggregate MB/s),
+    Samples (aggregate MB/s per pass), StreamMs (completion time of every stream in
+    every pass, pass by pass), plus StreamMB and CoreBudget from the section header.
+    """
+    section = _sweep_section_text(text, CONTENTION_SECTION)
+    if section is None:
+        return pd.DataFrame()
+    size = re.search(r"^Data size:\s*([\d.]+)\s*MB per stream", section, re.MULTILINE)
+    budget = re.search(r"^Core budget:\s*(\d+)", section, re.MULTILINE)
+    pat = re.compile(r"^\s*(\d+)\s*\|\s*(\d+)\s*\|\s*([\d.]+)\s*\|\s*([\d.;]+)\s*\|\s*([\d.;]+)", re.MULTILINE)
+    rows = [{
+        "Streams": int(streams),
+        "ThreadsPerStream": int(threads),
+        "Throughput": float(throughput),
+        "Samples": [float(v) for v in samples.split(";") if v],
+        "StreamMs": [float(v) for v in completions.split(";") if v],
+    } for streams, threads, throughput, samples, completions in pat.findall(section)]
+    df = pd.DataFrame(rows)
+    if not df.empty:
+        df["StreamMB"] = float(size.group(1)) if size else np.nan
+        df["CoreBudget"] = int(budget.group(1)) if budget else np.nan
+    return df
+
+
+def parse_sweep_environment(text: str, title: str) -> dict[str, str]:
+    """Read the ``Environment: governor=..., loadAverage1=...`` line of one sweep section (empty for older output)."""
+    section = _sweep_section_text(text, title)
+    line = re.search(r"^Environment:\s*(.+)$", section, re.MULTILINE) if section else None
+    return dict(re.findall(r"(\w+)=([^,\s]+)", line.group(1))) if line else {}
+
+
+def _sweep_section_text(text: str, title: str) -> Optional[str]:
+    section = re.search(rf"===\s*{re.escape(title)}\s*===(.*?)(?===|\Z)", text, re.DOTALL)
+    return section.group(1) if section else None
+
+
+def parse_sweeps(filename: Path, host: Optional[str] = None) -> pd.DataFrame:
+    """Parse every sweep section of PerformanceTests output into one tidy frame.
+
+    One row per measured cell: a column for each SWEEP_DIMENSIONS entry plus
+    Throughput (and Samples when recorded). Host defaults to the file stem,
+    DataSizeMB comes from the ``Data size:`` header, and every ``key=value`` on a
+    ``Dimensions:`` header line becomes a column as is, so a new sweep dimension
+    only needs to be printed there. Dimensions a file does not record are ``"-"``.
+    The CPU topology travels in ``df.attrs["topology"]``.
+    """
+    text = Path(filename).read_text(encoding="utf-8", errors="ignore")
+    frames = []
+    for op, title in SWEEP_SECTIONS.items():
+        data = parse_sweep_section(text, title)
+        if data.empty:
+            continue
+        section = _sweep_section_text(text, title)
+        dims = {"Host": host or Path(filename).stem, "Op": op}
+        size = re.search(r"^Data size:\s*([\d.]+)\s*MB", section, re.MULTILINE)
+        if size:
+            dims["DataSizeMB"] = float(size.group(1))
+        line = re.search(r"^Dimensions:\s*(.+)$", section, re.MULTILINE)
+        for key, value in re.findall(r"(\w+)=([^,]+)", line.group(1) if line else ""):
+            value = value.strip()
+            dims[key] = float(value) if re.fullmatch(r"[\d.]+", value) else value
+        frames.append(data.assign(**dims))
+    return tidy_sweeps(frames, {"topology": parse_topology(filename)})
+
+
+def tidy_sweeps(frames: list[pd.DataFrame], attrs: Optional[dict] = None) -> pd.DataFrame:
+    """Concatenate sweep frames into the tidy schema: SWEEP_DIMENSIONS first, extra dimensions, then measures."""
+    data = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=SWEEP_COLUMNS)
+    for dim in SWEEP_DIMENSIONS:
+        if dim not in data.columns:
+            data[dim] = "-"
+    data = data.fillna({dim: "-" for dim in SWEEP_DIMENSIONS})
+    measures = [c for c in SWEEP_MEASURES if c in data.columns]
+    extra = [c for c in data.columns if c not in SWEEP_DIMENSIONS and c not in measures]
+    data = data[list(SWEEP_DIMENSIONS) + extra + measures]
+    data.attrs.update(attrs or {})
+    return data
+
+
+def sweep_dimensions(data: pd.DataFrame) -> list[str]:
+    """Dimension columns of a tidy sweep frame: the standard ones plus any extra ``Dimensions:`` keys."""
+    return [c for c in data.columns if c not in SWEEP_MEASURES]
 
 
 def parse_mylib_results(filename: Path) -> Tuple[pd.DataFrame, pd.DataFrame]:
@@ -34,47 +168,118 @@ def parse_mylib_results(filename: Path) -> Tuple[pd.DataFrame, pd.DataFrame]:
     Returns two DataFrames with columns: Threads, ChunkMB (float), Throughput.
     """
     text = Path(filename).read_text(encoding="utf-8", errors="ignore")
+    return (
+        parse_sweep_section(text, "ENCRYPTION THREAD/CHUNK SWEEP"),
+        parse_sweep_section(text, "DECRYPTION THREAD/CHUNK SWEEP"),
+    )
+
+
+def parse_bandwidth_results(filename: Path) -> pd.DataFrame:
+    """Parse the memcpy baseline (=== MEMORY BANDWIDTH THREAD/CHUNK SWEEP ===) recorded next to the cipher sweeps."""
+    text = Path(filename).read_text(encoding="utf-8", errors="ignore")
+    return parse_sweep_section(text, "MEMORY BANDWIDTH THREAD/CHUNK SWEEP")
 
-    enc_sec = re.search(r"===\s*ENCRYPTION THREAD/CHUNK SWEEP\s*===(.*?)(?===|\Z)", text, re.DOTALL)
-    dec_sec = re.search(r"===\s*DECRYPTION THREAD/CHUNK SWEEP\s*===(.*?)(?===|\Z)", text, re.DOTALL)
 
-    def extract(section: Optional[re.Match]) -> pd.DataFrame:
-        if not section:
-            return pd.DataFrame(columns=["Threads", "ChunkMB", "Throughput"])
-        body = section.group(1)
-        # threads | chunk (can be decimal) | throughput (decimal)
-        pat = re.compile(r"(\d+)\s*\|\s*([\d.]+)\s*\|\s*([\d.]+)")
-        rows = []
-        for th, ch, thr in pat.findall(body):
-            rows.append({"Threads": int(th), "ChunkMB": float(ch), "Throughput": float(thr)})
-        return pd.DataFrame(rows)
+def parse_cache_sizes(filename: Path) -> dict[str, int]:
+    """Parse the first ``Cache: L1d 48K, L2 2048K, L3 30720K`` line into bytes per level (e.g. {"L2": 2097152})."""
+    text = Path(filename).read_text(encoding="utf-8", errors="ignore")
+    line = re.search(r"^Cache:\s*(.+)$", text, re.MULTILINE)
+    if not line:
+        return {}
+    units = {"K": 1024, "M": 1024 * 1024, "G": 1024 * 1024 * 1024}
+    sizes = {}
+    for level, suffix, value, unit in re.findall(r"L(\d)(d?)\s+(\d+)([KMG])", line.group(1)):
+        sizes.setdefault(f"L{level}{suffix}", int(value) * units[unit])
+    return sizes
+
+
+def parse_topology(filename: Path) -> dict[str, int]:
+    """Parse the first ``Topology: logicalProcessors=32, physicalCores=24, ...`` line written by PerformanceTests."""
+    text = Path(filename).read_text(encoding="utf-8", errors="ignore")
+    line = re.search(r"^Topology:\s*(.+)$", text, re.MULTILINE)
+    if not line:
+        return {}
+    return {key: int(value) for key, value in re.findall(r"(\w+)=(\d+)", line.group(1)) if key in TOPOLOGY_KEYS}
 
-    return extract(enc_sec), extract(dec_sec)
 
+def topology_from_environment(environment: dict) -> dict[str, int]:
+    """Pick the topology fields out of a Cotton.Benchmark run document ``environment`` block."""
+    return {key: int(environment[key]) for key in TOPOLOGY_KEYS if str(environment.get(key, "")).isdigit()}
 
-def parse_test_results(filename: str | Path) -> Tuple[pd.DataFrame, pd.DataFrame]:
-    """Parse encryption/decryption sweep results from a file.
 
-    Thin alias kept for the standalone scripts; delegates to parse_mylib_results
-    so all scripts share a single, decimal-aware parser implementation.
-    """
-    return parse_mylib_results(Path(filename))
+def with_e_core_weight(topology: dict[str, int], e_core_weight: Optional[float]) -> dict:
+    """Return ``topology`` carrying an explicit E-core weight (``eCoreWeight``) for the core budget."""
+    return {**topology, "eCoreWeight": e_core_weight} if topology and e_core_weight is not None else topology
 
 
-def parse_openssl_results(filename: Path) -> pd.DataFrame:
-    """Parse OpenSSL 'speed -evp aes-128-gcm' output.
+def core_budget(threads: float, topology: dict, e_core_weight: Optional[float] = None) -> float:
+    """Ideal speedup of ``threads`` busy workers on the host's real cores.
+
+    Workers fill P-cores (all physical cores on non-hybrid parts) first at weight 1,
+    then E-cores at ``e_core_weight`` (default: the topology's ``eCoreWeight``, else
+    the assumed E_CORE_WEIGHT); SMT siblings add no core budget. Without a topology
+    this falls back to the naive ``y = x`` line.
+    """
+    if e_core_weight is None:
+        e_core_weight = topology.get("eCoreWeight", E_CORE_WEIGHT)
+    physical = topology.get("physicalCores")
+    if not physical:
+        return float(threads)
+    efficiency = topology.get("efficiencyCores", 0)
+    performance = topology.get("performanceCores", physical) if efficiency else physical
+    return min(threads, performance) + e_core_weight * min(max(threads - performance, 0), efficiency)
+
+
+def core_budget_label(topology: dict) -> str:
+    """Legend text for the core-budget ideal line; names the E-core weight on hybrid CPUs."""
+    if not topology.get("efficiencyCores"):
+        return "Ideal (core budget)"
+    weight = topology.get("eCoreWeight", E_CORE_WEIGHT)
+    source = "assumed" if "eCoreWeight" not in topology else "--e-core-weight"
+    return f"Ideal (core budget, E-core weight {weight:g} {source})"
+
+
+def topology_knees(topology: dict[str, int]) -> list[Tuple[int, str]]:
+    """Thread counts past which workers land on weaker resources: E-cores, SMT siblings, oversubscription."""
+    physical = topology.get("physicalCores")
+    if not physical:
+        return []
+    knees = {}
+    if topology.get("efficiencyCores"):
+        knees[topology["performanceCores"]] = "E-core knee"
+    if topology.get("threadsPerCore", 1) > 1:
+        knees[physical] = "SMT knee"
+    logical = topology.get("logicalProcessors", physical)
+    knees.setdefault(logical, "oversubscribed")
+    return sorted(knees.items())
+
+
+def mark_topology_knees(ax, topology: dict[str, int], max_threads: float) -> None:
+    """Draw the topology knees that fall inside a thread-sweep axis."""
+    for threads, label in topology_knees(topology):
+        if threads > max_threads:
+            continue
+        ax.axvline(threads, color="purple", linestyle=":", linewidth=1.5, alpha=0.8)
+        ax.annotate(f"{label} ({threads})", (threads, 1), xycoords=("data", "axes fraction"), xytext=(3, -12),
+                    textcoords="offset points", color="purple", fontsize=8, rotation=90, va="top")
+
+
+def parse_openssl_results(filename: Path, algorithm: str = "AES-128-GCM") -> pd.DataFrame:
+    """Parse OpenSSL 'speed -evp <algorithm>' output (aes-128-gcm by default, or e.g. sha256).
 
     Returns DataFrame with columns: BlockBytes, ThroughputMBps, Label.
     ThroughputMBps is decimal MB/s (1 MB = 1,000,000 bytes).
     """
     text = Path(filename).read_text(encoding="utf-8", errors="ignore")
+    name = re.escape(algorithm)
+    label = f"OpenSSL {algorithm}"
     header_match = re.search(r"^type\s+((?:\d+\s+bytes\s+)+)\s*$", text, re.MULTILINE)
-    row_match = re.search(r"^AES-128-GCM\s+(.+?)\s*$", text, re.MULTILINE)
+    row_match = re.search(rf"^{name}\s+(.+?)\s*$", text, re.MULTILINE | re.IGNORECASE)
 
     if not header_match or not row_match:
-        # Fallback: gather from 'Doing ... on X size blocks' lines.
+        # Fallback: gather from 'Doing ... on X size blocks' lines ("ops in" on OpenSSL 3, "'s in" before).
         pat2 = re.compile(
-            r"on\s+(\d+)\s+size blocks:\s*(\d+)\s+AES-128-GCM ops in\s+([\d.]+)s",
+            rf"on\s+(\d+)\s+size blocks:\s*(\d+)\s+{name}(?:\s+ops|'s)\s+in\s+([\d.]+)s",
             re.IGNORECASE,
         )
         data = []
@@ -83,8 +288,8 @@ def parse_openssl_results(filename: Path) -> pd.DataFrame:
             ops = int(m.group(2))
             secs = float(m.group(3))
             mbps = ops * block / secs / 1_000_000.0
-            data.append({"BlockBytes": block, "ThroughputMBps": mbps, "Label": "OpenSSL AES-128-GCM"})
-        return pd.DataFrame(sorted(data, key=lambda r: r["BlockBytes"]))
+            data.append({"BlockBytes": block, "ThroughputMBps": mbps, "Label": label})
+        return pd.DataFrame(sorted(data, key=lambda r: r["BlockBytes"]), columns=["BlockBytes", "ThroughputMBps", "Label"])
 
     sizes_str = header_match.group(1)
     size_vals = [int(x) for x in re.findall(r"(\d+)\s+bytes", sizes_str)]
@@ -93,82 +298,422 @@ def parse_openssl_results(filename: Path) -> pd.DataFrame:
     size_vals, row_vals = size_vals[:n], row_vals[:n]
     mbps = [v / 1000.0 for v in row_vals]
     df = pd.DataFrame(
-        {"BlockBytes": size_vals, "ThroughputMBps": mbps, "Label": ["OpenSSL AES-128-GCM"] * n}
+        {"BlockBytes": size_vals, "ThroughputMBps": mbps, "Label": [label] * n}
     )
     return df.sort_values("BlockBytes").reset_index(drop=True)
 
 
+def parse_benchmark_run(filename: Path) -> pd.DataFrame:
+    """Parse a Cotton.Benchmark run document (scratch or --update-baseline output).
+
+    Returns one row per succeeded benchmark with a Name column plus every numeric
+    and text metric as its own column. Document-level fields (mode, profile,
+    hardwareKey, gitCommit, createdAtUtc, environment) are kept in ``df.attrs``.
+    """
+    doc = json.loads(Path(filename).read_text(encoding="utf-8-sig"))
+    rows = []
+    for result in doc.get("results", []):
+        if not result.get("succeeded"):
+            continue
+        row = {"Name": result.get("name", "")}
+        row.update(result.get("textMetrics") or {})
+        row.update(result.get("numericMetrics") or {})
+        rows.append(row)
+
+    df = pd.DataFrame(rows)
+    df.attrs.update({key: doc.get(key) for key in ("mode", "profile", "hardwareKey", "gitCommit", "createdAtUtc")})
+    df.attrs["environment"] = doc.get("environment") or {}
+    return df
+
+
+def find_latest_run(mode: str, *directories: Path) -> Optional[Path]:
+    """Return the newest run document for the given benchmark mode, or None."""
+    candidates = []
+    for directory in directories or (BENCHMARK_RESULTS_DEFAULT, PERFORMANCE_RESULTS_DEFAULT):
+        if Path(directory).is_dir():
+            candidates.extend(p for p in Path(directory).glob(f"*.{mode}.*.json") if not p.name.endswith(".storage-paths.json"))
+    return max(candidates, key=lambda p: p.stat().st_mtime) if candidates else None
+
+
+def _beta_continued_fraction(a: float, b: float, x: float) -> float:
+    """Lentz continued fraction for the regularized incomplete beta function."""
+    tiny = 1e-300
+    qab, qap, qam = a + b, a + 1.0, a - 1.0
+    c, d = 1.0, 1.0 - qab * x / qap
+    d = 1.0 / (d if abs(d) > tiny else tiny)
+    h = d
+    for m in range(1, 300):
+        m2 = 2 * m
+        aa = m * (b - m) * x / ((qam + m2) * (a + m2))
+        d = 1.0 + aa * d
+        d = 1.0 / (d if abs(d) > tiny else tiny)
+        c = 1.0 + aa / c
+        c = c if abs(c) > tiny else tiny
+        h *= d * c
+        aa = -(a + m) * (qab + m) * x / ((a + m2) * (qap + m2))
+        d = 1.0 + aa * d
+        d = 1.0 / (d if abs(d) > tiny else tiny)
+        c = 1.0 + aa / c
+        c = c if abs(c) > tiny else tiny
+        delta = d * c
+        h *= delta
+        if abs(delta - 1.0) < 1e-12:
+            break
+    return h
+
+
+def regularized_incomplete_beta(a: float, b: float, x: float) -> float:
+    """I_x(a, b) without scipy; used for Student-t tail probabilities."""
+    if x <= 0.0:
+        return 0.0
+    if x >= 1.0:
+        return 1.0
+    log_front = math.lgamma(a + b) - math.lgamma(a) - math.lgamma(b) + a * math.log(x) + b * math.log1p(-x)
+    if x < (a + 1.0) / (a + b + 2.0):
+        return math.exp(log_front) * _beta_continued_fraction(a, b, x) / a
+    return 1.0 - math.exp(log_front) * _beta_continued_fraction(b, a, 1.0 - x) / b
+
+
+def welch_t_test(mean_a: float, std_a: float, n_a: int, mean_b: float, std_b: float, n_b: int) -> float:
+    """Two-sided Welch t-test p-value from summary statistics (NaN when either side has < 2 samples)."""
+    if n_a < 2 or n_b < 2:
+        return float("nan")
+    var_a, var_b = std_a ** 2 / n_a, std_b ** 2 / n_b
+    se2 = var_a + var_b
+    if se2 == 0.0:
+        return 1.0 if mean_a == mean_b else 0.0
+    t = (mean_b - mean_a) / math.sqrt(se2)
+    df = se2 ** 2 / (var_a ** 2 / (n_a - 1) + var_b ** 2 / (n_b - 1))
+    return regularized_incomplete_beta(df / 2.0, 0.5, df / (df + t * t))
+
+
+def detect_saturation(data: pd.DataFrame, x: str, y: str, by: list[str], threshold: float = 0.9) -> pd.DataFrame:
+    """Find where each curve stops paying for more x.
+
+    For every group in ``by`` the curve is sorted by ``x``; the knee is the
+    smallest x that already reaches ``threshold`` of the curve's peak. A curve
+    whose last point is more than 10% below its peak is flagged as collapsing
+    (more parallelism actively hurts).
+    Returns columns: *by, Peak, PeakAt, Knee, KneeValue, Collapses.
+    """
+    rows = []
+    for key, group in data.groupby(by, sort=True):
+        curve = group.sort_values(x)
+        peak_idx = curve[y].idxmax()
+        peak = curve.loc[peak_idx, y]
+        knee_row = curve[curve[y] >= peak * threshold].iloc[0]
+        key = key if isinstance(key, tuple) else (key,)
+        rows.append({
+            **dict(zip(by, key)),
+            "Peak": peak,
+            "PeakAt": curve.loc[peak_idx, x],
+            "Knee": knee_row[x],
+            "KneeValue": knee_row[y],
+            "Collapses": bool(curve[y].iloc[-1] < peak * 0.9),
+        })
+    return pd.DataFrame(rows)
+
+
+def detect_change_points(values, penalty: Optional[float] = None, min_size: int = 2) -> list[int]:
+    """Binary segmentation for mean shifts; returns the indices where new segments start.
+
+    A split is kept when it lowers the within-segment squared error by more than
+    ``penalty``. The default is a BIC-style ``3 * sigma^2 * ln(n)``, with sigma
+    estimated robustly from the MAD of first differences so that step changes do
+    not inflate it.
+    """
+    y = np.asarray(values, dtype=float)
+    n = len(y)
+    if n < 2 * min_size:
+        return []
+    if penalty is None:
+        diffs = np.diff(y)
+        sigma = np.median(np.abs(diffs - np.median(diffs))) / 0.6745 / math.sqrt(2)
+        if sigma == 0:
+            sigma = max(float(np.std(y)) * 0.1, 1e-9)
+        penalty = 3 * sigma ** 2 * math.log(n)
+
+    def cost(a: int, b: int) -> float:
+        segment = y[a:b]
+        return float(((segment - segment.mean()) ** 2).sum())
+
+    change_points = []
+    stack = [(0, n)]
+    while stack:
+        a, b = stack.pop()
+        if b - a < 2 * min_size:
+            continue
+        total = cost(a, b)
+        gain, split = max((total - cost(a, k) - cost(k, b), k) for k in range(a + min_size, b - min_size + 1))
+        if gain > penalty:
+            change_points.append(split)
+            stack.extend([(a, split), (split, b)])
+    return sorted(change_points)
+
+
+def lttb_indices(x, y, threshold: int) -> np.ndarray:
+    """Largest-Triangle-Three-Buckets downsampling; returns the indices of the points to keep.
+
+    The first and last points are always kept. Each bucket in between keeps the
+    point forming the largest triangle with the previously kept point and the mean
+    of the next bucket, so peaks and steps survive while flat runs collapse.
+    ``x`` must be sorted.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+    every = (n - 2) / (threshold - 2)
+    keep = [0]
+    a = 0
+    for i in range(threshold - 2):
+        start, end = int(i * every) + 1, int((i + 1) * every) + 1
+        next_end = min(int((i + 2) * every) + 1, n)
+        avg_x, avg_y = x[end:next_end].mean(), y[end:next_end].mean()
+        area = np.abs((x[a] - avg_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + int(np.argmax(area))
+        keep.append(a)
+    keep.append(n - 1)
+    return np.asarray(keep)
+
+
+def format_bytes(value: float) -> str:
+    """Format a byte count with binary units (512B, 64K, 1M, ...)."""
+    for unit in ("B", "K", "M"):
+        if abs(value) < 1024:
+            return f"{value:g}{unit}"
+        value /= 1024
+    return f"{value:g}G"
+
+
+# --- Facet/panel engine over tidy sweeps --------------------------------------
+
+# Axis title and legend format per dimension; "short" is used by compact panels.
+DIMENSION_STYLES = {
+    "Threads": {"axis": "Number of Threads", "legend": "{:g} threads", "short": "{:g}T", "colors": THREAD_HEX_COLORS},
+    "ChunkMB": {"axis": "Chunk Size (MB)", "legend": "{:g}MB", "short": "{:g}MB", "colors": CHUNK_HEX_COLORS, "title": "Chunk Size",
+                "log2": True},
+    "DataSizeMB": {"axis": "Data Size (MB)", "legend": "{:g}MB data", "short": "{:g}MB"},
+    "Op": {"axis": "Operation", "legend": "{}", "short": "{}", "order": list(SWEEP_SECTIONS),
+           "colors": {"Encrypt": "#1f77b4", "Decrypt": "#d62728", "Memcpy": "#7f7f7f"}},
+    # Batch mode overlays a dozen or more machines; tab20 keeps their lines apart.
+    "Host": {"axis": "Host", "legend": "{}", "short": "{}", "colors": [plt.get_cmap("tab20")(i) for i in range(20)]},
+}
+MEASURE_LABELS = {"Throughput": "Throughput (MB/s)", "Speedup": "Speedup Factor", "Efficiency": "Efficiency vs core budget (%)"}
+OP_MARKERS = {"Encrypt": "o", "Decrypt": "s", "Memcpy": "^"}
+PANEL_STYLES = {
+    "full": {"linewidth": 2.5, "markersize": 8, "fontsize": 12, "title_size": 14, "legend": {"frameon": True, "fancybox": True}},
+    "compact": {"linewidth": 1.5, "markersize": 4, "fontsize": 10, "title_size": 12, "legend": {"ncol": 2, "fontsize": 8}},
+}
+
+
+@dataclass
+class Panel:
+    """One declarative panel: ``y`` against dimension ``x``, one series per level of ``series``.
+
+    ``where`` fixes dimensions (a value or a list of allowed values); any other
+    dimension that still varies is folded with ``agg``. ``kind`` is "line", "bar"
+    (grouped bars, ``errorbars`` adds the std of the folded cells) or "heatmap"
+    (``series`` on the vertical axis).
+    """
+
+    x: str
+    y: str = "Throughput"
+    series: Optional[str] = None
+    where: dict = field(default_factory=dict)
+    kind: str = "line"
+    agg: str = "mean"
+    title: Optional[str] = None
+    errorbars: bool = False
+    labels: bool = False
+
+
+def with_scaling(data: pd.DataFrame) -> pd.DataFrame:
+    """Add Speedup (vs the 1-thread cell with the same other dimensions) and Efficiency (% of the core budget)."""
+    others = [d for d in sweep_dimensions(data) if d not in ("Threads", "Samples")]
+    base = data[data["Threads"] == 1][others + ["Throughput"]].rename(columns={"Throughput": "_base"})
+    scaled = data.merge(base, on=others, how="left")
+    scaled["Speedup"] = scaled["Throughput"] / scaled["_base"]
+    topology = data.attrs.get("topology") or {}
+    scaled["Efficiency"] = scaled["Speedup"] / scaled["Threads"].map(lambda t: core_budget(t, topology)) * 100
+    scaled = scaled.drop(columns="_base")
+    scaled.attrs.update(data.attrs)
+    return scaled
+
+
+def select(data: pd.DataFrame, where: dict) -> pd.DataFrame:
+    """Rows whose dimensions match ``where`` (a value, or a list of allowed values, per dimension)."""
+    mask = pd.Series(True, index=data.index)
+    for dim, allowed in where.items():
+        mask &= data[dim].isin(allowed) if isinstance(allowed, (list, tuple, set)) else data[dim] == allowed
+    return data[mask]
+
+
+def _levels(data: pd.DataFrame, dim: str) -> list:
+    order = DIMENSION_STYLES.get(dim, {}).get("order", [])
+    return sorted(data[dim].unique(), key=lambda v: (order.index(v) if v in order else len(order), v))
+
+
+def _legend_label(dim: Optional[str], value, short: bool) -> str:
+    style = DIMENSION_STYLES.get(dim, {})
+    fmt = style.get("short" if short else "legend", f"{dim}={{}}" if dim else "{}")
+    return fmt.format(value)
+
+
+def _series_color(dim: Optional[str], value, index: int):
+    colors = DIMENSION_STYLES.get(dim, {}).get("colors")
+    if isinstance(colors, dict) and value in colors:
+        return colors[value]
+    palette = colors if isinstance(colors, list) else THREAD_HEX_COLORS
+    return palette[index % len(palette)]
+
+
+def draw_panel(ax, data: pd.DataFrame, panel: Panel, style: str = "full") -> None:
+    """Draw one Panel from already filtered data; decorations follow from the data, not from arguments.
+
+    Thread-count x axes get the topology knees from ``data.attrs["topology"]``, a
+    Speedup panel gets the core-budget ideal line and an Efficiency panel the 100% line.
+    """
+    s = PANEL_STYLES[style]
+    short = style == "compact"
+    keys = [panel.series] if panel.series else []
+    folded = data.groupby(keys + [panel.x], sort=True)[panel.y]
+    table = folded.agg(panel.agg)
+    x_levels = _levels(data, panel.x)
+
+    if panel.kind == "heatmap":
+        grid = table.unstack(panel.x).reindex(columns=x_levels)
+        ax.imshow(grid.values, cmap="viridis", aspect="auto")
+        ax.set_xticks(range(len(x_levels)))
+        ax.set_xticklabels([f"{v:g}" if isinstance(v, float) else str(v) for v in x_levels])
+        ax.set_yticks(range(len(grid.index)))
+        ax.set_yticklabels([str(v) for v in grid.index])
+        ax.set_ylabel(DIMENSION_STYLES.get(panel.series, {}).get("axis", panel.series or ""), fontsize=s["fontsize"])
+        for i in range(grid.shape[0]):
+            for j in range(grid.shape[1]):
+                if not np.isnan(grid.values[i, j]):
+                    ax.text(j, i, f"{grid.values[i, j]:.0f}", ha="center", va="center", color="white", fontsize=8, fontweight="bold")
+    else:
+        series_levels = _levels(data, panel.series) if panel.series else [None]
+        width = 0.8 / len(series_levels)
+        for i, level in enumerate(series_levels):
+            values = table.loc[level] if panel.series else table
+            color = _series_color(panel.series, level, i)
+            label = _legend_label(panel.series, level, short) if panel.series else None
+            if panel.kind == "bar":
+                positions = np.arange(len(x_levels)) + (i - (len(series_levels) - 1) / 2) * width
+                heights = values.reindex(x_levels)
+                errors = folded.std().loc[level].reindex(x_levels) if panel.errorbars and panel.series else None
+                ax.bar(positions, heights, width, yerr=errors, label=label, alpha=0.8, capsize=5 if panel.errorbars else 0, color=color)
+                if panel.labels:
+                    for x, h in zip(positions, heights):
+                        ax.annotate(f"{h:.0f}", (x, h), xytext=(0, 3), textcoords="offset points", ha="center", va="bottom", fontsize=8)
+            else:
+                op = level if panel.series == "Op" else panel.where.get("Op")
+                marker = OP_MARKERS.get(op, "o") if isinstance(op, str) else "o"
+                ax.plot(values.index, values.values, marker=marker, label=label, color=color,
+                        linewidth=s["linewidth"], markersize=s["markersize"])
+        if panel.kind == "bar":
+            ax.set_xticks(np.arange(len(x_levels)))
+            ax.set_xticklabels([f"{v:g}" if isinstance(v, float) else str(v) for v in x_levels])
+        elif len(x_levels) <= 12 and pd.api.types.is_numeric_dtype(data[panel.x]):
+            if DIMENSION_STYLES.get(panel.x, {}).get("log2"):
+                ax.set_xscale("log", base=2)
+            ax.set_xticks(x_levels)
+            ax.set_xticklabels([f"{v:g}" for v in x_levels])
+        ax.set_ylabel(MEASURE_LABELS.get(panel.y, panel.y), fontsize=s["fontsize"], fontweight="bold" if not short else None)
+
+    topology = data.attrs.get("topology") or {}
+    if panel.kind == "line" and panel.x == "Threads":
+        threads = np.asarray(x_levels, dtype=float)
+        if panel.y == "Speedup":
+            ideal = [core_budget(t, topology) for t in threads]
+            ax.plot(threads, ideal, "--", alpha=0.7, color="gray", label=core_budget_label(topology) if topology else "Ideal Linear Scaling")
+        if panel.y == "Efficiency":
+            ax.axhline(y=100, color="gray", linestyle="--", alpha=0.7, label="Perfect Efficiency")
+            if topology:
+                ax.annotate(core_budget_label(topology), (0, 0), xycoords="axes fraction", xytext=(4, 4),
+                            textcoords="offset points", fontsize=8, color="gray")
+        if topology:
+            mark_topology_knees(ax, topology, threads.max())
+
+    ax.set_xlabel(DIMENSION_STYLES.get(panel.x, {}).get("axis", panel.x), fontsize=s["fontsize"], fontweight="bold" if not short else None)
+    if panel.title:
+        ax.set_title(panel.title, fontsize=s["title_size"], fontweight="bold")
+    if (panel.series and panel.kind != "heatmap") or panel.y == "Speedup":
+        ax.legend(title=DIMENSION_STYLES.get(panel.series, {}).get("title") if not short else None, **s["legend"])
+    ax.grid(True, alpha=0.3)
+
+
+def draw_panels(axes, data: pd.DataFrame, panels: list[Panel], style: str = "full") -> None:
+    """Draw each Panel on the matching axis of a hand-laid-out figure."""
+    for ax, panel in zip(axes, panels):
+        draw_panel(ax, select(data, panel.where), panel, style)
+
+
+def facet_grid(data: pd.DataFrame, panel: Panel, row: Optional[str] = None, col: Optional[str] = None,
+               style: str = "compact", title: Optional[str] = None, sharey: bool = False):
+    """Repeat ``panel`` for every level of ``row`` x ``col``; the data is grouped once for the whole grid."""
+    data = select(data, panel.where)
+    rows = _levels(data, row) if row else [None]
+    cols = _levels(data, col) if col else [None]
+    fig, axes = plt.subplots(len(rows), len(cols), figsize=(6 * len(cols), 4.5 * len(rows)), squeeze=False, sharey=sharey)
+    fig.suptitle(title or f"{MEASURE_LABELS.get(panel.y, panel.y)} by {panel.x}", fontsize=16, fontweight="bold")
+    keys = [dim for dim in (row, col) if dim]
+    groups = dict(iter(data.groupby(keys, sort=False))) if keys else {(): data}
+    for i, r in enumerate(rows):
+        for j, c in enumerate(cols):
+            ax = axes[i, j]
+            subset = groups.get(tuple(v for v, dim in ((r, row), (c, col)) if dim))
+            if subset is None:
+                ax.set_visible(False)
+                continue
+            facet_title = ", ".join(_legend_label(dim, v, False) for v, dim in ((r, row), (c, col)) if dim)
+            draw_panel(ax, subset, Panel(**{**panel.__dict__, "title": facet_title or panel.title}), style)
+    fig.tight_layout(rect=(0, 0, 1, 0.96))
+    return fig
+
+
+# Throughput vs chunk size (one line per thread count) and vs threads (one line per chunk size) for both ciphers.
+THROUGHPUT_PANELS = [
+    Panel(x="ChunkMB", series="Threads", where={"Op": "Encrypt"}, title="Encryption: Throughput vs Chunk Size"),
+    Panel(x="ChunkMB", series="Threads", where={"Op": "Decrypt"}, title="Decryption: Throughput vs Chunk Size"),
+    Panel(x="Threads", series="ChunkMB", where={"Op": "Encrypt"}, title="Encryption: Throughput vs Threads"),
+    Panel(x="Threads", series="ChunkMB", where={"Op": "Decrypt"}, title="Decryption: Throughput vs Threads"),
+]
+CIPHER_OPS = ["Encrypt", "Decrypt"]
+
+
+def best_cell(sweeps: pd.DataFrame, op: str) -> pd.Series:
+    """Fastest cell of one op."""
+    data = select(sweeps, {"Op": op})
+    return data.loc[data["Throughput"].idxmax()]
+
+
+def _mid_chunk(sweeps: pd.DataFrame) -> float:
+    chunks = sorted(sweeps["ChunkMB"].unique())
+    return chunks[len(chunks) // 2]
+
+
 # --- Simple 4-panel figure (performance_charts.png) ---------------------------
 
 
-def create_simple_plots(encrypt_data: pd.DataFrame, decrypt_data: pd.DataFrame):
-    """Build the polished 4-panel throughput figure and return the Figure."""
+def create_simple_plots(sweeps: pd.DataFrame):
+    """Build the polished 4-panel throughput figure from tidy sweeps and return the Figure."""
     plt.rcParams["figure.facecolor"] = "white"
     plt.rcParams["axes.facecolor"] = "white"
     plt.rcParams["axes.grid"] = True
     plt.rcParams["grid.alpha"] = 0.3
 
-    fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(16, 12))
+    fig, axes = plt.subplots(2, 2, figsize=(16, 12))
     fig.suptitle(
         "Performance Analysis: Encryption/Decryption Throughput",
         fontsize=16, fontweight="bold", y=0.98,
     )
+    draw_panels(axes.flat, sweeps, THROUGHPUT_PANELS)
 
-    chunk_colors = ["#e41a1c", "#377eb8", "#4daf4a", "#984ea3", "#ff7f00", "#ffff33", "#a65628"]
-
-    unique_threads = sorted(encrypt_data["Threads"].unique())
-    chunk_ticks = sorted(encrypt_data["ChunkMB"].unique())
-    unique_chunks = chunk_ticks
-
-    for i, threads in enumerate(unique_threads):
-        d = encrypt_data[encrypt_data["Threads"] == threads].sort_values("ChunkMB")
-        ax1.plot(d["ChunkMB"], d["Throughput"], marker="o", label=f"{threads} threads",
-                 linewidth=2.5, markersize=8, color=THREAD_HEX_COLORS[i % len(THREAD_HEX_COLORS)])
-    ax1.set_xlabel("Chunk Size (MB)", fontsize=12, fontweight="bold")
-    ax1.set_ylabel("Throughput (MB/s)", fontsize=12, fontweight="bold")
-    ax1.set_title("Encryption: Throughput vs Chunk Size", fontsize=14, fontweight="bold")
-    ax1.legend(frameon=True, fancybox=True, shadow=True)
-    ax1.grid(True, alpha=0.3, linestyle="-", linewidth=0.5)
-    ax1.set_xticks(chunk_ticks)
-    ax1.set_xticklabels([f"{int(x)}" for x in chunk_ticks])
-
-    for i, threads in enumerate(unique_threads):
-        d = decrypt_data[decrypt_data["Threads"] == threads].sort_values("ChunkMB")
-        ax2.plot(d["ChunkMB"], d["Throughput"], marker="s", label=f"{threads} threads",
-                 linewidth=2.5, markersize=8, color=THREAD_HEX_COLORS[i % len(THREAD_HEX_COLORS)])
-    ax2.set_xlabel("Chunk Size (MB)", fontsize=12, fontweight="bold")
-    ax2.set_ylabel("Throughput (MB/s)", fontsize=12, fontweight="bold")
-    ax2.set_title("Decryption: Throughput vs Chunk Size", fontsize=14, fontweight="bold")
-    ax2.legend(frameon=True, fancybox=True, shadow=True)
-    ax2.grid(True, alpha=0.3, linestyle="-", linewidth=0.5)
-    ax2.set_xticks(chunk_ticks)
-    ax2.set_xticklabels([f"{int(x)}" for x in chunk_ticks])
-
-    for i, chunk_size in enumerate(unique_chunks):
-        d = encrypt_data[encrypt_data["ChunkMB"] == chunk_size].sort_values("Threads")
-        ax3.plot(d["Threads"], d["Throughput"], marker="o", label=f"{int(chunk_size)}MB",
-                 linewidth=2.5, markersize=8, color=chunk_colors[i % len(chunk_colors)])
-    ax3.set_xlabel("Number of Threads", fontsize=12, fontweight="bold")
-    ax3.set_ylabel("Throughput (MB/s)", fontsize=12, fontweight="bold")
-    ax3.set_title("Encryption: Throughput vs Threads", fontsize=14, fontweight="bold")
-    ax3.legend(frameon=True, fancybox=True, shadow=True, title="Chunk Size")
-    ax3.grid(True, alpha=0.3, linestyle="-", linewidth=0.5)
-    ax3.set_xticks(unique_threads)
-    ax3.set_xticklabels([str(int(x)) for x in unique_threads])
-
-    for i, chunk_size in enumerate(unique_chunks):
-        d = decrypt_data[decrypt_data["ChunkMB"] == chunk_size].sort_values("Threads")
-        ax4.plot(d["Threads"], d["Throughput"], marker="s", label=f"{int(chunk_size)}MB",
-                 linewidth=2.5, markersize=8, color=chunk_colors[i % len(chunk_colors)])
-    ax4.set_xlabel("Number of Threads", fontsize=12, fontweight="bold")
-    ax4.set_ylabel("Throughput (MB/s)", fontsize=12, fontweight="bold")
-    ax4.set_title("Decryption: Throughput vs Threads", fontsize=14, fontweight="bold")
-    ax4.legend(frameon=True, fancybox=True, shadow=True, title="Chunk Size")
-    ax4.grid(True, alpha=0.3, linestyle="-", linewidth=0.5)
-    ax4.set_xticks(unique_threads)
-    ax4.set_xticklabels([str(int(x)) for x in unique_threads])
-
-    for ax in (ax1, ax2, ax3, ax4):
+    for ax in axes.flat:
         ax.spines["top"].set_visible(False)
         ax.spines["right"].set_visible(False)
         ax.spines["left"].set_linewidth(0.5)
@@ -181,126 +726,32 @@ def create_simple_plots(encrypt_data: pd.DataFrame, decrypt_data: pd.DataFrame):
 # --- Advanced 6-panel figure (advanced_performance_analysis.png) --------------
 
 
-def create_advanced_plots(encrypt_data: pd.DataFrame, decrypt_data: pd.DataFrame):
+def create_advanced_plots(sweeps: pd.DataFrame):
     """Build the 6-panel advanced figure; return (fig, encrypt_optimal, decrypt_optimal)."""
     plt.style.use("seaborn-v0_8")
 
     fig = plt.figure(figsize=(20, 16))
     gs = fig.add_gridspec(3, 2, hspace=0.3, wspace=0.25)
-    ax1, ax2 = fig.add_subplot(gs[0, 0]), fig.add_subplot(gs[0, 1])
-    ax3, ax4 = fig.add_subplot(gs[1, 0]), fig.add_subplot(gs[1, 1])
-    ax5, ax6 = fig.add_subplot(gs[2, 0]), fig.add_subplot(gs[2, 1])
-
+    axes = [fig.add_subplot(gs[row, col]) for row in range(3) for col in range(2)]
     fig.suptitle("Complete Performance Analysis: Encryption/Decryption Throughput",
                  fontsize=18, fontweight="bold")
 
-    unique_threads = sorted(encrypt_data["Threads"].unique())
-    unique_chunks = sorted(encrypt_data["ChunkMB"].unique())
-    colors = plt.cm.Set1(np.linspace(0, 1, len(unique_threads)))
-    chunk_colors = plt.cm.tab10(np.linspace(0, 1, len(unique_chunks)))
-    chunk_ticks = unique_chunks
-
-    for i, threads in enumerate(unique_threads):
-        d = encrypt_data[encrypt_data["Threads"] == threads].sort_values("ChunkMB")
-        ax1.plot(d["ChunkMB"], d["Throughput"], marker="o", label=f"{threads} threads",
-                 linewidth=2.5, markersize=8, color=colors[i])
-    ax1.set_xlabel("Chunk Size (MB)", fontsize=12, fontweight="bold")
-    ax1.set_ylabel("Throughput (MB/s)", fontsize=12, fontweight="bold")
-    ax1.set_title("Encryption: Throughput vs Chunk Size", fontsize=14, fontweight="bold")
-    ax1.legend(bbox_to_anchor=(1.05, 1), loc="upper left")
-    ax1.grid(True, alpha=0.3)
-    ax1.set_xticks(chunk_ticks)
-    ax1.set_xticklabels([str(int(x)) for x in chunk_ticks])
-
-    for i, threads in enumerate(unique_threads):
-        d = decrypt_data[decrypt_data["Threads"] == threads].sort_values("ChunkMB")
-        ax2.plot(d["ChunkMB"], d["Throughput"], marker="s", label=f"{threads} threads",
-                 linewidth=2.5, markersize=8, color=colors[i])
-    ax2.set_xlabel("Chunk Size (MB)", fontsize=12, fontweight="bold")
-    ax2.set_ylabel("Throughput (MB/s)", fontsize=12, fontweight="bold")
-    ax2.set_title("Decryption: Throughput vs Chunk Size", fontsize=14, fontweight="bold")
-    ax2.legend(bbox_to_anchor=(1.05, 1), loc="upper left")
-    ax2.grid(True, alpha=0.3)
-    ax2.set_xticks(chunk_ticks)
-    ax2.set_xticklabels([str(int(x)) for x in chunk_ticks])
-
-    for i, chunk_size in enumerate(unique_chunks):
-        d = encrypt_data[encrypt_data["ChunkMB"] == chunk_size].sort_values("Threads")
-        ax3.plot(d["Threads"], d["Throughput"], marker="o", label=f"{chunk_size}MB",
-                 linewidth=2.5, markersize=8, color=chunk_colors[i])
-    ax3.set_xlabel("Number of Threads", fontsize=12, fontweight="bold")
-    ax3.set_ylabel("Throughput (MB/s)", fontsize=12, fontweight="bold")
-    ax3.set_title("Encryption: Throughput vs Threads", fontsize=14, fontweight="bold")
-    ax3.legend(bbox_to_anchor=(1.05, 1), loc="upper left")
-    ax3.grid(True, alpha=0.3)
-    ax3.set_xticks(unique_threads)
-    ax3.set_xticklabels([str(int(x)) for x in unique_threads])
-
-    for i, chunk_size in enumerate(unique_chunks):
-        d = decrypt_data[decrypt_data["ChunkMB"] == chunk_size].sort_values("Threads")
-        ax4.plot(d["Threads"], d["Throughput"], marker="s", label=f"{chunk_size}MB",
-                 linewidth=2.5, markersize=8, color=chunk_colors[i])
-    ax4.set_xlabel("Number of Threads", fontsize=12, fontweight="bold")
-    ax4.set_ylabel("Throughput (MB/s)", fontsize=12, fontweight="bold")
-    ax4.set_title("Decryption: Throughput vs Threads", fontsize=14, fontweight="bold")
-    ax4.legend(bbox_to_anchor=(1.05, 1), loc="upper left")
-    ax4.grid(True, alpha=0.3)
-    ax4.set_xticks(unique_threads)
-    ax4.set_xticklabels([str(int(x)) for x in unique_threads])
-
-    # Max per thread count (bar)
-    threads_comparison = []
-    for threads in unique_threads:
-        enc_max = encrypt_data[encrypt_data["Threads"] == threads]["Throughput"].max()
-        dec_max = decrypt_data[decrypt_data["Threads"] == threads]["Throughput"].max()
-        threads_comparison.append([threads, enc_max, dec_max])
-    threads_df = pd.DataFrame(threads_comparison, columns=["Threads", "Encrypt_Max", "Decrypt_Max"])
-    x = np.arange(len(threads_df))
-    width = 0.35
-    ax5.bar(x - width / 2, threads_df["Encrypt_Max"], width, label="Encryption", alpha=0.8, color="skyblue")
-    ax5.bar(x + width / 2, threads_df["Decrypt_Max"], width, label="Decryption", alpha=0.8, color="lightcoral")
-    ax5.set_xlabel("Number of Threads", fontsize=12, fontweight="bold")
-    ax5.set_ylabel("Max Throughput (MB/s)", fontsize=12, fontweight="bold")
-    ax5.set_title("Maximum Throughput Comparison by Thread Count", fontsize=14, fontweight="bold")
-    ax5.set_xticks(x)
-    ax5.set_xticklabels(threads_df["Threads"])
-    ax5.legend()
-    ax5.grid(True, alpha=0.3)
-    for i, (enc, dec) in enumerate(zip(threads_df["Encrypt_Max"], threads_df["Decrypt_Max"])):
-        ax5.text(i - width / 2, enc + 50, f"{enc:.0f}", ha="center", va="bottom", fontsize=10)
-        ax5.text(i + width / 2, dec + 50, f"{dec:.0f}", ha="center", va="bottom", fontsize=10)
-
-    # Scaling efficiency at mid chunk
-    baseline_enc = encrypt_data[encrypt_data["Threads"] == 1].groupby("ChunkMB")["Throughput"].mean()
-    baseline_dec = decrypt_data[decrypt_data["Threads"] == 1].groupby("ChunkMB")["Throughput"].mean()
-    mid_chunk = unique_chunks[len(unique_chunks) // 2]
-    enc_scaling, dec_scaling = [], []
-    for threads in unique_threads:
-        enc_th = encrypt_data[(encrypt_data["Threads"] == threads) & (encrypt_data["ChunkMB"] == mid_chunk)]["Throughput"].mean()
-        dec_th = decrypt_data[(decrypt_data["Threads"] == threads) & (decrypt_data["ChunkMB"] == mid_chunk)]["Throughput"].mean()
-        enc_scaling.append(enc_th / baseline_enc[mid_chunk])
-        dec_scaling.append(dec_th / baseline_dec[mid_chunk])
-    ax6.plot(unique_threads, enc_scaling, marker="o", linewidth=3, markersize=10, label="Encryption Scaling", color="blue")
-    ax6.plot(unique_threads, dec_scaling, marker="s", linewidth=3, markersize=10, label="Decryption Scaling", color="red")
-    ax6.plot(unique_threads, unique_threads, "--", alpha=0.7, color="gray", label="Ideal Linear Scaling")
-    ax6.set_xlabel("Number of Threads", fontsize=12, fontweight="bold")
-    ax6.set_ylabel("Speedup Factor", fontsize=12, fontweight="bold")
-    ax6.set_title(f"Scaling Efficiency (Chunk Size: {mid_chunk}MB)", fontsize=14, fontweight="bold")
-    ax6.legend()
-    ax6.grid(True, alpha=0.3)
-    ax6.set_xticks(unique_threads)
-    ax6.set_xticklabels([str(int(x)) for x in unique_threads])
+    mid_chunk = _mid_chunk(sweeps)
+    draw_panels(axes, with_scaling(sweeps), THROUGHPUT_PANELS + [
+        Panel(x="Threads", series="Op", where={"Op": CIPHER_OPS}, kind="bar", agg="max", labels=True,
+              title="Maximum Throughput Comparison by Thread Count"),
+        Panel(x="Threads", y="Speedup", series="Op", where={"Op": CIPHER_OPS, "ChunkMB": mid_chunk},
+              title=f"Scaling Efficiency (Chunk Size: {mid_chunk:g}MB)"),
+    ])
 
     plt.tight_layout()
-    encrypt_optimal = encrypt_data.loc[encrypt_data["Throughput"].idxmax()]
-    decrypt_optimal = decrypt_data.loc[decrypt_data["Throughput"].idxmax()]
-    return fig, encrypt_optimal, decrypt_optimal
+    return fig, best_cell(sweeps, "Encrypt"), best_cell(sweeps, "Decrypt")
 
 
 # --- Mega 12-panel figure (mega_performance_analysis.png) ---------------------
 
 
-def create_mega_analysis(encrypt_data: pd.DataFrame, decrypt_data: pd.DataFrame):
+def create_mega_analysis(sweeps: pd.DataFrame):
     """Build the 12-panel mega figure; return (fig, encrypt_best, decrypt_best)."""
     plt.style.use("default")
     if sns:
@@ -316,84 +767,19 @@ def create_mega_analysis(encrypt_data: pd.DataFrame, decrypt_data: pd.DataFrame)
     ax7, ax8, ax9 = fig.add_subplot(gs[2, 0]), fig.add_subplot(gs[2, 1]), fig.add_subplot(gs[2, 2])
     ax10, ax11 = fig.add_subplot(gs[3, 0]), fig.add_subplot(gs[3, 1])
 
-    unique_threads = sorted(encrypt_data["Threads"].unique())
-    unique_chunks = sorted(encrypt_data["ChunkMB"].unique())
-
-    colors = plt.cm.Set1(np.linspace(0, 1, len(unique_threads)))
-    chunk_colors = plt.cm.tab10(np.linspace(0, 1, len(unique_chunks)))
-
-    # 1-4: compact line plots
-    for i, threads in enumerate(unique_threads):
-        d = encrypt_data[encrypt_data["Threads"] == threads].sort_values("ChunkMB")
-        ax1.plot(d["ChunkMB"], d["Throughput"], marker="o", label=f"{threads}T", linewidth=1.5, markersize=4, color=colors[i])
-    ax1.set_title("Encrypt: Throughput vs Chunks", fontsize=12, fontweight="bold")
-    ax1.set_xlabel("Chunk Size (MB)")
-    ax1.set_ylabel("MB/s")
-    ax1.legend(ncol=2, fontsize=8)
-    ax1.grid(True, alpha=0.3)
-
-    for i, threads in enumerate(unique_threads):
-        d = decrypt_data[decrypt_data["Threads"] == threads].sort_values("ChunkMB")
-        ax2.plot(d["ChunkMB"], d["Throughput"], marker="s", label=f"{threads}T", linewidth=1.5, markersize=4, color=colors[i])
-    ax2.set_title("Decrypt: Throughput vs Chunks", fontsize=12, fontweight="bold")
-    ax2.set_xlabel("Chunk Size (MB)")
-    ax2.set_ylabel("MB/s")
-    ax2.legend(ncol=2, fontsize=8)
-    ax2.grid(True, alpha=0.3)
-
-    for i, chunk_size in enumerate(unique_chunks):
-        d = encrypt_data[encrypt_data["ChunkMB"] == chunk_size].sort_values("Threads")
-        ax3.plot(d["Threads"], d["Throughput"], marker="o", label=f"{int(chunk_size)}MB", linewidth=1.5, markersize=4, color=chunk_colors[i])
-    ax3.set_title("Encrypt: Throughput vs Threads", fontsize=12, fontweight="bold")
-    ax3.set_xlabel("Threads")
-    ax3.set_ylabel("MB/s")
-    ax3.legend(ncol=2, fontsize=8)
-    ax3.grid(True, alpha=0.3)
-
-    for i, chunk_size in enumerate(unique_chunks):
-        d = decrypt_data[decrypt_data["ChunkMB"] == chunk_size].sort_values("Threads")
-        ax4.plot(d["Threads"], d["Throughput"], marker="s", label=f"{int(chunk_size)}MB", linewidth=1.5, markersize=4, color=chunk_colors[i])
-    ax4.set_title("Decrypt: Throughput vs Threads", fontsize=12, fontweight="bold")
-    ax4.set_xlabel("Threads")
-    ax4.set_ylabel("MB/s")
-    ax4.legend(ncol=2, fontsize=8)
-    ax4.grid(True, alpha=0.3)
-
-    # 5: Heat map
-    encrypt_pivot = encrypt_data.pivot(index="Threads", columns="ChunkMB", values="Throughput")
-    decrypt_pivot = decrypt_data.pivot(index="Threads", columns="ChunkMB", values="Throughput")
-    combined_data = (encrypt_pivot + decrypt_pivot) / 2
-    ax5.imshow(combined_data.values, cmap="viridis", aspect="auto")
-    ax5.set_title("🔥 Performance Heat Map\n(Average Encrypt+Decrypt)", fontsize=12, fontweight="bold")
-    ax5.set_xlabel("Chunk Size (MB)")
-    ax5.set_ylabel("Threads")
-    ax5.set_xticks(range(len(unique_chunks)))
-    ax5.set_xticklabels([str(int(x)) for x in unique_chunks])
-    ax5.set_yticks(range(len(unique_threads)))
-    ax5.set_yticklabels([str(int(x)) for x in unique_threads])
-    for i in range(len(unique_threads)):
-        for j in range(len(unique_chunks)):
-            ax5.text(j, i, f"{combined_data.iloc[i, j]:.0f}", ha="center", va="center", color="white", fontsize=8, fontweight="bold")
-
-    # 6: Average performance by chunk size (bar)
-    encrypt_by_chunk = encrypt_data.groupby("ChunkMB")["Throughput"].agg(["mean", "std", "max", "min"])
-    decrypt_by_chunk = decrypt_data.groupby("ChunkMB")["Throughput"].agg(["mean", "std", "max", "min"])
-    x = np.arange(len(unique_chunks))
-    width = 0.35
-    bars1 = ax6.bar(x - width / 2, encrypt_by_chunk["mean"], width, yerr=encrypt_by_chunk["std"], label="Encrypt", alpha=0.8, capsize=5, color="skyblue")
-    bars2 = ax6.bar(x + width / 2, decrypt_by_chunk["mean"], width, yerr=decrypt_by_chunk["std"], label="Decrypt", alpha=0.8, capsize=5, color="lightcoral")
-    ax6.set_title("📊 Average Performance by Chunk Size", fontsize=12, fontweight="bold")
-    ax6.set_xlabel("Chunk Size (MB)")
-    ax6.set_ylabel("Average Throughput (MB/s)")
-    ax6.set_xticks(x)
-    ax6.set_xticklabels([str(int(x_)) for x_ in unique_chunks])
-    ax6.legend()
-    ax6.grid(True, alpha=0.3)
-    for i, (bar1, bar2) in enumerate(zip(bars1, bars2)):
-        ax6.text(bar1.get_x() + bar1.get_width() / 2, bar1.get_height() + 100,
-                 f'{encrypt_by_chunk.iloc[i]["mean"]:.0f}', ha="center", va="bottom", fontsize=8, rotation=45)
-        ax6.text(bar2.get_x() + bar2.get_width() / 2, bar2.get_height() + 100,
-                 f'{decrypt_by_chunk.iloc[i]["mean"]:.0f}', ha="center", va="bottom", fontsize=8, rotation=45)
+    encrypt_data = select(sweeps, {"Op": "Encrypt"})
+    decrypt_data = select(sweeps, {"Op": "Decrypt"})
+
+    # 1-6 and 8: declarative panels (lines, heat map, bars, scaling efficiency)
+    mid_chunk = _mid_chunk(sweeps)
+    draw_panels([ax1, ax2, ax3, ax4, ax5, ax6, ax8], with_scaling(sweeps), THROUGHPUT_PANELS + [
+        Panel(x="ChunkMB", series="Threads", where={"Op": CIPHER_OPS}, kind="heatmap",
+              title="🔥 Performance Heat Map\n(Average Encrypt+Decrypt)"),
+        Panel(x="ChunkMB", series="Op", where={"Op": CIPHER_OPS}, kind="bar", errorbars=True, labels=True,
+              title="📊 Average Performance by Chunk Size"),
+        Panel(x="Threads", y="Efficiency", series="Op", where={"Op": CIPHER_OPS, "ChunkMB": mid_chunk},
+              title=f"⚡ Scaling Efficiency ({mid_chunk:g}MB chunks)"),
+    ], style="compact")
 
     # 7: Violin distribution
     parts = ax7.violinplot([encrypt_data["Throughput"], decrypt_data["Throughput"]], positions=[1, 2], showmeans=True, showextrema=True)
@@ -406,41 +792,9 @@ def create_mega_analysis(encrypt_data: pd.DataFrame, decrypt_data: pd.DataFrame)
     ax7.set_xticklabels(["Encrypt", "Decrypt"])
     ax7.grid(True, alpha=0.3)
 
-    # 8: Scaling efficiency
-    baseline_threads = 1
-    scaling_data = []
-    for chunk_size in unique_chunks:
-        encrypt_baseline = encrypt_data[(encrypt_data["Threads"] == baseline_threads) & (encrypt_data["ChunkMB"] == chunk_size)]["Throughput"].iloc[0]
-        decrypt_baseline = decrypt_data[(decrypt_data["Threads"] == baseline_threads) & (decrypt_data["ChunkMB"] == chunk_size)]["Throughput"].iloc[0]
-        for threads in unique_threads:
-            encrypt_current = encrypt_data[(encrypt_data["Threads"] == threads) & (encrypt_data["ChunkMB"] == chunk_size)]["Throughput"].iloc[0]
-            decrypt_current = decrypt_data[(decrypt_data["Threads"] == threads) & (decrypt_data["ChunkMB"] == chunk_size)]["Throughput"].iloc[0]
-            scaling_data.append({
-                "Threads": threads,
-                "ChunkMB": chunk_size,
-                "Encrypt_Efficiency": (encrypt_current / encrypt_baseline) / threads * 100,
-                "Decrypt_Efficiency": (decrypt_current / decrypt_baseline) / threads * 100,
-            })
-    scaling_df = pd.DataFrame(scaling_data)
-    mid_chunk = unique_chunks[len(unique_chunks) // 2]
-    mid_data = scaling_df[scaling_df["ChunkMB"] == mid_chunk]
-    ax8.plot(mid_data["Threads"], mid_data["Encrypt_Efficiency"], marker="o", linewidth=3, markersize=8, label="Encrypt Efficiency", color="blue")
-    ax8.plot(mid_data["Threads"], mid_data["Decrypt_Efficiency"], marker="s", linewidth=3, markersize=8, label="Decrypt Efficiency", color="red")
-    ax8.axhline(y=100, color="gray", linestyle="--", alpha=0.7, label="Perfect Efficiency")
-    ax8.set_title(f"⚡ Scaling Efficiency ({mid_chunk}MB chunks)", fontsize=12, fontweight="bold")
-    ax8.set_xlabel("Number of Threads")
-    ax8.set_ylabel("Efficiency (%)")
-    ax8.legend()
-    ax8.grid(True, alpha=0.3)
-
     # 9: Speed ratios scatter
-    ratio_data = []
-    for _, encrypt_row in encrypt_data.iterrows():
-        decrypt_row = decrypt_data[(decrypt_data["Threads"] == encrypt_row["Threads"]) & (decrypt_data["ChunkMB"] == encrypt_row["ChunkMB"])]
-        if not decrypt_row.empty:
-            ratio = decrypt_row["Throughput"].iloc[0] / encrypt_row["Throughput"]
-            ratio_data.append({"Threads": encrypt_row["Threads"], "ChunkMB": encrypt_row["ChunkMB"], "Decrypt_Encrypt_Ratio": ratio})
-    ratio_df = pd.DataFrame(ratio_data)
+    ratio_df = (decrypt_data.set_index(["Threads", "ChunkMB"])["Throughput"]
+                / encrypt_data.set_index(["Threads", "ChunkMB"])["Throughput"]).dropna().rename("Decrypt_Encrypt_Ratio").reset_index()
     scatter = ax9.scatter(ratio_df["Threads"], ratio_df["ChunkMB"], c=ratio_df["Decrypt_Encrypt_Ratio"],
                           s=ratio_df["Decrypt_Encrypt_Ratio"] * 30, cmap="RdYlGn", alpha=0.7, edgecolors="black")
     ax9.set_title("🚀 Decrypt/Encrypt Speed Ratios", fontsize=12, fontweight="bold")
@@ -450,16 +804,11 @@ def create_mega_analysis(encrypt_data: pd.DataFrame, decrypt_data: pd.DataFrame)
     cbar.set_label("Decrypt/Encrypt Ratio", rotation=270, labelpad=15)
 
     # 10: Performance zones
-    encrypt_max = encrypt_data["Throughput"].max()
-    decrypt_max = decrypt_data["Throughput"].max()
-    high_perf_encrypt = encrypt_data[encrypt_data["Throughput"] > encrypt_max * 0.9]
-    medium_perf_encrypt = encrypt_data[(encrypt_data["Throughput"] > encrypt_max * 0.7) & (encrypt_data["Throughput"] <= encrypt_max * 0.9)]
-    high_perf_decrypt = decrypt_data[decrypt_data["Throughput"] > decrypt_max * 0.9]
-    medium_perf_decrypt = decrypt_data[(decrypt_data["Throughput"] > decrypt_max * 0.7) & (decrypt_data["Throughput"] <= decrypt_max * 0.9)]
-    ax10.scatter(high_perf_encrypt["Threads"], high_perf_encrypt["ChunkMB"], c="green", s=100, alpha=0.7, label="High Encrypt", marker="o")
-    ax10.scatter(medium_perf_encrypt["Threads"], medium_perf_encrypt["ChunkMB"], c="orange", s=80, alpha=0.7, label="Medium Encrypt", marker="o")
-    ax10.scatter(high_perf_decrypt["Threads"], high_perf_decrypt["ChunkMB"], c="darkgreen", s=100, alpha=0.7, label="High Decrypt", marker="s")
-    ax10.scatter(medium_perf_decrypt["Threads"], medium_perf_decrypt["ChunkMB"], c="darkorange", s=80, alpha=0.7, label="Medium Decrypt", marker="s")
+    for data, op, marker, colors in ((encrypt_data, "Encrypt", "o", ("green", "orange")), (decrypt_data, "Decrypt", "s", ("darkgreen", "darkorange"))):
+        share = data["Throughput"] / data["Throughput"].max()
+        high, medium = data[share > 0.9], data[(share > 0.7) & (share <= 0.9)]
+        ax10.scatter(high["Threads"], high["ChunkMB"], c=colors[0], s=100, alpha=0.7, label=f"High {op}", marker=marker)
+        ax10.scatter(medium["Threads"], medium["ChunkMB"], c=colors[1], s=80, alpha=0.7, label=f"Medium {op}", marker=marker)
     ax10.set_title("🎯 Performance Zones", fontsize=12, fontweight="bold")
     ax10.set_xlabel("Threads")
     ax10.set_ylabel("Chunk Size (MB)")
@@ -467,14 +816,14 @@ def create_mega_analysis(encrypt_data: pd.DataFrame, decrypt_data: pd.DataFrame)
     ax10.grid(True, alpha=0.3)
 
     # 11: Optimization suggestions table
-    encrypt_best = encrypt_data.loc[encrypt_data["Throughput"].idxmax()]
-    decrypt_best = decrypt_data.loc[decrypt_data["Throughput"].idxmax()]
+    encrypt_best = best_cell(sweeps, "Encrypt")
+    decrypt_best = best_cell(sweeps, "Decrypt")
     ax11.axis("off")
     recommendations = [
         ["🏆 BEST CONFIGURATIONS", "", ""],
         ["Operation", "Threads", "Chunk Size"],
-        ["Encryption", f"{encrypt_best['Threads']:.0f}", f"{encrypt_best['ChunkMB']:.0f}MB"],
-        ["Decryption", f"{decrypt_best['Threads']:.0f}", f"{decrypt_best['ChunkMB']:.0f}MB"],
+        ["Encryption", f"{encrypt_best['Threads']:.0f}", f"{encrypt_best['ChunkMB']:g}MB"],
+        ["Decryption", f"{decrypt_best['Threads']:.0f}", f"{decrypt_best['ChunkMB']:g}MB"],
         ["", "", ""],
         ["📈 PERFORMANCE INSIGHTS", "", ""],
         ["Avg Decrypt Speed", f"{decrypt_data['Throughput'].mean():.0f}", "MB/s"],
@@ -510,14 +859,14 @@ def create_mega_analysis(encrypt_data: pd.DataFrame, decrypt_data: pd.DataFrame)
 # --- OpenSSL comparison (openssl_comparison.png) ------------------------------
 
 
-def plot_openssl_comparison(enc: pd.DataFrame, dec: pd.DataFrame, ossl: pd.DataFrame, out_path: Path) -> None:
+def plot_openssl_comparison(sweeps: pd.DataFrame, ossl: pd.DataFrame, out_path: Path) -> None:
     """Compare CottonCrypto (best-per-chunk) against OpenSSL across buffer sizes."""
     if ossl is None or ossl.empty:
         print("[warn] OpenSSL data missing; skipping openssl_comparison.png")
         return
 
-    enc_best = enc.groupby("ChunkMB")["Throughput"].max().reset_index()
-    dec_best = dec.groupby("ChunkMB")["Throughput"].max().reset_index()
+    enc_best = select(sweeps, {"Op": "Encrypt"}).groupby("ChunkMB")["Throughput"].max().reset_index()
+    dec_best = select(sweeps, {"Op": "Decrypt"}).groupby("ChunkMB")["Throughput"].max().reset_index()
     enc_best["BlockBytes"] = (enc_best["ChunkMB"] * 1_000_000).astype(int)
     dec_best["BlockBytes"] = (dec_best["ChunkMB"] * 1_000_000).astype(int)
 
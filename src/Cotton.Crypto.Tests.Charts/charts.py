@@ -1,6 +1,17 @@
-"""All-in-one generator: CottonCrypto sweep charts plus the OpenSSL comparison."""
-
+"""All-in-one generator: CottonCrypto sweep charts plus the OpenSSL comparison.
+
+With ``--batch DIR`` every host found in a directory tree of sweep logs and
+openssl outputs gets its own figure set under the output directory; logs are
+classified and hosts rendered in parallel processes, and a combined overlay
+(host_overlay.png plus an interactive performance_report.html) compares them.
+"""
+
+import argparse
+import contextlib
+import io
+import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Optional
 
@@ -8,143 +19,205 @@ import matplotlib.pyplot as plt
 import pandas as pd
 
 from chart_common import (
-    CHUNK_HEX_COLORS,
+    CIPHER_OPS,
+    E_CORE_WEIGHT,
     MYLIB_INPUT_DEFAULT,
     OPENSSL_INPUT_DEFAULT,
     ROOT,
-    THREAD_HEX_COLORS,
+    SWEEP_SECTIONS,
+    Panel,
+    best_cell,
     create_advanced_plots,
     create_mega_analysis,
-    parse_mylib_results,
+    create_simple_plots,
+    draw_panels,
     parse_openssl_results,
+    parse_sweeps,
     plot_openssl_comparison,
+    select,
+    tidy_sweeps,
+    with_e_core_weight,
 )
+from html_report import render_report, sweep_panels
 
 
-def plot_mylib_four_panels(enc: pd.DataFrame, dec: pd.DataFrame, out_path: Path) -> None:
+def plot_mylib_four_panels(sweeps: pd.DataFrame, out_path: Path) -> None:
     """Create the 4-panel figure: throughput vs chunk size (per threads) and vs threads (per chunk)."""
-    if enc.empty or dec.empty:
-        print("[warn] CottonCrypto data is empty; skipping library_performance.png")
-        return
-
-    plt.rcParams["figure.facecolor"] = "white"
-    plt.rcParams["axes.facecolor"] = "white"
-    plt.rcParams["axes.grid"] = True
-    plt.rcParams["grid.alpha"] = 0.3
-
-    fig, axes = plt.subplots(2, 2, figsize=(16, 12))
-    (ax1, ax2), (ax3, ax4) = axes
+    fig = create_simple_plots(sweeps)
     fig.suptitle("CottonCrypto Performance: Encryption/Decryption Throughput", fontsize=16, fontweight="bold", y=0.98)
-
-    unique_threads = sorted(enc["Threads"].unique())
-    unique_chunks = sorted(enc["ChunkMB"].unique())
-
-    for i, t in enumerate(unique_threads):
-        d = enc[enc["Threads"] == t].sort_values("ChunkMB")
-        ax1.plot(d["ChunkMB"], d["Throughput"], marker="o", label=f"{t} threads",
-                 linewidth=2.0, markersize=7, color=THREAD_HEX_COLORS[i % len(THREAD_HEX_COLORS)])
-    ax1.set_title("Encryption: Throughput vs Chunk Size", fontsize=14, fontweight="bold")
-    ax1.set_xlabel("Chunk Size (MB)")
-    ax1.set_ylabel("Throughput (MB/s)")
-    ax1.set_xticks(unique_chunks)
-    ax1.legend(frameon=True, fancybox=True)
-
-    for i, t in enumerate(unique_threads):
-        d = dec[dec["Threads"] == t].sort_values("ChunkMB")
-        ax2.plot(d["ChunkMB"], d["Throughput"], marker="s", label=f"{t} threads",
-                 linewidth=2.0, markersize=7, color=THREAD_HEX_COLORS[i % len(THREAD_HEX_COLORS)])
-    ax2.set_title("Decryption: Throughput vs Chunk Size", fontsize=14, fontweight="bold")
-    ax2.set_xlabel("Chunk Size (MB)")
-    ax2.set_ylabel("Throughput (MB/s)")
-    ax2.set_xticks(unique_chunks)
-    ax2.legend(frameon=True, fancybox=True)
-
-    for i, ch in enumerate(unique_chunks):
-        d = enc[enc["ChunkMB"] == ch].sort_values("Threads")
-        ax3.plot(d["Threads"], d["Throughput"], marker="o", label=f"{int(ch)}MB",
-                 linewidth=2.0, markersize=7, color=CHUNK_HEX_COLORS[i % len(CHUNK_HEX_COLORS)])
-    ax3.set_title("Encryption: Throughput vs Threads", fontsize=14, fontweight="bold")
-    ax3.set_xlabel("Number of Threads")
-    ax3.set_ylabel("Throughput (MB/s)")
-    ax3.set_xticks(unique_threads)
-    ax3.legend(title="Chunk Size", frameon=True, fancybox=True)
-
-    for i, ch in enumerate(unique_chunks):
-        d = dec[dec["ChunkMB"] == ch].sort_values("Threads")
-        ax4.plot(d["Threads"], d["Throughput"], marker="s", label=f"{int(ch)}MB",
-                 linewidth=2.0, markersize=7, color=CHUNK_HEX_COLORS[i % len(CHUNK_HEX_COLORS)])
-    ax4.set_title("Decryption: Throughput vs Threads", fontsize=14, fontweight="bold")
-    ax4.set_xlabel("Number of Threads")
-    ax4.set_ylabel("Throughput (MB/s)")
-    ax4.set_xticks(unique_threads)
-    ax4.legend(title="Chunk Size", frameon=True, fancybox=True)
-
-    for ax in (ax1, ax2, ax3, ax4):
-        ax.grid(True, alpha=0.3)
-        ax.spines["top"].set_visible(False)
-        ax.spines["right"].set_visible(False)
-
-    fig.tight_layout()
     fig.savefig(out_path, dpi=300, bbox_inches="tight")
     print(f"[ok] Saved {out_path.name}")
 
 
-def _save_advanced(enc: pd.DataFrame, dec: pd.DataFrame, out_path: Path) -> None:
-    if enc.empty or dec.empty:
-        print("[warn] CottonCrypto data empty; skipping advanced_performance_analysis.png")
-        return
-    fig, _, _ = create_advanced_plots(enc, dec)
+def _save_advanced(sweeps: pd.DataFrame, out_path: Path) -> None:
+    fig, _, _ = create_advanced_plots(sweeps)
     fig.savefig(out_path, dpi=300, bbox_inches="tight")
     print(f"[ok] Saved {out_path.name}")
 
 
-def _save_mega(enc: pd.DataFrame, dec: pd.DataFrame, out_path: Path) -> None:
-    if enc.empty or dec.empty:
-        print("[warn] CottonCrypto data empty; skipping mega_performance_analysis.png")
-        return
-    fig, _, _ = create_mega_analysis(enc, dec)
+def _save_mega(sweeps: pd.DataFrame, out_path: Path) -> None:
+    fig, _, _ = create_mega_analysis(sweeps)
     fig.savefig(out_path, dpi=300, bbox_inches="tight")
     print(f"[ok] Saved {out_path.name}")
 
 
-def main(argv: Optional[list[str]] = None) -> int:
-    """Generate all figures from the given (or default) input files."""
-    args = sys.argv[1:] if argv is None else argv
-    mylib_path = Path(args[0]).resolve() if len(args) >= 1 else MYLIB_INPUT_DEFAULT
-    openssl_path = Path(args[1]).resolve() if len(args) >= 2 else OPENSSL_INPUT_DEFAULT
-
-    if not mylib_path.exists():
-        print(f"[error] CottonCrypto input not found: {mylib_path}")
-        return 1
-
-    enc, dec = parse_mylib_results(mylib_path)
+def generate(mylib_path: Path, openssl_path: Optional[Path], out_dir: Path, e_core_weight: Optional[float] = None,
+             host: Optional[str] = None) -> Optional[pd.DataFrame]:
+    """Write the figure set for one host into ``out_dir``; return its tidy sweeps (None if unusable)."""
+    sweeps = parse_sweeps(mylib_path, host)
+    enc, dec = select(sweeps, {"Op": "Encrypt"}), select(sweeps, {"Op": "Decrypt"})
     if enc.empty or dec.empty:
         print(f"[error] Failed to parse CottonCrypto data from {mylib_path}")
-        return 2
+        return None
 
+    out_dir.mkdir(parents=True, exist_ok=True)
+    sweeps.attrs["topology"] = with_e_core_weight(sweeps.attrs["topology"], e_core_weight)
     print(f"Loaded CottonCrypto data: enc={len(enc)} rows, dec={len(dec)} rows")
-    plot_mylib_four_panels(enc, dec, ROOT / "library_performance.png")
-    _save_advanced(enc, dec, ROOT / "advanced_performance_analysis.png")
-    _save_mega(enc, dec, ROOT / "mega_performance_analysis.png")
+    if sweeps.attrs["topology"]:
+        print(f"CPU topology: {sweeps.attrs['topology']}")
+    plot_mylib_four_panels(sweeps, out_dir / "library_performance.png")
+    _save_advanced(sweeps, out_dir / "advanced_performance_analysis.png")
+    _save_mega(sweeps, out_dir / "mega_performance_analysis.png")
+    plt.close("all")
 
     ossl_df = pd.DataFrame()
-    if openssl_path.exists():
+    if openssl_path and openssl_path.exists():
         ossl_df = parse_openssl_results(openssl_path)
         print(f"Loaded OpenSSL data: {len(ossl_df)} points")
-        plot_openssl_comparison(enc, dec, ossl_df, ROOT / "openssl_comparison.png")
+        plot_openssl_comparison(sweeps, ossl_df, out_dir / "openssl_comparison.png")
+        plt.close("all")
     else:
         print(f"[info] OpenSSL input not found, skipping comparison: {openssl_path}")
 
-    enc_best = enc.loc[enc["Throughput"].idxmax()]
-    dec_best = dec.loc[dec["Throughput"].idxmax()]
+    enc_best = best_cell(sweeps, "Encrypt")
+    dec_best = best_cell(sweeps, "Decrypt")
     print("\nSummary:")
     print(f"  CottonCrypto Encrypt best: {enc_best['Throughput']:.1f} MB/s at {enc_best['Threads']} threads, {enc_best['ChunkMB']}MB chunks")
     print(f"  CottonCrypto Decrypt best: {dec_best['Throughput']:.1f} MB/s at {dec_best['Threads']} threads, {dec_best['ChunkMB']}MB chunks")
     if not ossl_df.empty:
         print(f"  OpenSSL best: {ossl_df['ThroughputMBps'].max():.1f} MB/s at {int(ossl_df.loc[ossl_df['ThroughputMBps'].idxmax(), 'BlockBytes'])} bytes buffer")
+    return sweeps
+
+
+# --- Batch mode over a directory of per-host logs -----------------------------
+
+
+def classify_log(path: Path) -> Optional[str]:
+    """"sweep" for PerformanceTests output, "openssl" for openssl speed output, None otherwise."""
+    text = path.read_text(encoding="utf-8", errors="ignore")
+    if any(f"=== {title} ===" in text for title in SWEEP_SECTIONS.values()):
+        return "sweep"
+    if "AES-128-GCM" in text:
+        return "openssl"
+    return None
+
 
+def host_of(path: Path, root: Path) -> str:
+    """Host name of a log: its directory below ``root``, or the file stem (minus an openssl suffix) at the top level."""
+    if path.parent != root:
+        return path.parent.name
+    return re.sub(r"[-_.]?openssl$", "", path.stem, flags=re.IGNORECASE) or path.stem
+
+
+def discover_hosts(root: Path, workers: Optional[int] = None) -> dict[str, dict[str, Path]]:
+    """Map host -> {"sweep": path, "openssl": path}; files are classified in parallel, the newest log per kind wins."""
+    paths = sorted(p for p in root.rglob("*.txt") if p.is_file())
+    hosts: dict[str, dict[str, Path]] = {}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for path, kind in zip(paths, pool.map(classify_log, paths)):
+            if kind is None:
+                continue
+            current = hosts.setdefault(host_of(path, root), {}).get(kind)
+            if current is None or path.stat().st_mtime > current.stat().st_mtime:
+                hosts[host_of(path, root)][kind] = path
+    return hosts
+
+
+def _generate_host(host: str, logs: dict[str, Path], out_dir: Path, e_core_weight: Optional[float]) -> tuple[str, Optional[pd.DataFrame], str]:
+    """Process-pool entry point: render one host and hand back its sweeps and captured console output."""
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        sweeps = generate(logs["sweep"], logs.get("openssl"), out_dir / host, e_core_weight, host)
+    return host, sweeps, output.getvalue()
+
+
+def plot_host_overlay(sweeps: pd.DataFrame, out_path: Path) -> None:
+    """Overlay all hosts: best throughput per chunk size and per thread count, one line per host."""
+    fig, axes = plt.subplots(2, 2, figsize=(16, 12))
+    fig.suptitle(f"Host Comparison: best cell per point ({sweeps['Host'].nunique()} hosts)", fontsize=16, fontweight="bold")
+    draw_panels(axes.flat, sweeps, [
+        Panel(x="ChunkMB", series="Host", where={"Op": op}, agg="max", title=f"{op}: best over threads")
+        for op in CIPHER_OPS
+    ] + [
+        Panel(x="Threads", series="Host", where={"Op": op}, agg="max", title=f"{op}: best over chunk sizes")
+        for op in CIPHER_OPS
+    ], style="compact")
+    fig.tight_layout(rect=(0, 0, 1, 0.96))
+    fig.savefig(out_path, dpi=200, bbox_inches="tight")
+    plt.close(fig)
+    print(f"[ok] Saved {out_path.name}")
+
+
+def run_batch(root: Path, out_dir: Path, e_core_weight: Optional[float] = None, workers: Optional[int] = None) -> int:
+    """Render every host under ``root`` in parallel into ``out_dir/<host>`` plus a combined overlay report."""
+    hosts = discover_hosts(root, workers)
+    missing = sorted(host for host, logs in hosts.items() if "sweep" not in logs)
+    for host in missing:
+        print(f"[warn] {host}: OpenSSL output without a sweep log; skipped")
+    hosts = {host: logs for host, logs in hosts.items() if "sweep" in logs}
+    if not hosts:
+        print(f"[error] No sweep logs under {root}")
+        return 1
+
+    print(f"Found {len(hosts)} hosts under {root}: {', '.join(sorted(hosts))}")
+    frames = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        jobs = [pool.submit(_generate_host, host, logs, out_dir, e_core_weight) for host, logs in sorted(hosts.items())]
+        for job in jobs:
+            host, sweeps, output = job.result()
+            print(f"\n=== {host} ===\n{output.rstrip()}")
+            if sweeps is not None:
+                frames.append(sweeps)
+
+    if not frames:
+        print("[error] No host produced usable sweeps")
+        return 2
+    combined = tidy_sweeps(frames)
+    plot_host_overlay(combined, out_dir / "host_overlay.png")
+    report = out_dir / "performance_report.html"
+    report.write_text(render_report(f"Cotton Performance: {len(frames)} hosts", sweep_panels(combined, 2000)), encoding="utf-8")
+    print(f"[ok] Saved {report.name}")
+    print("\nBest encrypt per host:")
+    for host, data in select(combined, {"Op": "Encrypt"}).groupby("Host", sort=True):
+        best = data.loc[data["Throughput"].idxmax()]
+        print(f"  {host}: {best['Throughput']:.1f} MB/s at {best['Threads']} threads, {best['ChunkMB']:g}MB chunks")
     return 0
 
 
+def main(argv: Optional[list[str]] = None) -> int:
+    """Generate all figures for one host, or for every host under --batch."""
+    p = argparse.ArgumentParser(description="Generate the CottonCrypto and OpenSSL comparison charts")
+    p.add_argument("mylib", nargs="?", type=Path, default=MYLIB_INPUT_DEFAULT, help="PerformanceTests output")
+    p.add_argument("openssl", nargs="?", type=Path, default=OPENSSL_INPUT_DEFAULT, help="openssl speed output")
+    p.add_argument("--e-core-weight", type=float, help=f"E-core throughput relative to a P-core for the core budget (default: {E_CORE_WEIGHT}, assumed)")
+    p.add_argument("--batch", type=Path, help="Directory tree of per-host sweep logs and openssl outputs (host = sub-directory or file stem)")
+    p.add_argument("--out-dir", type=Path, help="Output directory (default: next to this script; batch mode: <batch>/charts)")
+    p.add_argument("--workers", type=int, help="Parallel worker processes in batch mode (default: CPU count)")
+    args = p.parse_args(sys.argv[1:] if argv is None else argv)
+
+    if args.batch:
+        if not args.batch.is_dir():
+            print(f"[error] Batch directory not found: {args.batch}")
+            return 1
+        return run_batch(args.batch.resolve(), (args.out_dir or args.batch / "charts").resolve(), args.e_core_weight, args.workers)
+
+    mylib_path = args.mylib.resolve()
+    if not mylib_path.exists():
+        print(f"[error] CottonCrypto input not found: {mylib_path}")
+        return 1
+    sweeps = generate(mylib_path, args.openssl.resolve(), (args.out_dir or ROOT).resolve(), args.e_core_weight)
+    return 0 if sweeps is not None else 2
+
+
 if __name__ == "__main__":
     raise SystemExit(main())
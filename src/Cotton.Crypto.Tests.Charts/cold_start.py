@@ -0,0 +1,170 @@
+"""Per-file fixed overhead vs streaming throughput of the cipher sweeps (cold_start.png).
+
+Each sweep cell of PerformanceTests builds a fresh cipher, times its construction
+(SetupMs), times the first pass on it (FirstThroughput) and only then samples
+warm passes (Throughput). From those:
+
+- streaming throughput is the warm MB/s,
+- fixed overhead per file is the setup plus the extra time of the first pass
+  over a warm one,
+- the effective throughput of a file of size S is S / (fixed + S / streaming),
+  and the half-throughput size is where the fixed cost equals the streaming time.
+
+Overheads smaller than twice the standard deviation of a warm pass are flagged
+as below the noise floor: the first pass then cost no more than a warm one.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Optional
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+
+from chart_common import CIPHER_OPS, MYLIB_INPUT_DEFAULT, ROOT, THREAD_HEX_COLORS, format_bytes, parse_sweeps
+
+# File sizes for the effective-throughput curves: 1 KiB .. 1 GiB.
+FILE_SIZES_MB = np.logspace(np.log10(1 / 1024), np.log10(1024), 200)
+SMALL_FILE_MB = 64 / 1024
+
+
+def fixed_overhead(sweeps: pd.DataFrame) -> pd.DataFrame:
+    """Add WarmPassMs, FirstPassMs, NoiseMs, FixedMs, HalfThroughputMB and BelowNoise per cell."""
+    df = sweeps.dropna(subset=["FirstThroughput"]).copy()
+    df["WarmPassMs"] = df["DataSizeMB"] / df["Throughput"] * 1000
+    df["FirstPassMs"] = df["DataSizeMB"] / df["FirstThroughput"] * 1000
+    samples = df["Samples"] if "Samples" in df.columns else pd.Series(None, index=df.index, dtype=object)
+    df["NoiseMs"] = [
+        np.std([size / v * 1000 for v in cell], ddof=1) if isinstance(cell, list) and len(cell) > 1 else 0.0
+        for size, cell in zip(df["DataSizeMB"], samples)
+    ]
+    first_extra = df["FirstPassMs"] - df["WarmPassMs"]
+    df["BelowNoise"] = first_extra.abs() < 2 * df["NoiseMs"]
+    df["FixedMs"] = df["SetupMs"] + first_extra.where(~df["BelowNoise"], 0).clip(lower=0)
+    df["HalfThroughputMB"] = df["FixedMs"] / 1000 * df["Throughput"]
+    return df
+
+
+def effective_throughput(fixed_ms, streaming_mbps, sizes_mb=FILE_SIZES_MB):
+    """MB/s delivered for files of the given sizes when every file pays ``fixed_ms`` once."""
+    return sizes_mb / (fixed_ms / 1000 + sizes_mb / streaming_mbps)
+
+
+def summarize(cells: pd.DataFrame) -> pd.DataFrame:
+    """Per op: the best warm cell and the cell that is best for a 64 KiB file, with their fixed costs."""
+    rows = []
+    for op, group in cells.groupby("Op", sort=False):
+        best = group.loc[group["Throughput"].idxmax()]
+        short = group.loc[effective_throughput(group["FixedMs"], group["Throughput"], SMALL_FILE_MB).idxmax()]
+        for label, cell in (("Peak streaming", best), ("Best for 64K files", short)):
+            rows.append({
+                "Op": op,
+                "Pick": label,
+                "Threads": int(cell["Threads"]),
+                "ChunkMB": cell["ChunkMB"],
+                "StreamingMBps": cell["Throughput"],
+                "SetupMs": cell["SetupMs"],
+                "FixedMs": cell["FixedMs"],
+                "HalfThroughput": format_bytes(cell["HalfThroughputMB"] * 1024 * 1024),
+                "MBpsAt64K": effective_throughput(cell["FixedMs"], cell["Throughput"], SMALL_FILE_MB),
+            })
+    return pd.DataFrame(rows)
+
+
+def create_cold_start_plots(cells: pd.DataFrame, title: str):
+    """Build the 3-row figure: fixed overhead per cell, setup cost by threads, effective throughput by file size."""
+    ops = [op for op in CIPHER_OPS + ["Memcpy"] if op in set(cells["Op"])]
+    fig, axes = plt.subplots(3, len(ops), figsize=(8 * len(ops), 18), squeeze=False)
+    fig.suptitle(title, fontsize=16, fontweight="bold")
+
+    for col, op in enumerate(ops):
+        data = cells[cells["Op"] == op]
+        threads = sorted(data["Threads"].unique())
+        chunks = sorted(data["ChunkMB"].unique())
+
+        ax = axes[0, col]
+        pivot = data.pivot_table(index="Threads", columns="ChunkMB", values="FixedMs").reindex(index=threads, columns=chunks)
+        noise = data.pivot_table(index="Threads", columns="ChunkMB", values="BelowNoise", aggfunc="max").reindex(index=threads, columns=chunks)
+        im = ax.imshow(pivot.values, cmap="magma_r", aspect="auto", origin="lower")
+        vmax = np.nanmax(pivot.values)
+        for i in range(len(threads)):
+            for j in range(len(chunks)):
+                value = pivot.values[i, j]
+                if not np.isnan(value):
+                    mark = "*" if noise.values[i, j] else ""
+                    ax.text(j, i, f"{value:.1f}{mark}", ha="center", va="center", fontsize=8,
+                            color="white" if value > vmax * 0.6 else "black")
+        ax.set_xticks(range(len(chunks)))
+        ax.set_xticklabels([format_bytes(c * 1024 * 1024) for c in chunks])
+        ax.set_yticks(range(len(threads)))
+        ax.set_yticklabels([str(t) for t in threads])
+        ax.set_title(f"{op}: Fixed Overhead per File (ms; * = first pass within noise)", fontsize=12, fontweight="bold")
+        ax.set_xlabel("Chunk Size")
+        ax.set_ylabel("Threads")
+        fig.colorbar(im, ax=ax, shrink=0.8)
+
+        ax = axes[1, col]
+        setup = data.groupby("Threads")["SetupMs"].agg(["median", "min", "max"]).reindex(threads)
+        ax.errorbar(threads, setup["median"], yerr=[setup["median"] - setup["min"], setup["max"] - setup["median"]],
+                    marker="o", linewidth=2, capsize=4, color="#6a3d9a")
+        ax.set_xscale("log", base=2)
+        ax.set_xticks(threads)
+        ax.set_xticklabels([str(t) for t in threads])
+        ax.set_title(f"{op}: Setup Cost (median, min-max over chunk sizes)", fontsize=12, fontweight="bold")
+        ax.set_xlabel("Threads")
+        ax.set_ylabel("Setup (ms)")
+        ax.grid(True, alpha=0.3)
+
+        ax = axes[2, col]
+        for i, t in enumerate(threads):
+            row = data[data["Threads"] == t].sort_values("Throughput").iloc[-1]
+            color = THREAD_HEX_COLORS[i % len(THREAD_HEX_COLORS)]
+            ax.plot(FILE_SIZES_MB, effective_throughput(row["FixedMs"], row["Throughput"]), linewidth=2, color=color,
+                    label=f"{t}T, {format_bytes(row['ChunkMB'] * 1024 * 1024)} ({row['FixedMs']:.1f} ms fixed)")
+            ax.axvline(row["HalfThroughputMB"], color=color, linestyle=":", alpha=0.6)
+        ax.set_xscale("log")
+        ax.set_yscale("log")
+        ticks = [1 / 1024, 1 / 16, 1, 16, 1024]
+        ax.set_xticks(ticks)
+        ax.set_xticklabels([format_bytes(t * 1024 * 1024) for t in ticks])
+        ax.set_title(f"{op}: Effective Throughput by File Size (dotted = half-throughput size)", fontsize=12, fontweight="bold")
+        ax.set_xlabel("File Size")
+        ax.set_ylabel("MB/s (log)")
+        ax.legend(fontsize=8, title="Best chunk per thread count")
+        ax.grid(True, which="both", alpha=0.3)
+
+    fig.tight_layout(rect=(0, 0, 1, 0.97))
+    return fig
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Parse cold-start sweep output, chart fixed overhead vs streaming throughput and print the picks."""
+    p = argparse.ArgumentParser(description="Per-file fixed overhead vs streaming throughput of the cipher sweeps")
+    p.add_argument("input", nargs="?", type=Path, default=MYLIB_INPUT_DEFAULT, help="PerformanceTests output")
+    p.add_argument("--out", type=Path, default=ROOT / "cold_start.png", help="Output PNG path")
+    args = p.parse_args(sys.argv[1:] if argv is None else argv)
+
+    if not args.input.exists():
+        print(f"[error] Input not found: {args.input}")
+        return 1
+
+    sweeps = parse_sweeps(args.input)
+    if "FirstThroughput" not in sweeps.columns or sweeps["FirstThroughput"].isna().all():
+        print(f"[error] {args.input} has no Setup ms / First MB/s columns; re-run the sweeps with the current PerformanceTests")
+        return 2
+
+    cells = fixed_overhead(sweeps)
+    fig = create_cold_start_plots(cells, f"Cold Start vs Steady State: {args.input.name}")
+    fig.savefig(args.out, dpi=200, bbox_inches="tight")
+    print(f"[ok] Saved {args.out.name}")
+
+    print(f"\n{int(cells['BelowNoise'].sum())} of {len(cells)} cells: first pass within the noise of a warm pass (fixed cost = setup only)")
+    print("\nPer-file fixed overhead vs streaming throughput:")
+    print(summarize(cells).to_string(index=False, float_format=lambda v: f"{v:.2f}"))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
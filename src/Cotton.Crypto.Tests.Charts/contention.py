@@ -0,0 +1,184 @@
+"""Multi-tenant contention: aggregate throughput, fairness and tail latency (contention.png).
+
+Input is PerformanceTests output containing the ``MULTI-STREAM CONTENTION SWEEP``
+section (``Encrypt_StreamSweep_ThreadsPerStreamSweep``): S independent streams,
+each with its own AesGcmStreamCipher and T threads, started together.
+
+Per cell:
+
+- aggregate throughput is the MB/s of all streams together,
+- fairness is Jain's index over the per-stream throughputs of a pass (1.0 = every
+  stream got the same share, 1/S = one stream got everything), averaged over passes,
+- tail latency is the p99 stream completion time, also shown as a stretch over
+  the best single-stream time.
+
+The idle recommendation is the best T for one stream. The busy recommendation
+only looks at stream counts of at least the core budget: each T is scored by its
+throughput relative to the best T at the same stream count, cells below the
+fairness floor are excluded, and the smallest T within the tolerance of the best
+score wins.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Optional
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+
+from chart_common import MYLIB_INPUT_DEFAULT, ROOT, THREAD_HEX_COLORS, parse_contention_section
+
+FAIRNESS_FLOOR = 0.9
+
+
+def jain_index(values) -> float:
+    """Jain's fairness index: (sum x)^2 / (n * sum x^2)."""
+    x = np.asarray(values, dtype=float)
+    return float(x.sum() ** 2 / (len(x) * (x ** 2).sum())) if len(x) and (x ** 2).sum() > 0 else np.nan
+
+
+def with_stream_stats(df: pd.DataFrame) -> pd.DataFrame:
+    """Add Fairness, P50StreamMs, P99StreamMs, Stretch and RelativeThroughput per cell."""
+    df = df.copy()
+    fairness, p50, p99 = [], [], []
+    for _, cell in df.iterrows():
+        completions = np.asarray(cell["StreamMs"], dtype=float)
+        passes = completions[: len(completions) // cell["Streams"] * cell["Streams"]].reshape(-1, cell["Streams"])
+        fairness.append(np.mean([jain_index(cell["StreamMB"] / (row / 1000)) for row in passes]))
+        p50.append(np.percentile(completions, 50))
+        p99.append(np.percentile(completions, 99))
+    df["Fairness"] = fairness
+    df["P50StreamMs"] = p50
+    df["P99StreamMs"] = p99
+    single = df[df["Streams"] == 1]
+    df["Stretch"] = df["P99StreamMs"] / (single["P50StreamMs"].min() if not single.empty else np.nan)
+    df["RelativeThroughput"] = df["Throughput"] / df.groupby("Streams")["Throughput"].transform("max")
+    return df
+
+
+def recommend(df: pd.DataFrame, tolerance: float = 0.05, fairness_floor: float = FAIRNESS_FLOOR) -> dict:
+    """Idle pick (best T for one stream) and busy pick (best T across stream counts >= the core budget)."""
+    single = df[df["Streams"] == 1]
+    idle = int(single.loc[single["Throughput"].idxmax(), "ThreadsPerStream"]) if not single.empty else None
+
+    budget = df["CoreBudget"].iloc[0]
+    busy = df[df["Streams"] >= budget] if np.isfinite(budget) else df[df["Streams"] == df["Streams"].max()]
+    busy_counts = busy["Streams"].nunique()
+    scores = (
+        busy[busy["Fairness"] >= fairness_floor]
+        .groupby("ThreadsPerStream")
+        .agg(Score=("RelativeThroughput", "mean"), Cells=("Streams", "nunique"), P99Stretch=("Stretch", "max"))
+    )
+    # Only thread counts measured at every busy stream count compete; deep-oversubscription cells are skipped by the test.
+    scores = scores[scores["Cells"] == busy_counts]
+    if scores.empty:
+        return {"Idle": idle, "Busy": None, "Scores": scores}
+    good = scores[scores["Score"] >= scores["Score"].max() * (1 - tolerance)]
+    return {"Idle": idle, "Busy": int(good.index.min()), "Scores": scores}
+
+
+def create_contention_plots(df: pd.DataFrame, picks: dict, title: str):
+    """Build the 2x2 figure: aggregate throughput, fairness, p99 stretch, throughput relative to the best T."""
+    threads = sorted(df["ThreadsPerStream"].unique())
+    streams = sorted(df["Streams"].unique())
+    budget = df["CoreBudget"].iloc[0]
+    fig, axes = plt.subplots(2, 2, figsize=(18, 14))
+    fig.suptitle(title, fontsize=16, fontweight="bold")
+
+    for i, t in enumerate(threads):
+        data = df[df["ThreadsPerStream"] == t].sort_values("Streams")
+        color = THREAD_HEX_COLORS[i % len(THREAD_HEX_COLORS)]
+        style = {"marker": "o", "linewidth": 3 if t == picks["Busy"] else 1.5, "color": color, "label": f"{t} threads/stream"}
+        axes[0, 0].plot(data["Streams"], data["Throughput"], **style)
+        axes[0, 1].plot(data["Streams"], data["Fairness"], **style)
+        axes[1, 0].plot(data["Streams"], data["Stretch"], **style)
+
+    ax = axes[0, 0]
+    ax.set_title("Aggregate Throughput (bold = busy recommendation)", fontsize=13, fontweight="bold")
+    ax.set_ylabel("MB/s")
+    ax = axes[0, 1]
+    ax.axhline(FAIRNESS_FLOOR, color="black", linestyle="--", linewidth=1, alpha=0.6)
+    ax.set_title("Per-stream Fairness (Jain's index)", fontsize=13, fontweight="bold")
+    ax.set_ylabel("Fairness (1 = equal share)")
+    ax.set_ylim(0, 1.05)
+    ax = axes[1, 0]
+    ax.set_title("p99 Stream Completion vs Best Single Stream", fontsize=13, fontweight="bold")
+    ax.set_ylabel("Stretch (x, log)")
+    ax.set_yscale("log")
+    for ax in (axes[0, 0], axes[0, 1], axes[1, 0]):
+        ax.set_xscale("log", base=2)
+        ax.set_xticks(streams)
+        ax.set_xticklabels([str(s) for s in streams])
+        ax.set_xlabel("Simultaneous Streams")
+        if np.isfinite(budget):
+            ax.axvline(budget, color="purple", linestyle=":", linewidth=1.5, alpha=0.8)
+        ax.grid(True, which="both", alpha=0.3)
+        ax.legend(fontsize=8)
+
+    ax = axes[1, 1]
+    pivot = df.pivot_table(index="Streams", columns="ThreadsPerStream", values="RelativeThroughput").reindex(index=streams, columns=threads)
+    im = ax.imshow(pivot.values * 100, cmap="viridis", vmin=0, vmax=100, aspect="auto", origin="lower")
+    for i in range(len(streams)):
+        for j in range(len(threads)):
+            value = pivot.values[i, j]
+            if not np.isnan(value):
+                ax.text(j, i, f"{value * 100:.0f}", ha="center", va="center", fontsize=8,
+                        color="black" if value > 0.6 else "white")
+    ax.set_xticks(range(len(threads)))
+    ax.set_xticklabels([str(t) for t in threads])
+    ax.set_yticks(range(len(streams)))
+    ax.set_yticklabels([str(s) for s in streams])
+    ax.set_title("Throughput vs Best Threads/stream at that Load (%)", fontsize=13, fontweight="bold")
+    ax.set_xlabel("Threads per Stream")
+    ax.set_ylabel("Simultaneous Streams")
+    fig.colorbar(im, ax=ax, shrink=0.8)
+
+    fig.tight_layout(rect=(0, 0, 1, 0.96))
+    return fig
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Analyze the multi-stream contention sweep and recommend threads per stream for a busy server."""
+    p = argparse.ArgumentParser(description="Aggregate throughput, fairness and tail latency of concurrent cipher streams")
+    p.add_argument("input", nargs="?", type=Path, default=MYLIB_INPUT_DEFAULT, help="PerformanceTests output")
+    p.add_argument("--tolerance", type=float, default=0.05, help="Score loss accepted for a smaller thread count")
+    p.add_argument("--fairness", type=float, default=FAIRNESS_FLOOR, help="Minimum Jain's index for the busy recommendation")
+    p.add_argument("--out", type=Path, default=ROOT / "contention.png", help="Output PNG path")
+    args = p.parse_args(sys.argv[1:] if argv is None else argv)
+
+    if not args.input.exists():
+        print(f"[error] Input not found: {args.input}")
+        return 1
+
+    df = parse_contention_section(args.input.read_text(encoding="utf-8", errors="ignore"))
+    if df.empty:
+        print(f"[error] {args.input} has no MULTI-STREAM CONTENTION SWEEP section; run Encrypt_StreamSweep_ThreadsPerStreamSweep")
+        return 2
+
+    df = with_stream_stats(df)
+    picks = recommend(df, args.tolerance, args.fairness)
+    fig = create_contention_plots(df, picks, f"Multi-stream Contention: {args.input.name} (core budget {df['CoreBudget'].iloc[0]:g})")
+    fig.savefig(args.out, dpi=200, bbox_inches="tight")
+    print(f"[ok] Saved {args.out.name}")
+
+    table = df[["Streams", "ThreadsPerStream", "Throughput", "RelativeThroughput", "Fairness", "P50StreamMs", "P99StreamMs", "Stretch"]]
+    print("\nPer cell (RelativeThroughput = vs the best threads/stream at the same stream count):")
+    print(table.to_string(index=False, float_format=lambda v: f"{v:.2f}"))
+
+    if not picks["Scores"].empty:
+        print("\nBusy-server score per threads/stream (mean relative throughput over stream counts >= core budget):")
+        print(picks["Scores"].to_string(float_format=lambda v: f"{v:.2f}"))
+    print(f"\n[info] Idle server (one stream): threads per stream = {picks['Idle']}")
+    if picks["Busy"] is None:
+        print(f"[warn] No thread count keeps fairness >= {args.fairness:.2f} at every busy stream count; no busy recommendation")
+        return 0
+    print(f"[info] Busy server (streams >= cores): threads per stream = {picks['Busy']}")
+    if picks["Idle"] is not None and picks["Busy"] < picks["Idle"]:
+        print("[info] The single-stream optimum oversubscribes the cores under load; size per-stream threads for the busy case")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
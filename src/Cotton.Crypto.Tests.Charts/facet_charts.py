@@ -0,0 +1,74 @@
+"""Ad-hoc faceted charts over any sweep dimension (facet_charts.png).
+
+Every input is parsed into the tidy sweep schema (one row per cell, one column
+per dimension: Host, Op, Threads, ChunkMB, DataSizeMB, Profile, KeyDerivation,
+Runtime and any extra ``Dimensions:`` key), so a new sweep dimension can be put
+on the x axis, split into series or faceted into rows/columns without new
+plotting code. Several inputs are overlaid with Host = file stem.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Optional
+
+from chart_common import MYLIB_INPUT_DEFAULT, ROOT, Panel, facet_grid, parse_sweeps, sweep_dimensions, tidy_sweeps
+
+
+def parse_where(items: list[str]) -> dict:
+    """``dim=value`` (or ``dim=a,b``) filters; numeric values are compared as numbers."""
+    where = {}
+    for item in items:
+        dim, _, raw = item.partition("=")
+        values = [float(v) if v.replace(".", "", 1).isdigit() else v for v in raw.split(",")]
+        where[dim] = values if len(values) > 1 else values[0]
+    return where
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Parse the inputs into one tidy frame and draw the requested facet grid."""
+    p = argparse.ArgumentParser(description="Facet any sweep dimension against any other")
+    p.add_argument("inputs", nargs="*", type=Path, default=[MYLIB_INPUT_DEFAULT], help="PerformanceTests outputs (Host = file stem)")
+    p.add_argument("--x", default="ChunkMB", help="Dimension on the x axis")
+    p.add_argument("--y", default="Throughput", help="Measure on the y axis")
+    p.add_argument("--series", default="Threads", help="Dimension split into lines/bars (or heatmap rows)")
+    p.add_argument("--row", help="Dimension faceted into rows")
+    p.add_argument("--col", default="Op", help="Dimension faceted into columns")
+    p.add_argument("--where", action="append", default=[], help="Fix a dimension, e.g. --where Threads=4 or --where Op=Encrypt,Decrypt")
+    p.add_argument("--kind", choices=["line", "bar", "heatmap"], default="line")
+    p.add_argument("--agg", default="mean", help="How cells differing only in unplotted dimensions are folded (mean, max, min, median)")
+    p.add_argument("--out", type=Path, default=ROOT / "facet_charts.png", help="Output PNG path")
+    args = p.parse_args(sys.argv[1:] if argv is None else argv)
+
+    frames = []
+    for path in args.inputs:
+        if not path.exists():
+            print(f"[warn] Input not found: {path}")
+            continue
+        frames.append(parse_sweeps(path))
+    sweeps = tidy_sweeps(frames, frames[0].attrs if len(frames) == 1 else None)
+    if sweeps.empty:
+        print("[error] No sweep sections in the inputs")
+        return 1
+
+    dims = sweep_dimensions(sweeps)
+    for name in filter(None, [args.x, args.series, args.row, args.col, *parse_where(args.where)]):
+        if name not in dims:
+            print(f"[error] Unknown dimension '{name}'; available: {', '.join(dims)}")
+            return 2
+
+    varying = [d for d in dims if d != "Samples" and sweeps[d].nunique() > 1]
+    folded = [d for d in varying if d not in (args.x, args.series, args.row, args.col, *parse_where(args.where))]
+    print(f"Loaded {len(sweeps)} cells; varying dimensions: {', '.join(varying)}")
+    if folded:
+        print(f"[info] Folded with {args.agg}: {', '.join(folded)}")
+
+    panel = Panel(x=args.x, y=args.y, series=args.series or None, where=parse_where(args.where), kind=args.kind, agg=args.agg)
+    fig = facet_grid(sweeps, panel, row=args.row, col=args.col)
+    fig.savefig(args.out, dpi=200, bbox_inches="tight")
+    print(f"[ok] Saved {args.out.name}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,160 @@
+"""Filesystem backend sweep: heatmaps, scaling curves and saturation (filesystem_sweep.png).
+
+Input is a Cotton.Benchmark run document produced with ``--mode filesystem-sweep``.
+Without an argument the newest one under .temp/benchmark-results or
+performance/results is used.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Optional
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+
+from chart_common import CHUNK_HEX_COLORS, ROOT, detect_saturation, find_latest_run, format_bytes, parse_benchmark_run
+
+SERIES_ORDER = ["Write (buffered)", "Write (fsync)", "Read (cold)", "Read (page cache)"]
+# Reads served from the page cache measure memory, not the device, so they never drive a recommendation.
+CACHED_SERIES = {"Read (page cache)"}
+
+
+def load_sweep(path: Path) -> pd.DataFrame:
+    """Load the sweep rows and label each with its operation/durability series."""
+    df = parse_benchmark_run(path)
+    if df.empty or "BlockSizeBytes" not in df.columns:
+        return pd.DataFrame()
+    df = df.dropna(subset=["BlockSizeBytes", "Concurrency"]).copy()
+    df["Series"] = df["Operation"] + " (" + df["Durability"] + ")"
+    df["BlockSizeBytes"] = df["BlockSizeBytes"].astype(int)
+    df["Concurrency"] = df["Concurrency"].astype(int)
+    return df
+
+
+def recommend(df: pd.DataFrame, saturation: pd.DataFrame, threshold: float = 0.9) -> pd.DataFrame:
+    """Pick the smallest block size (and its knee concurrency) that reaches the device ceiling.
+
+    The device ceiling is the best throughput seen for a series; the recommended
+    chunk size is the smallest block whose curve peaks within ``threshold`` of it,
+    and the recommended parallelism is that curve's knee. Page-cache reads are skipped.
+    """
+    rows = []
+    for series, group in saturation[~saturation["Series"].isin(CACHED_SERIES)].groupby("Series"):
+        ceiling = group["Peak"].max()
+        good = group[group["Peak"] >= ceiling * threshold].sort_values("BlockSizeBytes")
+        pick = good.iloc[0]
+        rows.append({
+            "Series": series,
+            "CeilingMiBps": ceiling,
+            "ChunkSize": format_bytes(pick["BlockSizeBytes"]),
+            "Parallelism": int(pick["Knee"]),
+            "MiBpsAtPick": pick["KneeValue"],
+            "CollapsingCurves": int(group["Collapses"].sum()),
+        })
+    order = {name: i for i, name in enumerate(SERIES_ORDER)}
+    return pd.DataFrame(rows).sort_values("Series", key=lambda s: s.map(order)).reset_index(drop=True)
+
+
+def create_filesystem_sweep_plots(df: pd.DataFrame, saturation: pd.DataFrame, title: str):
+    """Build the 3-row figure: heatmaps, throughput scaling, p99 operation latency."""
+    series = [s for s in SERIES_ORDER if s in set(df["Series"])]
+    blocks = sorted(df["BlockSizeBytes"].unique())
+    concurrency = sorted(df["Concurrency"].unique())
+
+    fig, axes = plt.subplots(3, len(series), figsize=(7 * len(series), 17), squeeze=False)
+    fig.suptitle(title, fontsize=16, fontweight="bold")
+
+    for col, name in enumerate(series):
+        data = df[df["Series"] == name]
+
+        ax = axes[0, col]
+        pivot = data.pivot_table(index="Concurrency", columns="BlockSizeBytes", values="AvgThroughputMBps").reindex(index=concurrency, columns=blocks)
+        im = ax.imshow(pivot.values, cmap="viridis", aspect="auto", origin="lower")
+        ax.set_title(f"{name}: MiB/s", fontsize=13, fontweight="bold")
+        ax.set_xlabel("Object Size")
+        ax.set_ylabel("Concurrent Workers")
+        ax.set_xticks(range(len(blocks)))
+        ax.set_xticklabels([format_bytes(b) for b in blocks])
+        ax.set_yticks(range(len(concurrency)))
+        ax.set_yticklabels([str(c) for c in concurrency])
+        vmax = np.nanmax(pivot.values)
+        for i in range(len(concurrency)):
+            for j in range(len(blocks)):
+                value = pivot.values[i, j]
+                if not np.isnan(value):
+                    ax.text(j, i, f"{value:.0f}", ha="center", va="center", fontsize=8,
+                            color="white" if value < vmax * 0.6 else "black")
+        fig.colorbar(im, ax=ax, shrink=0.8)
+
+        ax = axes[1, col]
+        for i, block in enumerate(blocks):
+            d = data[data["BlockSizeBytes"] == block].sort_values("Concurrency")
+            color = CHUNK_HEX_COLORS[i % len(CHUNK_HEX_COLORS)]
+            ax.plot(d["Concurrency"], d["AvgThroughputMBps"], marker="o", linewidth=2, markersize=6, color=color, label=format_bytes(block))
+            knee = saturation[(saturation["Series"] == name) & (saturation["BlockSizeBytes"] == block)]
+            if not knee.empty:
+                ax.scatter(knee["Knee"], knee["KneeValue"], s=160, facecolors="none", edgecolors=color, linewidths=2, zorder=5)
+        ax.set_xscale("log", base=2)
+        ax.set_xticks(concurrency)
+        ax.set_xticklabels([str(c) for c in concurrency])
+        ax.set_title(f"{name}: Scaling (circles = 90% knee)", fontsize=13, fontweight="bold")
+        ax.set_xlabel("Concurrent Workers")
+        ax.set_ylabel("Throughput (MiB/s)")
+        ax.legend(title="Object Size", fontsize=8)
+        ax.grid(True, alpha=0.3)
+
+        ax = axes[2, col]
+        for i, block in enumerate(blocks):
+            d = data[data["BlockSizeBytes"] == block].sort_values("Concurrency")
+            ax.plot(d["Concurrency"], d["P99OperationLatencyMs"], marker="s", linewidth=2, markersize=6,
+                    color=CHUNK_HEX_COLORS[i % len(CHUNK_HEX_COLORS)], label=format_bytes(block))
+        ax.set_xscale("log", base=2)
+        ax.set_yscale("log")
+        ax.set_xticks(concurrency)
+        ax.set_xticklabels([str(c) for c in concurrency])
+        ax.set_title(f"{name}: p99 Operation Latency", fontsize=13, fontweight="bold")
+        ax.set_xlabel("Concurrent Workers")
+        ax.set_ylabel("Latency (ms, log)")
+        ax.legend(title="Object Size", fontsize=8)
+        ax.grid(True, which="both", alpha=0.3)
+
+    fig.tight_layout(rect=(0, 0, 1, 0.97))
+    return fig
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Parse a filesystem sweep run document, chart it and print the saturation summary."""
+    p = argparse.ArgumentParser(description="Chart a Cotton.Benchmark filesystem-sweep run")
+    p.add_argument("input", nargs="?", type=Path, help="Run document; default: newest filesystem-sweep result")
+    p.add_argument("--out", type=Path, default=ROOT / "filesystem_sweep.png", help="Output PNG path")
+    p.add_argument("--threshold", type=float, default=0.9, help="Fraction of peak that counts as saturated")
+    args = p.parse_args(sys.argv[1:] if argv is None else argv)
+
+    path = args.input or find_latest_run("filesystem-sweep")
+    if path is None or not path.exists():
+        print("[error] No filesystem-sweep run document found; run Cotton.Benchmark with --mode filesystem-sweep")
+        return 1
+
+    df = load_sweep(path)
+    if df.empty:
+        print(f"[error] No filesystem sweep rows in {path}")
+        return 2
+
+    saturation = detect_saturation(df, "Concurrency", "AvgThroughputMBps", ["Series", "BlockSizeBytes"], args.threshold)
+    env = df.attrs.get("environment", {})
+    title = f"Filesystem Backend Sweep: {env.get('cpu', df.attrs.get('hardwareKey', ''))} ({df.attrs.get('gitCommit', '')})"
+    fig = create_filesystem_sweep_plots(df, saturation, title)
+    fig.savefig(args.out, dpi=200, bbox_inches="tight")
+    print(f"[ok] Saved {args.out.name}")
+
+    if CACHED_SERIES & set(df["Series"]):
+        print("[info] Reads were served from the page cache (no eviction on this OS); they are charted but not used for the recommendation")
+    print("\nSaturation per series (smallest object size within 90% of the device ceiling):")
+    print(recommend(df, saturation, args.threshold).to_string(index=False, float_format=lambda v: f"{v:.1f}"))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
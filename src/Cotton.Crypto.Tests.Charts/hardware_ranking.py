@@ -0,0 +1,160 @@
+"""Hardware-normalized efficiency ranking of the committed results (hardware_ranking.png).
+
+Raw MiB/s from performance/results/*.json is divided by the logical and physical
+core counts of each machine, shown relative to a reference machine and, when a
+prices file is given, per dollar. Every stage and every pipeline is ranked on its
+own; pipelines with different keys (synthetic vs chunk upload) are never mixed.
+Physical cores come from the ``environment`` block (Linux runs record them),
+otherwise from KNOWN_CPU_CORES, otherwise they fall back to logical processors.
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Optional
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+
+from chart_common import PERFORMANCE_RESULTS_DEFAULT, ROOT, topology_from_environment
+
+# Core counts for CPUs in the committed results whose runs predate topology recording (or ran on Windows).
+KNOWN_CPU_CORES = {
+    "Celeron(R) CPU J3355": {"physicalCores": 2},
+    "Intel(R) N100": {"physicalCores": 4},
+    "i5-10300H": {"physicalCores": 4},
+    "i5-12450H": {"physicalCores": 8, "performanceCores": 4, "efficiencyCores": 4},
+    "i7-14700F": {"physicalCores": 20, "performanceCores": 8, "efficiencyCores": 12},
+    "i9-13900K": {"physicalCores": 24, "performanceCores": 8, "efficiencyCores": 16},
+    "Xeon(R) E-2236": {"physicalCores": 6},
+}
+VIEWS = {
+    "MiBps": "MiB/s",
+    "PerLogicalCore": "MiB/s per logical core",
+    "PerPhysicalCore": "MiB/s per physical core",
+    "VsReference": "x reference machine",
+    "PerDollar": "MiB/s per $",
+}
+
+
+def machine_cores(environment: dict) -> dict:
+    """Logical/physical core counts for one run plus where the physical count came from."""
+    topology = topology_from_environment(environment)
+    logical = topology.get("logicalProcessors", 0)
+    if "physicalCores" in topology:
+        return {"LogicalCores": logical, "PhysicalCores": topology["physicalCores"], "CoreSource": "recorded"}
+    cpu = environment.get("cpu", "")
+    for pattern, cores in KNOWN_CPU_CORES.items():
+        if pattern in cpu:
+            return {"LogicalCores": logical, "PhysicalCores": cores["physicalCores"], "CoreSource": "known CPU table"}
+    return {"LogicalCores": logical, "PhysicalCores": logical, "CoreSource": "assumed = logical"}
+
+
+def load_results(directory: Path) -> pd.DataFrame:
+    """One row per (machine, stage or pipeline) from the compact result files."""
+    rows = []
+    for path in sorted(directory.glob("*.json")):
+        doc = json.loads(path.read_text(encoding="utf-8-sig"))
+        environment = doc.get("environment") or {}
+        base = {"Hardware": doc.get("hardwareId", path.stem), "Cpu": environment.get("cpu", ""), **machine_cores(environment)}
+        for direction in ("write", "read"):
+            section = doc.get(direction) or {}
+            entries = [(stage, "stage") for stage in section.get("stages", [])]
+            if section.get("pipeline"):
+                entries.append((section["pipeline"], "pipeline"))
+            for entry, kind in entries:
+                rows.append({**base, "Series": f"{direction}.{entry['key']}", "Kind": kind, "MiBps": entry["mibPerSecond"]})
+    return pd.DataFrame(rows)
+
+
+def normalize(results: pd.DataFrame, reference: str, prices: dict[str, float]) -> pd.DataFrame:
+    """Add per-logical-core, per-physical-core, vs-reference and (with prices) per-dollar columns."""
+    df = results.copy()
+    df["PerLogicalCore"] = df["MiBps"] / df["LogicalCores"].replace(0, np.nan)
+    df["PerPhysicalCore"] = df["MiBps"] / df["PhysicalCores"].replace(0, np.nan)
+    ref = df[df["Hardware"] == reference].set_index("Series")["MiBps"]
+    df["VsReference"] = df["MiBps"] / df["Series"].map(ref)
+    df["PerDollar"] = df["MiBps"] / df["Hardware"].map(prices) if prices else np.nan
+    return df
+
+
+def rank(df: pd.DataFrame, view: str, kind: Optional[str] = None) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Hardware x series table of ``view`` and the matching rank table (1 = best per series)."""
+    data = df if kind is None else df[df["Kind"] == kind]
+    table = data.pivot_table(index="Hardware", columns="Series", values=view)
+    ranks = table.rank(ascending=False, method="min")
+    return table, ranks
+
+
+def create_ranking_plots(df: pd.DataFrame, views: list[str], reference: str):
+    """One heatmap per view: machines x series, colored by share of the best machine in each series."""
+    fig, axes = plt.subplots(len(views), 1, figsize=(16, 4.2 * len(views)), squeeze=False)
+    fig.suptitle("Hardware-Normalized Throughput Ranking", fontsize=16, fontweight="bold")
+    for ax, view in zip(axes[:, 0], views):
+        table, ranks = rank(df, view)
+        order = table.rank(ascending=False, pct=True).mean(axis=1).sort_values().index
+        table, ranks = table.loc[order], ranks.loc[order]
+        share = table / table.max()
+        ax.imshow(share.values, cmap="YlGn", aspect="auto", vmin=0, vmax=1)
+        for i in range(table.shape[0]):
+            for j in range(table.shape[1]):
+                value = table.values[i, j]
+                if not np.isnan(value):
+                    text = f"{value:.2f}" if value < 10 else f"{value:.0f}"
+                    ax.text(j, i, f"{text}\n#{int(ranks.values[i, j])}", ha="center", va="center", fontsize=7)
+        ax.set_xticks(range(table.shape[1]))
+        ax.set_xticklabels(table.columns, rotation=30, ha="right", fontsize=8)
+        ax.set_yticks(range(table.shape[0]))
+        ax.set_yticklabels(table.index, fontsize=9)
+        title = VIEWS[view] + (f" ({reference} = 1.0)" if view == "VsReference" else "")
+        ax.set_title(title, fontsize=13, fontweight="bold")
+    fig.tight_layout(rect=(0, 0, 1, 0.97))
+    return fig
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Normalize the committed results, chart the heatmaps and print the per-stage and per-pipeline rankings."""
+    p = argparse.ArgumentParser(description="Rank machines by throughput per core, relative to a reference and per dollar")
+    p.add_argument("--dir", type=Path, default=PERFORMANCE_RESULTS_DEFAULT, help="Directory with compact result files")
+    p.add_argument("--reference", default="intel-n100", help="Hardware id used as 1.0 in the relative view")
+    p.add_argument("--prices", type=Path, help='JSON file mapping hardware id to price, e.g. {"intel-n100": 150}')
+    p.add_argument("--view", choices=list(VIEWS), default="PerPhysicalCore", help="View used for the printed ranking")
+    p.add_argument("--out", type=Path, default=ROOT / "hardware_ranking.png", help="Output PNG path")
+    args = p.parse_args(sys.argv[1:] if argv is None else argv)
+
+    results = load_results(args.dir)
+    if results.empty:
+        print(f"[error] No result files in {args.dir}")
+        return 1
+
+    reference = args.reference
+    if reference not in set(results["Hardware"]):
+        reference = sorted(results["Hardware"].unique())[0]
+        print(f"[warn] Reference {args.reference} not found; using {reference}")
+    prices = json.loads(args.prices.read_text(encoding="utf-8-sig")) if args.prices else {}
+    if args.view == "PerDollar" and not prices:
+        print("[error] --view PerDollar needs --prices")
+        return 2
+
+    df = normalize(results, reference, prices)
+    views = [v for v in VIEWS if v != "PerDollar" or prices]
+    fig = create_ranking_plots(df, views, reference)
+    fig.savefig(args.out, dpi=200, bbox_inches="tight")
+    print(f"[ok] Saved {args.out.name}")
+
+    machines = df.drop_duplicates("Hardware").set_index("Hardware")[["Cpu", "LogicalCores", "PhysicalCores", "CoreSource"]]
+    print("\nMachines:")
+    print(machines.to_string())
+    for kind, title in (("stage", "Stages"), ("pipeline", "Pipelines")):
+        table, ranks = rank(df, args.view, kind)
+        print(f"\n{title} ranked by {VIEWS[args.view]} (#1 = best):")
+        for series in table.columns:
+            ordered = table[series].dropna().sort_values(ascending=False)
+            print(f"  {series}: " + ", ".join(f"#{int(ranks.loc[h, series])} {h} {v:.3g}" for h, v in ordered.items()))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
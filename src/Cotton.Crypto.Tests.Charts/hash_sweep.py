@@ -0,0 +1,224 @@
+"""SHA-256 hashing sweep: per-chunk parallel scaling vs the OpenSSL baseline (hash_sweep.png).
+
+Input is a Cotton.Benchmark run document produced with ``--mode hash-sweep``.
+Without an argument the newest one under .temp/benchmark-results or
+performance/results is used. The OpenSSL baseline is ``openssl speed -evp sha256``
+output (default ``input-openssl-sha256.txt``); without it the charts omit it.
+
+Each cell hashes many chunks of one size, a fixed number at a time, each with its
+own IncrementalHash as the upload path does. Speedup is relative to hashing one
+chunk at a time with the same chunk size, and efficiency is that speedup over the
+host's core budget; a chunk size whose curve flattens before the core budget runs
+out stalls on something other than the cores (memory bandwidth, per-chunk setup).
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Optional
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+
+from chart_common import (
+    CHUNK_HEX_COLORS,
+    OPENSSL_SHA256_INPUT_DEFAULT,
+    ROOT,
+    core_budget,
+    core_budget_label,
+    detect_saturation,
+    find_latest_run,
+    format_bytes,
+    mark_topology_knees,
+    parse_benchmark_run,
+    parse_openssl_results,
+    topology_from_environment,
+)
+
+# openssl speed reports decimal MB/s; the benchmark reports MiB/s.
+MB_TO_MIB = 1_000_000 / (1024 * 1024)
+# Efficiency below this share of the core budget counts as a stall.
+STALL_EFFICIENCY = 0.7
+
+
+def load_sweep(path: Path) -> pd.DataFrame:
+    """Load the sweep rows with integer chunk sizes and concurrency."""
+    df = parse_benchmark_run(path)
+    if df.empty or "ChunkSizeBytes" not in df.columns:
+        return pd.DataFrame()
+    df = df.dropna(subset=["ChunkSizeBytes", "Concurrency"]).copy()
+    df["ChunkSizeBytes"] = df["ChunkSizeBytes"].astype(int)
+    df["Concurrency"] = df["Concurrency"].astype(int)
+    return df
+
+
+def with_scaling(df: pd.DataFrame, topology: dict) -> pd.DataFrame:
+    """Add Speedup (vs one chunk at a time, same chunk size) and Efficiency (speedup / core budget)."""
+    df = df.copy()
+    single = df[df["Concurrency"] == 1].set_index("ChunkSizeBytes")["AvgThroughputMBps"]
+    df["Speedup"] = df["AvgThroughputMBps"] / df["ChunkSizeBytes"].map(single)
+    df["Efficiency"] = df["Speedup"] / df["Concurrency"].map(lambda c: core_budget(c, topology))
+    return df
+
+
+def summarize(df: pd.DataFrame, openssl: pd.DataFrame) -> pd.DataFrame:
+    """Per chunk size: single-chunk rate vs OpenSSL, the saturation knee, and the concurrency where scaling stalls."""
+    saturation = detect_saturation(df, x="Concurrency", y="AvgThroughputMBps", by=["ChunkSizeBytes"])
+    openssl_peak = openssl["ThroughputMBps"].max() * MB_TO_MIB if not openssl.empty else np.nan
+    rows = []
+    for _, sat in saturation.iterrows():
+        data = df[df["ChunkSizeBytes"] == sat["ChunkSizeBytes"]].sort_values("Concurrency")
+        single = data[data["Concurrency"] == 1]["AvgThroughputMBps"]
+        stalled = data[data["Efficiency"] < STALL_EFFICIENCY]
+        rows.append({
+            "ChunkSizeBytes": sat["ChunkSizeBytes"],
+            "SingleMiBps": single.iloc[0] if not single.empty else np.nan,
+            "VsOpenSSL": single.iloc[0] / openssl_peak if not single.empty else np.nan,
+            "PeakMiBps": sat["Peak"],
+            "PeakAt": int(sat["PeakAt"]),
+            "Knee": int(sat["Knee"]),
+            "StallsAt": int(stalled["Concurrency"].iloc[0]) if not stalled.empty else None,
+            "Collapses": sat["Collapses"],
+            "P99UsAtKnee": data[data["Concurrency"] == sat["Knee"]]["P99ChunkLatencyUs"].iloc[0],
+        })
+    return pd.DataFrame(rows)
+
+
+def recommend(summary: pd.DataFrame, threshold: float = 0.9) -> pd.Series:
+    """Smallest chunk size whose peak aggregate hashing rate is within ``threshold`` of the best one."""
+    ceiling = summary["PeakMiBps"].max()
+    return summary[summary["PeakMiBps"] >= ceiling * threshold].sort_values("ChunkSizeBytes").iloc[0]
+
+
+def create_hash_sweep_plots(df: pd.DataFrame, openssl: pd.DataFrame, topology: dict, title: str):
+    """Build the 2x2 figure: aggregate scaling, single-chunk rate vs OpenSSL, efficiency heatmap, p99 chunk latency."""
+    chunks = sorted(df["ChunkSizeBytes"].unique())
+    concurrency = sorted(df["Concurrency"].unique())
+    fig, axes = plt.subplots(2, 2, figsize=(18, 14))
+    fig.suptitle(title, fontsize=16, fontweight="bold")
+
+    ax = axes[0, 0]
+    for i, chunk in enumerate(chunks):
+        data = df[df["ChunkSizeBytes"] == chunk].sort_values("Concurrency")
+        ax.plot(data["Concurrency"], data["AvgThroughputMBps"], marker="o", linewidth=2,
+                color=CHUNK_HEX_COLORS[i % len(CHUNK_HEX_COLORS)], label=format_bytes(chunk))
+    best_single = df[df["Concurrency"] == 1]["AvgThroughputMBps"].max()
+    ax.plot(concurrency, [best_single * core_budget(c, topology) for c in concurrency], color="black", linestyle="--",
+            linewidth=1.5, label=core_budget_label(topology))
+    if not openssl.empty:
+        ax.axhline(openssl["ThroughputMBps"].max() * MB_TO_MIB, color="gray", linestyle=":", linewidth=1.5,
+                   label="OpenSSL sha256, one core")
+    mark_topology_knees(ax, topology, max(concurrency))
+    ax.set_title("Aggregate SHA-256 Throughput", fontsize=13, fontweight="bold")
+    ax.set_xlabel("Concurrently Hashed Chunks")
+    ax.set_ylabel("MiB/s (log)")
+    ax.set_yscale("log")
+    ax.legend(fontsize=8, title="Chunk size")
+
+    ax = axes[0, 1]
+    single = df[df["Concurrency"] == 1].sort_values("ChunkSizeBytes")
+    ax.plot(single["ChunkSizeBytes"], single["AvgThroughputMBps"], marker="o", linewidth=2, color="#1f77b4",
+            label="IncrementalHash, one chunk at a time")
+    if not openssl.empty:
+        ax.plot(openssl["BlockBytes"], openssl["ThroughputMBps"] * MB_TO_MIB, marker="s", linewidth=2, color="gray",
+                label="openssl speed -evp sha256")
+    ax.set_xscale("log", base=2)
+    ticks = sorted(set(chunks) | set(openssl["BlockBytes"] if not openssl.empty else []))
+    ax.set_xticks(ticks)
+    ax.set_xticklabels([format_bytes(t) for t in ticks], rotation=45)
+    ax.set_title("Single-core SHA-256 vs OpenSSL", fontsize=13, fontweight="bold")
+    ax.set_xlabel("Chunk / Block Size")
+    ax.set_ylabel("MiB/s")
+    ax.legend(fontsize=8)
+
+    ax = axes[1, 0]
+    pivot = df.pivot_table(index="Concurrency", columns="ChunkSizeBytes", values="Efficiency").reindex(index=concurrency, columns=chunks)
+    im = ax.imshow(pivot.values * 100, cmap="RdYlGn", vmin=0, vmax=100, aspect="auto", origin="lower")
+    for i in range(len(concurrency)):
+        for j in range(len(chunks)):
+            value = pivot.values[i, j]
+            if not np.isnan(value):
+                ax.text(j, i, f"{value * 100:.0f}", ha="center", va="center", fontsize=8)
+    ax.set_xticks(range(len(chunks)))
+    ax.set_xticklabels([format_bytes(c) for c in chunks])
+    ax.set_yticks(range(len(concurrency)))
+    ax.set_yticklabels([str(c) for c in concurrency])
+    ax.set_title(f"Scaling Efficiency vs Core Budget (%; stall < {STALL_EFFICIENCY:.0%})", fontsize=13, fontweight="bold")
+    ax.set_xlabel("Chunk Size")
+    ax.set_ylabel("Concurrently Hashed Chunks")
+    fig.colorbar(im, ax=ax, shrink=0.8)
+
+    ax = axes[1, 1]
+    for i, chunk in enumerate(chunks):
+        data = df[df["ChunkSizeBytes"] == chunk].sort_values("Concurrency")
+        ax.plot(data["Concurrency"], data["P99ChunkLatencyUs"] / 1000, marker="o", linewidth=2,
+                color=CHUNK_HEX_COLORS[i % len(CHUNK_HEX_COLORS)], label=format_bytes(chunk))
+    mark_topology_knees(ax, topology, max(concurrency))
+    ax.set_title("p99 Time to Hash One Chunk", fontsize=13, fontweight="bold")
+    ax.set_xlabel("Concurrently Hashed Chunks")
+    ax.set_ylabel("ms (log)")
+    ax.set_yscale("log")
+    ax.legend(fontsize=8, title="Chunk size")
+
+    for ax in (axes[0, 0], axes[1, 1]):
+        ax.set_xscale("log", base=2)
+        ax.set_xticks(concurrency)
+        ax.set_xticklabels([str(c) for c in concurrency])
+    for ax in (axes[0, 0], axes[0, 1], axes[1, 1]):
+        ax.grid(True, which="both", alpha=0.3)
+
+    fig.tight_layout(rect=(0, 0, 1, 0.96))
+    return fig
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Chart a hash-sweep run against the OpenSSL sha256 baseline and print where per-chunk hashing stalls."""
+    p = argparse.ArgumentParser(description="Chart a Cotton.Benchmark hash-sweep run")
+    p.add_argument("input", nargs="?", type=Path, help="Run document; default: newest hash-sweep result")
+    p.add_argument("--openssl", type=Path, default=OPENSSL_SHA256_INPUT_DEFAULT, help="openssl speed -evp sha256 output")
+    p.add_argument("--threshold", type=float, default=0.9, help="Share of the best peak a recommended chunk size must reach")
+    p.add_argument("--out", type=Path, default=ROOT / "hash_sweep.png", help="Output PNG path")
+    args = p.parse_args(sys.argv[1:] if argv is None else argv)
+
+    path = args.input or find_latest_run("hash-sweep")
+    if path is None or not path.exists():
+        print("[error] No hash-sweep run document found; run Cotton.Benchmark with --mode hash-sweep")
+        return 1
+
+    df = load_sweep(path)
+    if df.empty:
+        print(f"[error] No hash sweep rows in {path}")
+        return 2
+
+    openssl = parse_openssl_results(args.openssl, "sha256") if args.openssl.exists() else pd.DataFrame(columns=["BlockBytes", "ThroughputMBps"])
+    if openssl.empty:
+        print(f"[info] No OpenSSL sha256 baseline in {args.openssl}; charting without it")
+
+    env = df.attrs.get("environment", {})
+    topology = topology_from_environment(env)
+    df = with_scaling(df, topology)
+    title = f"SHA-256 Chunk Hashing: {env.get('cpu', df.attrs.get('hardwareKey', ''))} ({df.attrs.get('gitCommit', '')})"
+    fig = create_hash_sweep_plots(df, openssl, topology, title)
+    fig.savefig(args.out, dpi=200, bbox_inches="tight")
+    print(f"[ok] Saved {args.out.name}")
+
+    summary = summarize(df, openssl)
+    table = summary.copy()
+    table["ChunkSizeBytes"] = table["ChunkSizeBytes"].map(format_bytes)
+    table["StallsAt"] = table["StallsAt"].map(lambda v: "-" if pd.isna(v) else str(int(v)))
+    print("\nPer chunk size (VsOpenSSL = one chunk at a time / best openssl sha256 block rate):")
+    print(table.to_string(index=False, float_format=lambda v: f"{v:.2f}"))
+
+    pick = recommend(summary, args.threshold)
+    smaller = "smaller dedup chunks pay extra per-chunk hashing cost" if pick["ChunkSizeBytes"] > summary["ChunkSizeBytes"].min() \
+        else "hashing does not penalize any chunk size in the sweep"
+    print(f"\n[info] Chunks of {format_bytes(pick['ChunkSizeBytes'])} and larger hash at {args.threshold:.0%} or more of the best "
+          f"aggregate rate ({pick['PeakMiBps']:.0f} MiB/s with {pick['Knee']} chunks in flight); {smaller}")
+    for _, row in summary[summary["Collapses"]].iterrows():
+        print(f"[warn] {format_bytes(row['ChunkSizeBytes'])}: throughput drops past {row['PeakAt']} concurrent chunks")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
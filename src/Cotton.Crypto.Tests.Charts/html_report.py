@@ -0,0 +1,331 @@
+"""Self-contained interactive HTML report (performance_report.html).
+
+Sweep tables from PerformanceTests output and the benchmark history are packed
+into one HTML file: every series is stored column-wise as base64 typed arrays
+(x as Float64, y as Float32) and long series are downsampled with LTTB before
+embedding, so the file stays small with hundreds of thousands of history
+points. The page draws on canvas with plain JavaScript and needs no server and
+no network: hover shows the nearest point, drag or wheel zooms the x axis,
+double-click resets and clicking a legend entry toggles the series.
+"""
+
+import argparse
+import base64
+import html
+import json
+import sys
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from benchmark_history import load_directories, load_git_history
+from chart_common import MYLIB_INPUT_DEFAULT, ROOT, SWEEP_SECTIONS, THREAD_HEX_COLORS, lttb_indices, parse_sweeps, select, tidy_sweeps
+
+PALETTE = THREAD_HEX_COLORS + ["#e377c2", "#7f7f7f", "#bcbd22", "#17becf"]
+
+
+def encode_series(name: str, x, y, max_points: int) -> dict:
+    """Columnar, base64-encoded series; downsampled with LTTB above ``max_points``."""
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    valid = ~(np.isnan(x) | np.isnan(y))
+    x, y = x[valid], y[valid]
+    order = np.argsort(x, kind="stable")
+    x, y = x[order], y[order]
+    keep = lttb_indices(x, y, max_points)
+    return {
+        "name": name,
+        "n": len(x),
+        "x": base64.b64encode(x[keep].astype("<f8").tobytes()).decode("ascii"),
+        "y": base64.b64encode(y[keep].astype("<f4").tobytes()).decode("ascii"),
+    }
+
+
+def sweep_panels(sweeps: pd.DataFrame, max_points: int) -> list[dict]:
+    """Throughput vs chunk size per op of tidy sweeps, one series per (host,) thread count."""
+    panels = []
+    several_hosts = sweeps["Host"].nunique() > 1
+    for op in SWEEP_SECTIONS:
+        series = []
+        for (host, threads), d in select(sweeps, {"Op": op}).groupby(["Host", "Threads"], sort=True):
+            prefix = f"{host}: " if several_hosts else ""
+            series.append(encode_series(f"{prefix}{threads} threads", d["ChunkMB"], d["Throughput"], max_points))
+        if series:
+            panels.append({"title": f"{op}: Throughput vs Chunk Size", "xLabel": "Chunk Size (MB)", "yLabel": "MB/s",
+                           "xScale": "log", "series": series})
+    return panels
+
+
+def history_panels(history: pd.DataFrame, max_points: int) -> list[dict]:
+    """Benchmark history over time, one panel per stage and one series per hardware id."""
+    panels = []
+    times = pd.to_datetime(history["CreatedAtUtc"], utc=True, errors="coerce")
+    history = history.assign(Time=(times - pd.Timestamp(0, tz="UTC")) // pd.Timedelta(milliseconds=1))
+    for name, data in history.dropna(subset=["Time"]).groupby("Series", sort=True):
+        series = [encode_series(hardware, d["Time"], d["Value"], max_points) for hardware, d in data.groupby("Hardware", sort=True)]
+        panels.append({"title": f"History: {name}", "xLabel": "Run time (UTC)", "yLabel": "MiB/s", "xScale": "time", "series": series})
+    return panels
+
+
+def render_report(title: str, panels: list[dict]) -> str:
+    """Fill the HTML template with the panels; JSON is escaped so it cannot close the script tag."""
+    data = json.dumps({"palette": PALETTE, "panels": panels}, separators=(",", ":")).replace("</", "<\\/")
+    return HTML_TEMPLATE.replace("__TITLE__", html.escape(title)).replace("__DATA__", data)
+
+
+HTML_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>__TITLE__</title>
+<style>
+body { font-family: system-ui, sans-serif; margin: 16px; color: #222; }
+h1 { font-size: 20px; }
+.panel { border: 1px solid #ddd; border-radius: 6px; padding: 8px 12px; margin-bottom: 16px; position: relative; }
+.panel h2 { font-size: 15px; margin: 4px 0; }
+.panel canvas { width: 100%; height: 340px; display: block; cursor: crosshair; }
+.legend span { display: inline-block; margin: 2px 10px 2px 0; font-size: 12px; cursor: pointer; user-select: none; }
+.legend span.off { opacity: 0.3; text-decoration: line-through; }
+.legend i { display: inline-block; width: 12px; height: 3px; margin-right: 4px; vertical-align: middle; }
+.tip { position: absolute; pointer-events: none; background: rgba(255,255,255,0.95); border: 1px solid #999;
+       padding: 3px 6px; font-size: 12px; display: none; white-space: nowrap; }
+.note { font-size: 12px; color: #666; }
+</style>
+</head>
+<body>
+<h1>__TITLE__</h1>
+<p class="note">Hover for values, drag or scroll to zoom the x axis, double-click to reset, click a legend entry to toggle it.</p>
+<div id="panels"></div>
+<script id="data" type="application/json">__DATA__</script>
+<script>
+"use strict";
+const report = JSON.parse(document.getElementById("data").textContent);
+
+function decode(b64, Type) {
+  const bytes = Uint8Array.from(atob(b64), c => c.charCodeAt(0));
+  return new Type(bytes.buffer);
+}
+
+function fmt(v) {
+  const a = Math.abs(v);
+  return a >= 1000 ? v.toFixed(0) : a >= 10 ? v.toFixed(1) : a >= 0.1 ? v.toFixed(2) : v.toPrecision(2);
+}
+
+function fmtX(panel, v) {
+  return panel.xScale === "time" ? new Date(v).toISOString().slice(0, 16).replace("T", " ") : fmt(v);
+}
+
+function ticks(lo, hi, scale) {
+  if (scale === "log") {
+    const out = [];
+    for (let e = Math.floor(Math.log2(lo)); e <= Math.ceil(Math.log2(hi)); e++) {
+      const v = Math.pow(2, e);
+      if (v >= lo && v <= hi) out.push(v);
+    }
+    return out;
+  }
+  const step0 = (hi - lo) / 6 || 1;
+  const mag = Math.pow(10, Math.floor(Math.log10(step0)));
+  const step = [1, 2, 5, 10].map(m => m * mag).find(s => s >= step0);
+  const out = [];
+  for (let v = Math.ceil(lo / step) * step; v <= hi; v += step) out.push(v);
+  return out;
+}
+
+function makePanel(panel, index) {
+  const root = document.createElement("div");
+  root.className = "panel";
+  root.innerHTML = "<h2></h2><canvas></canvas><div class='legend'></div><div class='tip'></div>";
+  root.querySelector("h2").textContent = panel.title;
+  document.getElementById("panels").appendChild(root);
+  const canvas = root.querySelector("canvas"), tip = root.querySelector(".tip"), legend = root.querySelector(".legend");
+  const series = panel.series.map((s, i) => ({
+    name: s.name, n: s.n, x: decode(s.x, Float64Array), y: decode(s.y, Float32Array),
+    color: report.palette[i % report.palette.length], on: true,
+  }));
+  const log = panel.xScale === "log";
+  const tx = v => (log ? Math.log2(v) : v);
+  let full = [Infinity, -Infinity];
+  series.forEach(s => { if (s.x.length) { full[0] = Math.min(full[0], s.x[0]); full[1] = Math.max(full[1], s.x[s.x.length - 1]); } });
+  if (full[0] === full[1]) { full = [full[0] - 1, full[1] + 1]; }
+  let view = full.slice(), drag = null, box = null;
+  const pad = { l: 64, r: 16, t: 10, b: 36 };
+
+  series.forEach(s => {
+    const item = document.createElement("span");
+    item.innerHTML = "<i></i>";
+    item.querySelector("i").style.background = s.color;
+    item.appendChild(document.createTextNode(s.name + (s.n > s.x.length ? " (" + s.x.length + "/" + s.n + " pts)" : "")));
+    item.onclick = () => { s.on = !s.on; item.classList.toggle("off", !s.on); draw(); };
+    legend.appendChild(item);
+  });
+
+  function layout() {
+    const w = canvas.clientWidth, h = canvas.clientHeight, dpr = window.devicePixelRatio || 1;
+    if (canvas.width !== w * dpr || canvas.height !== h * dpr) { canvas.width = w * dpr; canvas.height = h * dpr; }
+    return { w, h, dpr };
+  }
+
+  function yRange() {
+    let lo = Infinity, hi = -Infinity;
+    series.forEach(s => {
+      if (!s.on) return;
+      for (let i = 0; i < s.x.length; i++) {
+        if (s.x[i] >= view[0] && s.x[i] <= view[1]) { lo = Math.min(lo, s.y[i]); hi = Math.max(hi, s.y[i]); }
+      }
+    });
+    if (!isFinite(lo)) return [0, 1];
+    lo = Math.min(0, lo);
+    return [lo, hi + (hi - lo) * 0.05 || 1];
+  }
+
+  function scales(w, h) {
+    const [y0, y1] = yRange();
+    const sx = v => pad.l + (tx(v) - tx(view[0])) / (tx(view[1]) - tx(view[0])) * (w - pad.l - pad.r);
+    const sy = v => h - pad.b - (v - y0) / (y1 - y0) * (h - pad.t - pad.b);
+    const ix = px => {
+      const t = tx(view[0]) + (px - pad.l) / (w - pad.l - pad.r) * (tx(view[1]) - tx(view[0]));
+      return log ? Math.pow(2, t) : t;
+    };
+    return { sx, sy, ix, y0, y1 };
+  }
+
+  function draw(hover) {
+    const { w, h, dpr } = layout();
+    const ctx = canvas.getContext("2d");
+    ctx.setTransform(dpr, 0, 0, dpr, 0, 0);
+    ctx.clearRect(0, 0, w, h);
+    const { sx, sy, y0, y1 } = scales(w, h);
+    ctx.font = "11px system-ui, sans-serif";
+    ctx.strokeStyle = "#eee"; ctx.fillStyle = "#555"; ctx.lineWidth = 1;
+    ticks(view[0], view[1], panel.xScale).forEach(v => {
+      const x = sx(v);
+      ctx.beginPath(); ctx.moveTo(x, pad.t); ctx.lineTo(x, h - pad.b); ctx.stroke();
+      ctx.textAlign = "center"; ctx.fillText(fmtX(panel, v), x, h - pad.b + 14);
+    });
+    ticks(y0, y1, "linear").forEach(v => {
+      const y = sy(v);
+      ctx.beginPath(); ctx.moveTo(pad.l, y); ctx.lineTo(w - pad.r, y); ctx.stroke();
+      ctx.textAlign = "right"; ctx.fillText(fmt(v), pad.l - 6, y + 4);
+    });
+    ctx.textAlign = "center";
+    ctx.fillText(panel.xLabel, (pad.l + w - pad.r) / 2, h - 4);
+    ctx.save(); ctx.translate(12, (pad.t + h - pad.b) / 2); ctx.rotate(-Math.PI / 2); ctx.fillText(panel.yLabel, 0, 0); ctx.restore();
+    ctx.save();
+    ctx.beginPath(); ctx.rect(pad.l, pad.t, w - pad.l - pad.r, h - pad.t - pad.b); ctx.clip();
+    series.forEach(s => {
+      if (!s.on) return;
+      ctx.strokeStyle = s.color; ctx.fillStyle = s.color; ctx.lineWidth = 1.5;
+      ctx.beginPath();
+      for (let i = 0; i < s.x.length; i++) { const x = sx(s.x[i]), y = sy(s.y[i]); i ? ctx.lineTo(x, y) : ctx.moveTo(x, y); }
+      ctx.stroke();
+      if (s.x.length <= 200) {
+        for (let i = 0; i < s.x.length; i++) { ctx.beginPath(); ctx.arc(sx(s.x[i]), sy(s.y[i]), 2.5, 0, 2 * Math.PI); ctx.fill(); }
+      }
+    });
+    if (hover) {
+      ctx.strokeStyle = "#000"; ctx.beginPath(); ctx.arc(hover.px, hover.py, 5, 0, 2 * Math.PI); ctx.stroke();
+    }
+    if (box) {
+      ctx.fillStyle = "rgba(31,119,180,0.15)";
+      ctx.fillRect(Math.min(box[0], box[1]), pad.t, Math.abs(box[1] - box[0]), h - pad.t - pad.b);
+    }
+    ctx.restore();
+  }
+
+  function nearest(px, py) {
+    const { w, h } = layout();
+    const { sx, sy, ix } = scales(w, h);
+    const xv = ix(px);
+    let best = null;
+    series.forEach(s => {
+      if (!s.on || !s.x.length) return;
+      let lo = 0, hi = s.x.length - 1;
+      while (lo < hi) { const mid = (lo + hi) >> 1; s.x[mid] < xv ? (lo = mid + 1) : (hi = mid); }
+      for (const i of [lo - 1, lo]) {
+        if (i < 0) continue;
+        const d = Math.hypot(sx(s.x[i]) - px, sy(s.y[i]) - py);
+        if (!best || d < best.d) best = { d, s, i, px: sx(s.x[i]), py: sy(s.y[i]) };
+      }
+    });
+    return best && best.d < 40 ? best : null;
+  }
+
+  canvas.addEventListener("mousemove", e => {
+    const r = canvas.getBoundingClientRect(), px = e.clientX - r.left, py = e.clientY - r.top;
+    if (drag !== null) { box = [drag, px]; draw(); return; }
+    const hit = nearest(px, py);
+    if (!hit) { tip.style.display = "none"; draw(); return; }
+    tip.textContent = hit.s.name + ": " + fmtX(panel, hit.s.x[hit.i]) + " → " + fmt(hit.s.y[hit.i]) + " " + panel.yLabel;
+    tip.style.display = "block";
+    tip.style.left = (canvas.offsetLeft + hit.px + 10) + "px";
+    tip.style.top = (canvas.offsetTop + hit.py - 24) + "px";
+    draw(hit);
+  });
+  canvas.addEventListener("mouseleave", () => { tip.style.display = "none"; drag = null; box = null; draw(); });
+  canvas.addEventListener("mousedown", e => { drag = e.clientX - canvas.getBoundingClientRect().left; });
+  canvas.addEventListener("mouseup", () => {
+    if (box && Math.abs(box[1] - box[0]) > 4) {
+      const { w, h } = layout();
+      const { ix } = scales(w, h);
+      view = [ix(Math.min(box[0], box[1])), ix(Math.max(box[0], box[1]))];
+    }
+    drag = null; box = null; draw();
+  });
+  canvas.addEventListener("wheel", e => {
+    e.preventDefault();
+    const { w, h } = layout();
+    const { ix } = scales(w, h);
+    const at = tx(ix(e.clientX - canvas.getBoundingClientRect().left)), k = e.deltaY > 0 ? 1.25 : 0.8;
+    let lo = at - (at - tx(view[0])) * k, hi = at + (tx(view[1]) - at) * k;
+    lo = Math.max(lo, tx(full[0])); hi = Math.min(hi, tx(full[1]));
+    view = log ? [Math.pow(2, lo), Math.pow(2, hi)] : [lo, hi];
+    draw();
+  }, { passive: false });
+  canvas.addEventListener("dblclick", () => { view = full.slice(); draw(); });
+  window.addEventListener("resize", () => draw());
+  draw();
+}
+
+report.panels.forEach(makePanel);
+</script>
+</body>
+</html>
+"""
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Collect the sweeps and the benchmark history and write the HTML report."""
+    p = argparse.ArgumentParser(description="Write a self-contained interactive HTML performance report")
+    p.add_argument("--sweeps", type=Path, nargs="*", default=[MYLIB_INPUT_DEFAULT], help="PerformanceTests outputs (several are overlaid)")
+    p.add_argument("--history", action="store_true", help="Add benchmark history from git (performance/results)")
+    p.add_argument("--history-dir", type=Path, action="append", help="Add benchmark history from result directories instead of git")
+    p.add_argument("--max-points", type=int, default=2000, help="Downsample each series to at most this many points (LTTB)")
+    p.add_argument("--title", default="Cotton Performance Report", help="Report title")
+    p.add_argument("--out", type=Path, default=ROOT / "performance_report.html", help="Output HTML path")
+    args = p.parse_args(sys.argv[1:] if argv is None else argv)
+
+    sweeps = [path for path in args.sweeps if path.exists()]
+    for path in set(args.sweeps) - set(sweeps):
+        print(f"[warn] Sweep input not found: {path}")
+    panels = sweep_panels(tidy_sweeps([parse_sweeps(path) for path in sweeps]), args.max_points)
+
+    if args.history or args.history_dir:
+        history = load_directories(args.history_dir) if args.history_dir else load_git_history()
+        print(f"Loaded {len(history)} history points")
+        panels += history_panels(history, args.max_points)
+
+    if not panels:
+        print("[error] Nothing to report: no sweep sections and no history")
+        return 1
+
+    args.out.write_text(render_report(args.title, panels), encoding="utf-8")
+    points = sum(s["n"] for panel in panels for s in panel["series"])
+    print(f"[ok] Saved {args.out.name}: {len(panels)} panels, {points} points, {args.out.stat().st_size / 1024:.0f} KiB")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,10 +1,14 @@
 """Generate the 12-panel mega analysis figure (mega_performance_analysis.png)."""
 
+import argparse
+import sys
 import traceback
+from pathlib import Path
+from typing import Optional
 
 import matplotlib.pyplot as plt
 
-from chart_common import create_mega_analysis, parse_test_results
+from chart_common import MYLIB_INPUT_DEFAULT, ROOT, create_mega_analysis, parse_sweeps, select
 
 
 def print_mega_summary(encrypt_data, decrypt_data, encrypt_best, decrypt_best) -> None:
@@ -58,28 +62,34 @@ def print_mega_summary(encrypt_data, decrypt_data, encrypt_best, decrypt_best) -
     print("\n" + "=" * 70)
 
 
-def main() -> None:
-    """Parse input.txt, build the 12-panel figure and save it."""
+def main(argv: Optional[list[str]] = None) -> None:
+    """Parse the sweep log, build the 12-panel figure and save it."""
+    p = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    p.add_argument("input", nargs="?", type=Path, default=MYLIB_INPUT_DEFAULT, help="PerformanceTests output")
+    p.add_argument("--out", type=Path, default=ROOT / "mega_performance_analysis.png", help="Output PNG path")
+    args = p.parse_args(sys.argv[1:] if argv is None else argv)
+
     try:
-        encrypt_data, decrypt_data = parse_test_results("input.txt")
+        sweeps = parse_sweeps(args.input)
+        encrypt_data, decrypt_data = select(sweeps, {"Op": "Encrypt"}), select(sweeps, {"Op": "Decrypt"})
 
         if encrypt_data.empty or decrypt_data.empty:
-            print("Error: failed to find data in input.txt")
+            print(f"Error: failed to find data in {args.input}")
             return
 
         print("🎯 Data loaded for MEGA analysis:")
         print(f"   Encryption: {len(encrypt_data)} records")
         print(f"   Decryption: {len(decrypt_data)} records")
 
-        fig, encrypt_optimal, decrypt_optimal = create_mega_analysis(encrypt_data, decrypt_data)
-        fig.savefig("mega_performance_analysis.png", dpi=300, bbox_inches="tight")
-        print("\n💾 MEGA analysis saved to mega_performance_analysis.png")
+        fig, encrypt_optimal, decrypt_optimal = create_mega_analysis(sweeps)
+        fig.savefig(args.out, dpi=300, bbox_inches="tight")
+        print(f"\n💾 MEGA analysis saved to {args.out}")
 
         print_mega_summary(encrypt_data, decrypt_data, encrypt_optimal, decrypt_optimal)
         plt.show()
 
     except FileNotFoundError:
-        print("❌ Error: file 'input.txt' not found")
+        print(f"❌ Error: file '{args.input}' not found")
     except Exception as e:
         print(f"❌ Error: {e}")
         traceback.print_exc()
@@ -0,0 +1,180 @@
+"""Allocation and GC pressure per benchmark, with a regression check (memory_pressure.png).
+
+Input is a Cotton.Benchmark run document (any mode). Allocations are shown per
+MiB processed and GC collections per GiB processed, so runs with different
+profiles stay comparable. With ``--baseline`` the same gates as the benchmark's
+regression comparer are applied to allocation per MiB, Gen2 collections per GiB
+and peak working set; older run documents without ``AllocatedBytesPerMiB`` or
+``Gen2CollectionsPerGiB`` fall back to values derived from the data size.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Optional
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+
+from chart_common import ROOT, find_latest_run, format_bytes, parse_benchmark_run
+
+MIB = 1024 * 1024
+GEN_COLORS = {"Gen0Collections": "#a6cee3", "Gen1Collections": "#1f78b4", "Gen2Collections": "#e31a1c"}
+# Mirrors BenchmarkRegressionComparer: a metric regresses when it grows past ratio x baseline and by more than the grace.
+REGRESSION_RATIO = 1.20
+REGRESSION_GRACE = {
+    "AllocatedBytesPerMiB": 16 * 1024,
+    "Gen2PerGiB": 2,
+    "MaxPeakWorkingSetBytes": 16 * MIB,
+}
+# A quick run processes 48 MiB, so one stray full collection is already ~21 per GiB.
+QUICK_GEN2_GRACE_PER_GIB = 32
+
+
+def load_memory(path: Path) -> pd.DataFrame:
+    """Load one row per benchmark with allocation per MiB, GC counts per GiB and peak working set."""
+    df = parse_benchmark_run(path)
+    if df.empty or "AvgManagedAllocatedBytes" not in df.columns:
+        return pd.DataFrame()
+    df = df.set_index("Name")
+    processed_mib = df["DataSizeBytes"] * df.get("Iterations", 1) / MIB
+    if "AllocatedBytesPerMiB" not in df.columns:
+        df["AllocatedBytesPerMiB"] = np.nan
+    df["AllocatedBytesPerMiB"] = df["AllocatedBytesPerMiB"].fillna(df["AvgManagedAllocatedBytes"] * df.get("Iterations", 1) / processed_mib)
+    for column in GEN_COLORS:
+        if column not in df.columns:
+            df[column] = np.nan
+        df[column.replace("Collections", "PerGiB")] = df[column] * 1024 / processed_mib
+    if "Gen2CollectionsPerGiB" in df.columns:
+        df["Gen2PerGiB"] = df["Gen2CollectionsPerGiB"].fillna(df["Gen2PerGiB"])
+    return df
+
+
+def check_regressions(baseline: pd.DataFrame, candidate: pd.DataFrame, ratio: float = REGRESSION_RATIO) -> pd.DataFrame:
+    """Compare the gated metrics of benchmarks present in both runs; one row per metric and benchmark."""
+    graces = dict(REGRESSION_GRACE)
+    if str(candidate.attrs.get("profile") or "").lower() == "quick":
+        graces["Gen2PerGiB"] = QUICK_GEN2_GRACE_PER_GIB
+    rows = []
+    for name in candidate.index.intersection(baseline.index):
+        for metric, grace in graces.items():
+            base, cand = baseline.at[name, metric], candidate.at[name, metric]
+            if pd.isna(base) or pd.isna(cand):
+                continue
+            rows.append({
+                "Benchmark": name,
+                "Metric": metric,
+                "Baseline": base,
+                "Candidate": cand,
+                "Regressed": bool(cand > base * ratio and cand - base > grace),
+            })
+    return pd.DataFrame(rows, columns=["Benchmark", "Metric", "Baseline", "Candidate", "Regressed"])
+
+
+def create_memory_plots(df: pd.DataFrame, baseline: Optional[pd.DataFrame], title: str):
+    """Build the 1x3 figure: allocation per MiB, GC collections per GiB, peak working set."""
+    names = list(df.index)
+    y = np.arange(len(names))
+    fig, axes = plt.subplots(1, 3, figsize=(24, max(5, 0.5 * len(names) + 2)), sharey=True)
+    fig.suptitle(title, fontsize=16, fontweight="bold")
+
+    def overlay(ax, column):
+        if baseline is not None:
+            values = baseline[column].reindex(names)
+            ax.scatter(values, y, marker="|", s=300, color="black", linewidths=2, label="Baseline", zorder=5)
+
+    ax = axes[0]
+    ax.barh(y, df["AllocatedBytesPerMiB"].clip(lower=1), color="#ff7f00", label="Candidate")
+    overlay(ax, "AllocatedBytesPerMiB")
+    ax.set_xscale("log")
+    ax.set_title("Managed Allocation per MiB Processed", fontsize=13, fontweight="bold")
+    ax.set_xlabel("Bytes allocated / MiB (log)")
+    ax.set_yticks(y)
+    ax.set_yticklabels(names, fontsize=9)
+    ax.invert_yaxis()
+    for i, value in enumerate(df["AllocatedBytesPerMiB"]):
+        if np.isfinite(value):
+            ax.text(max(value, 1), i, f" {format_bytes(value)}", va="center", fontsize=8)
+
+    ax = axes[1]
+    left = np.zeros(len(names))
+    for column, color in GEN_COLORS.items():
+        values = df[column.replace("Collections", "PerGiB")].fillna(0).to_numpy()
+        ax.barh(y, values, left=left, color=color, label=column.replace("Collections", ""))
+        left += values
+    if baseline is not None:
+        ax.scatter(baseline["Gen2PerGiB"].reindex(names), y, marker="|", s=300, color="black", linewidths=2,
+                   label="Baseline Gen2", zorder=5)
+    ax.set_title("GC Collections per GiB Processed", fontsize=13, fontweight="bold")
+    ax.set_xlabel("Collections / GiB")
+
+    ax = axes[2]
+    ax.barh(y, df["MaxPeakWorkingSetBytes"] / MIB, color="#6a3d9a", label="Candidate")
+    if baseline is not None:
+        ax.scatter(baseline["MaxPeakWorkingSetBytes"].reindex(names) / MIB, y, marker="|", s=300, color="black",
+                   linewidths=2, label="Baseline", zorder=5)
+    ax.set_title("Peak Working Set after Stage", fontsize=13, fontweight="bold")
+    ax.set_xlabel("MiB")
+
+    for ax in axes:
+        ax.legend(fontsize=8, loc="lower right")
+        ax.grid(True, axis="x", which="both", alpha=0.3)
+
+    fig.tight_layout(rect=(0, 0, 1, 0.95))
+    return fig
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Chart allocation/GC pressure of a run and optionally gate it against a baseline run."""
+    p = argparse.ArgumentParser(description="Chart allocation and GC pressure of a Cotton.Benchmark run")
+    p.add_argument("input", nargs="?", type=Path, help="Run document; default: newest storage-paths result")
+    p.add_argument("--baseline", type=Path, help="Baseline run document to check for allocation/GC regressions")
+    p.add_argument("--ratio", type=float, default=REGRESSION_RATIO, help="Growth over baseline that counts as a regression")
+    p.add_argument("--fail", action="store_true", help="Exit with 3 when any gated metric regressed")
+    p.add_argument("--out", type=Path, default=ROOT / "memory_pressure.png", help="Output PNG path")
+    args = p.parse_args(sys.argv[1:] if argv is None else argv)
+
+    path = args.input or find_latest_run("storage-paths")
+    if path is None or not path.exists():
+        print("[error] No run document found; run Cotton.Benchmark or pass a run document")
+        return 1
+    if args.baseline is not None and not args.baseline.exists():
+        print(f"[error] Baseline not found: {args.baseline}")
+        return 1
+
+    df = load_memory(path)
+    if df.empty:
+        print(f"[error] No memory metrics in {path}")
+        return 2
+    baseline = load_memory(args.baseline) if args.baseline is not None else None
+
+    env = df.attrs.get("environment", {})
+    title = f"Allocation and GC Pressure: {env.get('cpu', df.attrs.get('hardwareKey', ''))} ({df.attrs.get('gitCommit', '')})"
+    fig = create_memory_plots(df, baseline, title)
+    fig.savefig(args.out, dpi=200, bbox_inches="tight")
+    print(f"[ok] Saved {args.out.name}")
+
+    summary = df[["AllocatedBytesPerMiB", "Gen0PerGiB", "Gen1PerGiB", "Gen2PerGiB", "MaxPeakWorkingSetBytes"]].copy()
+    summary["AllocatedBytesPerMiB"] = summary["AllocatedBytesPerMiB"].map(format_bytes)
+    summary["MaxPeakWorkingSetBytes"] = summary["MaxPeakWorkingSetBytes"].map(format_bytes)
+    print("\nPer benchmark (allocation per MiB, collections per GiB):")
+    print(summary.to_string(float_format=lambda v: f"{v:.1f}"))
+    if df["Gen0Collections"].isna().all():
+        print("[info] Run predates per-generation GC counts; only allocation and working set are shown")
+
+    if baseline is None:
+        return 0
+    checks = check_regressions(baseline, df, args.ratio)
+    regressed = checks[checks["Regressed"]]
+    print(f"\nChecked {len(checks)} metric(s) against {args.baseline.name}:")
+    if regressed.empty:
+        print("[ok] No allocation, GC or working-set regressions")
+        return 0
+    for _, row in regressed.iterrows():
+        print(f"[warn] {row['Benchmark']}: {row['Metric']} {row['Baseline']:.0f} -> {row['Candidate']:.0f}")
+    return 3 if args.fail else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,189 @@
+"""S3 read-path sweep: fetch/decrypt/decompress waterfalls and read-ahead scaling (read_path_sweep.png).
+
+Input is a Cotton.Benchmark run document produced with ``--mode s3-read-sweep``.
+Without an argument the newest one under .temp/benchmark-results or
+performance/results is used.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Optional
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+
+from chart_common import CHUNK_HEX_COLORS, ROOT, find_latest_run, format_bytes, parse_benchmark_run
+
+STAGES = [
+    ("AvgFetchMs", "Fetch", "#377eb8"),
+    ("AvgDecryptMs", "Decrypt", "#ff7f00"),
+    ("AvgDecompressMs", "Decompress", "#4daf4a"),
+    ("AvgReaderMs", "Reader", "#999999"),
+]
+# Waterfall marks per chunk, in the order the benchmark writes them.
+WATERFALL_MARKS = ["Requested", "Responded", "Fetched", "Decrypted", "Decompressed"]
+WATERFALL_SEGMENTS = [
+    ("Requested", "Responded", "Latency", "#cccccc"),
+    ("Responded", "Fetched", "Transfer", "#377eb8"),
+    ("Fetched", "Decrypted", "Decrypt tail", "#ff7f00"),
+    ("Decrypted", "Decompressed", "Decompress tail", "#4daf4a"),
+]
+
+
+def load_sweep(path: Path) -> pd.DataFrame:
+    """Load the sweep rows with integer grid columns."""
+    df = parse_benchmark_run(path)
+    if df.empty or "PrefetchDepth" not in df.columns:
+        return pd.DataFrame()
+    df = df.dropna(subset=["ChunkCount", "ChunkSizeBytes", "PrefetchDepth"]).copy()
+    for column in ("ChunkCount", "ChunkSizeBytes", "PrefetchDepth"):
+        df[column] = df[column].astype(int)
+    return df
+
+
+def parse_waterfall(text) -> pd.DataFrame:
+    """Parse the Waterfall text metric into one row per chunk (ms since the read started; NaN if unseen)."""
+    if not isinstance(text, str) or not text:
+        return pd.DataFrame(columns=WATERFALL_MARKS)
+    rows = [[float(value) for value in chunk.split(",")] for chunk in text.split(";") if chunk]
+    return pd.DataFrame(rows, columns=WATERFALL_MARKS)
+
+
+def recommend(df: pd.DataFrame, threshold: float = 0.9) -> pd.DataFrame:
+    """Pick, per chunk size and count, the smallest read-ahead within ``threshold`` of the best throughput."""
+    rows = []
+    for (size, count), group in df.groupby(["ChunkSizeBytes", "ChunkCount"]):
+        group = group.sort_values("PrefetchDepth")
+        best = group["AvgThroughputMBps"].max()
+        pick = group[group["AvgThroughputMBps"] >= best * threshold].iloc[0]
+        baseline = group[group["PrefetchDepth"] == 0]
+        base = baseline["AvgThroughputMBps"].iloc[0] if not baseline.empty else np.nan
+        rows.append({
+            "ChunkSize": format_bytes(size),
+            "Chunks": count,
+            "Prefetch": int(pick["PrefetchDepth"]),
+            "MiBps": pick["AvgThroughputMBps"],
+            "VsNoPrefetch": pick["AvgThroughputMBps"] / base if base else np.nan,
+            "P50TtfbMs": pick["P50TimeToFirstByteMs"],
+            "FetchShare": pick["AvgFetchMs"] / max(sum(pick[c] for c, _, _ in STAGES), 1e-9),
+        })
+    return pd.DataFrame(rows)
+
+
+def draw_breakdown(ax, data: pd.DataFrame, title: str) -> None:
+    """Stacked critical-path bars per read-ahead depth, with fetch hidden by read-ahead as a hollow bar."""
+    data = data.sort_values("PrefetchDepth")
+    x = np.arange(len(data))
+    bottom = np.zeros(len(data))
+    for column, label, color in STAGES:
+        values = data[column].to_numpy(dtype=float)
+        ax.bar(x, values, bottom=bottom, color=color, label=label, width=0.6)
+        bottom += values
+    if "AvgHiddenFetchMs" in data.columns:
+        ax.bar(x + 0.35, data["AvgHiddenFetchMs"], width=0.15, facecolor="none", edgecolor="#377eb8",
+               hatch="//", label="Fetch hidden by read-ahead")
+    ax.set_xticks(x)
+    ax.set_xticklabels([str(d) for d in data["PrefetchDepth"]])
+    ax.set_title(title, fontsize=13, fontweight="bold")
+    ax.set_xlabel("Read-ahead Depth (chunks)")
+    ax.set_ylabel("Time per File (ms)")
+    ax.legend(fontsize=8)
+    ax.grid(True, axis="y", alpha=0.3)
+
+
+def draw_waterfall(ax, row: pd.Series, title: str) -> None:
+    """One horizontal lane per chunk, split into latency, transfer, decrypt tail and decompress tail."""
+    marks = parse_waterfall(row.get("Waterfall"))
+    if marks.empty:
+        ax.text(0.5, 0.5, "No waterfall recorded", ha="center", va="center", transform=ax.transAxes)
+        ax.set_title(title, fontsize=13, fontweight="bold")
+        return
+    # Later marks can only end after earlier ones; carry the last seen mark forward when one is missing.
+    marks = marks.ffill(axis=1).cummax(axis=1)
+    for lane, chunk in marks.iterrows():
+        for start, end, label, color in WATERFALL_SEGMENTS:
+            width = chunk[end] - chunk[start]
+            if np.isfinite(width) and width > 0:
+                ax.broken_barh([(chunk[start], width)], (lane - 0.4, 0.8), facecolors=color,
+                               label=label if lane == 0 else None)
+    ax.set_ylim(len(marks) - 0.5, -0.5)
+    ax.set_title(title, fontsize=13, fontweight="bold")
+    ax.set_xlabel("Time since Read Started (ms)")
+    ax.set_ylabel("Chunk")
+    ax.legend(fontsize=8, loc="upper right")
+    ax.grid(True, axis="x", alpha=0.3)
+
+
+def create_read_path_plots(df: pd.DataFrame, picks: pd.DataFrame, title: str):
+    """Build the 4-row figure: breakdown, read-ahead scaling, waterfall without and with read-ahead."""
+    sizes = sorted(df["ChunkSizeBytes"].unique())
+    fig, axes = plt.subplots(4, len(sizes), figsize=(7 * len(sizes), 22), squeeze=False)
+    fig.suptitle(title, fontsize=16, fontweight="bold")
+
+    for col, size in enumerate(sizes):
+        data = df[df["ChunkSizeBytes"] == size]
+        counts = sorted(data["ChunkCount"].unique())
+        widest = data[data["ChunkCount"] == counts[-1]]
+
+        draw_breakdown(axes[0, col], widest, f"{format_bytes(size)} x {counts[-1]}: Critical Path")
+
+        ax = axes[1, col]
+        for i, count in enumerate(counts):
+            d = data[data["ChunkCount"] == count].sort_values("PrefetchDepth")
+            ax.plot(d["PrefetchDepth"], d["AvgThroughputMBps"], marker="o", linewidth=2, markersize=6,
+                    color=CHUNK_HEX_COLORS[i % len(CHUNK_HEX_COLORS)], label=f"{count} chunks")
+        ax.set_title(f"{format_bytes(size)}: Throughput vs Read-ahead", fontsize=13, fontweight="bold")
+        ax.set_xlabel("Read-ahead Depth (chunks)")
+        ax.set_ylabel("Throughput (MiB/s)")
+        ax.legend(fontsize=8)
+        ax.grid(True, alpha=0.3)
+
+        ordered = widest.sort_values("PrefetchDepth")
+        draw_waterfall(axes[2, col], ordered.iloc[0], f"{format_bytes(size)} x {counts[-1]}: prefetch {ordered.iloc[0]['PrefetchDepth']}")
+        pick = picks[(picks["ChunkSize"] == format_bytes(size)) & (picks["Chunks"] == counts[-1])]
+        depth = int(pick["Prefetch"].iloc[0]) if not pick.empty else int(ordered["PrefetchDepth"].max())
+        chosen = ordered[ordered["PrefetchDepth"] == depth].iloc[0]
+        draw_waterfall(axes[3, col], chosen, f"{format_bytes(size)} x {counts[-1]}: prefetch {depth} (recommended)")
+
+    fig.tight_layout(rect=(0, 0, 1, 0.97))
+    return fig
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Parse an S3 read sweep run document, chart it and print the read-ahead recommendation."""
+    p = argparse.ArgumentParser(description="Chart a Cotton.Benchmark s3-read-sweep run")
+    p.add_argument("input", nargs="?", type=Path, help="Run document; default: newest s3-read-sweep result")
+    p.add_argument("--out", type=Path, default=ROOT / "read_path_sweep.png", help="Output PNG path")
+    p.add_argument("--threshold", type=float, default=0.9, help="Fraction of the best throughput that is good enough")
+    args = p.parse_args(sys.argv[1:] if argv is None else argv)
+
+    path = args.input or find_latest_run("s3-read-sweep")
+    if path is None or not path.exists():
+        print("[error] No s3-read-sweep run document found; run Cotton.Benchmark with --mode s3-read-sweep")
+        return 1
+
+    df = load_sweep(path)
+    if df.empty:
+        print(f"[error] No read sweep rows in {path}")
+        return 2
+
+    picks = recommend(df, args.threshold)
+    env = df.attrs.get("environment", {})
+    first = df.iloc[0]
+    network = f"{first.get('LatencyMs', 0):.0f} ms, {first.get('BandwidthMiBps', 0):.0f} MiB/s"
+    title = f"S3 Read Path Sweep ({network}): {env.get('cpu', df.attrs.get('hardwareKey', ''))} ({df.attrs.get('gitCommit', '')})"
+    fig = create_read_path_plots(df, picks, title)
+    fig.savefig(args.out, dpi=200, bbox_inches="tight")
+    print(f"[ok] Saved {args.out.name}")
+
+    if (df["AvgFetchMs"] > df["AvgDecryptMs"] + df["AvgDecompressMs"]).all():
+        print("[info] Fetch dominates every cell; the stand-in link, not the CPU, bounds this read path")
+    print(f"\nRead-ahead per chunk size and count (smallest depth within {args.threshold:.0%} of the best):")
+    print(picks.to_string(index=False, float_format=lambda v: f"{v:.2f}"))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
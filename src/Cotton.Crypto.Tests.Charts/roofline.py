@@ -0,0 +1,140 @@
+"""Roofline view of the cipher sweeps against the memcpy baseline (roofline.png).
+
+Input is PerformanceTests output that contains the encryption/decryption sweeps
+and the MEMORY BANDWIDTH sweep (plus its ``Cache:`` line). Each cipher cell is
+shown as a percentage of the bandwidth measured at the same threads/chunk size.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Optional
+
+import matplotlib.pyplot as plt
+import pandas as pd
+
+from chart_common import (
+    MYLIB_INPUT_DEFAULT,
+    ROOT,
+    SWEEP_COLUMNS,
+    THREAD_HEX_COLORS,
+    parse_bandwidth_results,
+    parse_cache_sizes,
+    parse_mylib_results,
+)
+
+
+def bandwidth_fraction(cipher: pd.DataFrame, bandwidth: pd.DataFrame) -> pd.DataFrame:
+    """Join a cipher sweep with the memcpy baseline and add Bandwidth and PctOfBandwidth columns."""
+    merged = cipher.merge(
+        bandwidth[SWEEP_COLUMNS].rename(columns={"Throughput": "Bandwidth"}),
+        on=["Threads", "ChunkMB"],
+        how="inner",
+    )
+    merged["PctOfBandwidth"] = merged["Throughput"] / merged["Bandwidth"] * 100.0
+    return merged.sort_values(["Threads", "ChunkMB"]).reset_index(drop=True)
+
+
+def _mark_caches(ax, caches: dict[str, int]) -> None:
+    """Draw vertical L2/L3 boundaries on a chunk-size (MB) axis."""
+    for level, style in (("L2", ":"), ("L3", "--")):
+        if level in caches:
+            x = caches[level] / (1024 * 1024)
+            ax.axvline(x, color="gray", linestyle=style, linewidth=1.5)
+            ax.annotate(level, (x, 1), xycoords=("data", "axes fraction"), xytext=(3, -12),
+                        textcoords="offset points", color="gray", fontsize=9, fontweight="bold")
+
+
+def create_roofline_plots(ops: dict[str, pd.DataFrame], caches: dict[str, int], ceiling: float):
+    """Build the 2-row figure: throughput under the memcpy roof, and percent of that roof."""
+    fig, axes = plt.subplots(2, len(ops), figsize=(8 * len(ops), 12), squeeze=False)
+    cache_text = ", ".join(f"{k} {v // 1024}K" for k, v in caches.items()) or "cache sizes unknown"
+    fig.suptitle(f"CottonCrypto vs Memory Bandwidth ({cache_text})", fontsize=16, fontweight="bold")
+
+    for col, (name, data) in enumerate(ops.items()):
+        chunks = sorted(data["ChunkMB"].unique())
+        ax_roof, ax_pct = axes[0, col], axes[1, col]
+        for i, threads in enumerate(sorted(data["Threads"].unique())):
+            d = data[data["Threads"] == threads]
+            color = THREAD_HEX_COLORS[i % len(THREAD_HEX_COLORS)]
+            ax_roof.plot(d["ChunkMB"], d["Throughput"], marker="o", linewidth=2, color=color, label=f"{threads}T {name.lower()}")
+            ax_roof.plot(d["ChunkMB"], d["Bandwidth"], linestyle="--", linewidth=1.5, color=color, alpha=0.7, label=f"{threads}T memcpy")
+            ax_pct.plot(d["ChunkMB"], d["PctOfBandwidth"], marker="o", linewidth=2, color=color, label=f"{threads} threads")
+
+        ax_roof.set_title(f"{name}: Throughput under the memcpy roof", fontsize=13, fontweight="bold")
+        ax_roof.set_ylabel("Throughput (MB/s)")
+        ax_roof.legend(fontsize=8, ncol=2)
+
+        ax_pct.axhline(100, color="black", linewidth=1)
+        ax_pct.axhline(ceiling * 100, color="red", linestyle="--", linewidth=1, label=f"{ceiling:.0%} = at ceiling")
+        ax_pct.set_title(f"{name}: % of achievable bandwidth", fontsize=13, fontweight="bold")
+        ax_pct.set_ylabel("Cipher / memcpy (%)")
+        ax_pct.set_ylim(bottom=0)
+        ax_pct.legend(fontsize=8)
+
+        for ax in (ax_roof, ax_pct):
+            ax.set_xscale("log", base=2)
+            ax.set_xticks(chunks)
+            ax.set_xticklabels([f"{c:g}" for c in chunks])
+            ax.set_xlabel("Chunk Size (MB, per worker)")
+            ax.grid(True, alpha=0.3)
+            _mark_caches(ax, caches)
+
+    fig.tight_layout(rect=(0, 0, 1, 0.96))
+    return fig
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Parse cipher + memcpy sweeps, chart the roofline and list the cells already at the ceiling."""
+    p = argparse.ArgumentParser(description="Chart cipher sweeps as a fraction of memcpy bandwidth")
+    p.add_argument("input", nargs="?", type=Path, default=MYLIB_INPUT_DEFAULT, help="PerformanceTests output with cipher sweeps")
+    p.add_argument("--bandwidth", type=Path, help="File with the MEMORY BANDWIDTH sweep; default: same as input")
+    p.add_argument("--l2", type=int, help="Override L2 size in KB")
+    p.add_argument("--l3", type=int, help="Override L3 size in KB")
+    p.add_argument("--ceiling", type=float, default=0.8, help="Fraction of bandwidth that counts as at the hardware ceiling")
+    p.add_argument("--out", type=Path, default=ROOT / "roofline.png", help="Output PNG path")
+    args = p.parse_args(sys.argv[1:] if argv is None else argv)
+
+    bandwidth_path = args.bandwidth or args.input
+    for path in (args.input, bandwidth_path):
+        if not path.exists():
+            print(f"[error] Input not found: {path}")
+            return 1
+
+    enc, dec = parse_mylib_results(args.input)
+    bandwidth = parse_bandwidth_results(bandwidth_path)
+    if bandwidth.empty:
+        print(f"[error] No MEMORY BANDWIDTH sweep in {bandwidth_path}; run MemoryBandwidth_ThreadSweep_ChunkSweep")
+        return 2
+
+    caches = parse_cache_sizes(bandwidth_path)
+    if args.l2:
+        caches["L2"] = args.l2 * 1024
+    if args.l3:
+        caches["L3"] = args.l3 * 1024
+
+    ops = {name: bandwidth_fraction(data, bandwidth) for name, data in (("Encrypt", enc), ("Decrypt", dec))}
+    ops = {name: data for name, data in ops.items() if not data.empty}
+    if not ops:
+        print("[error] Cipher and memcpy sweeps share no Threads/ChunkMB cells")
+        return 2
+
+    fig = create_roofline_plots(ops, caches, args.ceiling)
+    fig.savefig(args.out, dpi=200, bbox_inches="tight")
+    print(f"[ok] Saved {args.out.name}")
+
+    for name, data in ops.items():
+        best = data.loc[data["PctOfBandwidth"].idxmax()]
+        at_ceiling = data[data["PctOfBandwidth"] >= args.ceiling * 100]
+        print(f"\n{name}: best {best['PctOfBandwidth']:.0f}% of memcpy at {int(best['Threads'])} threads, {best['ChunkMB']:g}MB chunks")
+        if at_ceiling.empty:
+            print(f"  No cell reaches {args.ceiling:.0%} of memcpy; the cipher is compute- or scheduling-bound")
+        else:
+            print(f"  Cells at the hardware ceiling (>= {args.ceiling:.0%} of memcpy):")
+            print(at_ceiling[["Threads", "ChunkMB", "Throughput", "Bandwidth", "PctOfBandwidth"]]
+                  .to_string(index=False, float_format=lambda v: f"{v:.1f}"))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,8 +1,13 @@
 """Generate the polished 4-panel throughput figure (performance_charts.png)."""
 
+import argparse
+import sys
+from pathlib import Path
+from typing import Optional
+
 import matplotlib.pyplot as plt
 
-from chart_common import create_simple_plots, parse_test_results
+from chart_common import MYLIB_INPUT_DEFAULT, ROOT, create_simple_plots, parse_sweeps, select
 
 
 def print_summary(encrypt_data, decrypt_data) -> None:
@@ -29,28 +34,34 @@ def print_summary(encrypt_data, decrypt_data) -> None:
     print("\n" + "=" * 50)
 
 
-def main() -> None:
-    """Parse input.txt, build the 4-panel figure and save it."""
+def main(argv: Optional[list[str]] = None) -> None:
+    """Parse the sweep log, build the 4-panel figure and save it."""
+    p = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    p.add_argument("input", nargs="?", type=Path, default=MYLIB_INPUT_DEFAULT, help="PerformanceTests output")
+    p.add_argument("--out", type=Path, default=ROOT / "performance_charts.png", help="Output PNG path")
+    args = p.parse_args(sys.argv[1:] if argv is None else argv)
+
     try:
-        encrypt_data, decrypt_data = parse_test_results("input.txt")
+        sweeps = parse_sweeps(args.input)
+        encrypt_data, decrypt_data = select(sweeps, {"Op": "Encrypt"}), select(sweeps, {"Op": "Decrypt"})
 
         if encrypt_data.empty or decrypt_data.empty:
-            print("Error: failed to find data in input.txt")
+            print(f"Error: failed to find data in {args.input}")
             return
 
         print("✅ Data successfully loaded:")
         print(f"   Encryption: {len(encrypt_data)} records")
         print(f"   Decryption: {len(decrypt_data)} records")
 
-        fig = create_simple_plots(encrypt_data, decrypt_data)
-        fig.savefig("performance_charts.png", dpi=300, bbox_inches="tight", facecolor="white", edgecolor="none")
-        print("\n💾 Charts saved to performance_charts.png")
+        fig = create_simple_plots(sweeps)
+        fig.savefig(args.out, dpi=300, bbox_inches="tight", facecolor="white", edgecolor="none")
+        print(f"\n💾 Charts saved to {args.out}")
 
         print_summary(encrypt_data, decrypt_data)
         plt.show()
 
     except FileNotFoundError:
-        print("❌ Error: file 'input.txt' not found")
+        print(f"❌ Error: file '{args.input}' not found")
     except Exception as e:
         print(f"❌ Error: {e}")
 
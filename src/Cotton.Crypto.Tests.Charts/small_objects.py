@@ -0,0 +1,198 @@
+"""Small-object sweep: fixed vs per-byte cost per stage and the crossover size (small_objects.png).
+
+Input is a Cotton.Benchmark run document produced with ``--mode small-object-sweep``.
+Without an argument the newest one under .temp/benchmark-results or
+performance/results is used.
+
+Per stage the median per-object latency is fitted as ``fixed + size / bandwidth``
+(least squares on relative error, so the small objects are not drowned out by the
+large ones). The crossover size ``fixed * bandwidth`` is where per-object overhead
+and per-byte work cost the same; objects below it spend most of their time on
+headers, hashing setup and backend calls, which is what batching would amortize.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Optional
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+
+from chart_common import CHUNK_HEX_COLORS, ROOT, find_latest_run, format_bytes, parse_benchmark_run
+
+STAGE_ORDER = ["Encrypt", "Decrypt", "PipelineWrite", "PipelineRead"]
+MIB = 1024 * 1024
+
+
+def format_size(value: float) -> str:
+    """Human-readable size with three significant digits ("-" when the model has no per-byte term)."""
+    if not np.isfinite(value):
+        return "-"
+    return f"{value:.0f} B" if value < 1024 else f"{value / 1024:.3g} KiB" if value < MIB else f"{value / MIB:.3g} MiB"
+
+
+def load_sweep(path: Path) -> pd.DataFrame:
+    """Load the sweep rows with integer object sizes."""
+    df = parse_benchmark_run(path)
+    if df.empty or "ObjectSizeBytes" not in df.columns:
+        return pd.DataFrame()
+    df = df.dropna(subset=["ObjectSizeBytes", "Stage"]).copy()
+    df["ObjectSizeBytes"] = df["ObjectSizeBytes"].astype(int)
+    return df
+
+
+def fit_cost_model(sizes, latencies_us) -> dict:
+    """Fit latency = fixed + size / bandwidth, minimizing relative error; fixed and slope are kept non-negative."""
+    x = np.asarray(sizes, dtype=float)
+    y = np.asarray(latencies_us, dtype=float)
+    w = 1 / y
+    design = np.column_stack([np.ones_like(x), x]) * w[:, None]
+    (fixed, per_byte), *_ = np.linalg.lstsq(design, y * w, rcond=None)
+    if fixed < 0:
+        fixed, per_byte = 0.0, float(np.sum(x * y * w * w) / np.sum(x * x * w * w))
+    elif per_byte <= 0:
+        fixed, per_byte = float(np.exp(np.mean(np.log(y)))), 0.0
+    predicted = fixed + per_byte * x
+    ss_res = np.sum((np.log(y) - np.log(predicted)) ** 2)
+    ss_tot = np.sum((np.log(y) - np.log(y).mean()) ** 2)
+    return {
+        "FixedUs": fixed,
+        "BandwidthMiBps": 1e6 / (per_byte * MIB) if per_byte > 0 else np.inf,
+        "CrossoverBytes": fixed / per_byte if per_byte > 0 else np.inf,
+        "R2": 1 - ss_res / ss_tot if ss_tot > 0 else 1.0,
+    }
+
+
+def fit_stages(df: pd.DataFrame) -> pd.DataFrame:
+    """One cost model per stage, with the fixed share of a 4 KiB and a 64 KiB object and the output overhead."""
+    rows = []
+    for stage in [s for s in STAGE_ORDER if s in set(df["Stage"])]:
+        data = df[df["Stage"] == stage].sort_values("ObjectSizeBytes")
+        model = fit_cost_model(data["ObjectSizeBytes"], data["P50ObjectLatencyUs"])
+        per_byte = 1e6 / (model["BandwidthMiBps"] * MIB) if np.isfinite(model["BandwidthMiBps"]) else 0.0
+        row = {"Stage": stage, **model}
+        for size in (4 * 1024, 64 * 1024):
+            row[f"FixedShare{format_bytes(size)}"] = model["FixedUs"] / (model["FixedUs"] + per_byte * size)
+        if "AvgOutputBytesPerObject" in data.columns and stage in ("Encrypt", "PipelineWrite"):
+            small = data.iloc[0]
+            row["OverheadBytes"] = small["AvgOutputBytesPerObject"] - small["ObjectSizeBytes"]
+        rows.append(row)
+    return pd.DataFrame(rows)
+
+
+def create_small_object_plots(df: pd.DataFrame, models: pd.DataFrame, title: str):
+    """Build the 2x2 figure: latency fit, effective throughput, fixed-cost share, stored bytes per object."""
+    sizes = np.logspace(np.log10(df["ObjectSizeBytes"].min() / 2), np.log10(df["ObjectSizeBytes"].max() * 4), 200)
+    fig, axes = plt.subplots(2, 2, figsize=(18, 14))
+    fig.suptitle(title, fontsize=16, fontweight="bold")
+
+    for i, model in models.iterrows():
+        stage = model["Stage"]
+        color = CHUNK_HEX_COLORS[i % len(CHUNK_HEX_COLORS)]
+        data = df[df["Stage"] == stage].sort_values("ObjectSizeBytes")
+        per_byte = 1e6 / (model["BandwidthMiBps"] * MIB) if np.isfinite(model["BandwidthMiBps"]) else 0.0
+        fitted = model["FixedUs"] + per_byte * sizes
+        crossover = model["CrossoverBytes"]
+
+        ax = axes[0, 0]
+        ax.errorbar(data["ObjectSizeBytes"], data["P50ObjectLatencyUs"],
+                    yerr=[np.zeros(len(data)), data["P99ObjectLatencyUs"] - data["P50ObjectLatencyUs"]],
+                    fmt="o", color=color, capsize=3, label=f"{stage} (p50, bar to p99)")
+        ax.plot(sizes, fitted, color=color, linestyle="--", linewidth=1.5,
+                label=f"{model['FixedUs']:.0f} us + size / {model['BandwidthMiBps']:.0f} MiB/s")
+
+        ax = axes[0, 1]
+        ax.plot(data["ObjectSizeBytes"], data["ObjectSizeBytes"] / data["P50ObjectLatencyUs"] * 1e6 / MIB,
+                marker="o", linewidth=0, color=color, label=stage)
+        ax.plot(sizes, sizes / fitted * 1e6 / MIB, color=color, linestyle="--", linewidth=1.5)
+        if np.isfinite(model["BandwidthMiBps"]):
+            ax.axhline(model["BandwidthMiBps"], color=color, linestyle=":", alpha=0.5)
+
+        ax = axes[1, 0]
+        ax.plot(sizes, model["FixedUs"] / fitted * 100, color=color, linewidth=2, label=f"{stage}: crossover {format_size(crossover)}")
+        if np.isfinite(crossover):
+            for a in axes.flat[:3]:
+                a.axvline(crossover, color=color, linestyle=":", alpha=0.6)
+
+        if "AvgOutputBytesPerObject" in data.columns and stage in ("Encrypt", "PipelineWrite"):
+            ax = axes[1, 1]
+            ax.plot(data["ObjectSizeBytes"], data["AvgOutputBytesPerObject"] / data["ObjectSizeBytes"], marker="s",
+                    linewidth=2, color=color, label=stage)
+
+    ax = axes[0, 0]
+    ax.set_title("Per-object Latency and Fitted Cost Model", fontsize=13, fontweight="bold")
+    ax.set_ylabel("Latency (us, log)")
+    ax.set_yscale("log")
+    ax = axes[0, 1]
+    ax.set_title("Effective Throughput (dotted = fitted bandwidth)", fontsize=13, fontweight="bold")
+    ax.set_ylabel("MiB/s (log)")
+    ax.set_yscale("log")
+    ax = axes[1, 0]
+    ax.axhline(50, color="black", linewidth=1, alpha=0.5)
+    ax.set_title("Share of Latency that is Fixed Overhead (dotted = crossover)", fontsize=13, fontweight="bold")
+    ax.set_ylabel("Fixed overhead (%)")
+    ax.set_ylim(0, 100)
+    ax = axes[1, 1]
+    ax.axhline(1, color="black", linewidth=1, alpha=0.5)
+    ax.set_title("Produced/Stored Bytes per Input Byte", fontsize=13, fontweight="bold")
+    ax.set_ylabel("Output / input (log)")
+    ax.set_yscale("log")
+
+    ticks = sorted(df["ObjectSizeBytes"].unique())
+    for ax in axes.flat:
+        ax.set_xscale("log")
+        ax.set_xticks(ticks)
+        ax.set_xticklabels([format_bytes(t) for t in ticks])
+        ax.set_xlabel("Object Size")
+        ax.grid(True, which="both", alpha=0.3)
+        if ax.get_legend_handles_labels()[0]:
+            ax.legend(fontsize=8)
+
+    fig.tight_layout(rect=(0, 0, 1, 0.96))
+    return fig
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Fit the per-stage cost model of a small-object sweep, chart it and print the crossover sizes."""
+    p = argparse.ArgumentParser(description="Chart a Cotton.Benchmark small-object-sweep run")
+    p.add_argument("input", nargs="?", type=Path, help="Run document; default: newest small-object-sweep result")
+    p.add_argument("--out", type=Path, default=ROOT / "small_objects.png", help="Output PNG path")
+    args = p.parse_args(sys.argv[1:] if argv is None else argv)
+
+    path = args.input or find_latest_run("small-object-sweep")
+    if path is None or not path.exists():
+        print("[error] No small-object-sweep run document found; run Cotton.Benchmark with --mode small-object-sweep")
+        return 1
+
+    df = load_sweep(path)
+    if df.empty:
+        print(f"[error] No small-object sweep rows in {path}")
+        return 2
+
+    models = fit_stages(df)
+    env = df.attrs.get("environment", {})
+    title = f"Small-object Cost Model: {env.get('cpu', df.attrs.get('hardwareKey', ''))} ({df.attrs.get('gitCommit', '')})"
+    fig = create_small_object_plots(df, models, title)
+    fig.savefig(args.out, dpi=200, bbox_inches="tight")
+    print(f"[ok] Saved {args.out.name}")
+
+    table = models.copy()
+    table["CrossoverBytes"] = table["CrossoverBytes"].map(format_size)
+    print("\nlatency = fixed + size / bandwidth per stage (crossover = size where both terms are equal):")
+    print(table.to_string(index=False, float_format=lambda v: f"{v:.2f}"))
+    for _, model in models.iterrows():
+        if model["R2"] < 0.9:
+            print(f"[warn] {model['Stage']}: the linear cost model fits poorly (R2 {model['R2']:.2f}); read its crossover with care")
+
+    write = models[models["Stage"] == "PipelineWrite"]
+    if not write.empty and np.isfinite(write["CrossoverBytes"].iloc[0]):
+        crossover = write["CrossoverBytes"].iloc[0]
+        print(f"\n[info] Pipeline writes of objects under {format_size(crossover)} are dominated by per-object overhead; "
+              f"batching such objects into shared chunks would remove up to {write['FixedUs'].iloc[0]:.0f} us per object")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,180 @@
+"""Run-stability report for crypto sweeps (stability.png).
+
+Input is PerformanceTests output. For cells with per-iteration samples the
+coefficient of variation and the 95% confidence half-width are computed and
+cells above ``--max-cv`` / ``--target`` are flagged as unstable. Every cell is
+also compared with its chunk-size neighbours, which catches one-off jitter
+spikes even in older output without samples. The ``Environment:``
+line of each sweep is checked for conditions that add noise.
+"""
+
+import argparse
+import math
+import sys
+from pathlib import Path
+from typing import Optional
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+
+from chart_common import MYLIB_INPUT_DEFAULT, ROOT, SWEEP_SECTIONS, parse_sweep_environment, parse_sweep_section
+
+# Two-sided 95% Student t critical values for 1..10 degrees of freedom (same table as AdaptiveSampling.cs).
+T_CRITICAL_95 = [12.706, 4.303, 3.182, 2.776, 2.571, 2.447, 2.365, 2.306, 2.262, 2.228]
+
+
+def relative_half_width(samples: list[float]) -> float:
+    """95% confidence half-width of the mean as a percentage of the mean (NaN below 2 samples)."""
+    if len(samples) < 2:
+        return float("nan")
+    t = T_CRITICAL_95[min(len(samples) - 1, len(T_CRITICAL_95)) - 1]
+    return t * float(np.std(samples, ddof=1)) / math.sqrt(len(samples)) / float(np.mean(samples)) * 100.0
+
+
+def neighbour_residual(data: pd.DataFrame) -> pd.Series:
+    """How far (%) each cell stands out from its two chunk-size neighbours, beyond what other thread rows show.
+
+    The depth of a cell is the smaller gap to its neighbours when it sits above (or
+    below) both, else 0. A peak that every thread row shares at the same chunk size
+    (a cache effect) is real, so the median depth at that chunk size is subtracted;
+    what remains is one-off jitter. The thread axis itself is not used because
+    thread scaling has genuine knees (SMT, E-cores). Edge chunk sizes are NaN.
+    """
+    depth = pd.Series(float("nan"), index=data.index)
+    for _, row in data.groupby("Threads"):
+        row = row.sort_values("ChunkMB")
+        values = row["Throughput"].to_numpy()
+        for k in range(1, len(values) - 1):
+            gaps = (values[k] / values[k - 1] - 1, values[k] / values[k + 1] - 1)
+            depth[row.index[k]] = min(gaps, key=abs) * 100.0 if (gaps[0] > 0) == (gaps[1] > 0) else 0.0
+    return depth - depth.groupby(data["ChunkMB"]).transform("median")
+
+
+def analyze_sweeps(text: str, max_cv: float, target: float, spike: float) -> pd.DataFrame:
+    """One row per cell: N, CVPct, CIPct, NeighbourPct and the Unstable/Spike flags."""
+    frames = []
+    for op, title in SWEEP_SECTIONS.items():
+        data = parse_sweep_section(text, title)
+        if data.empty:
+            continue
+        samples = data["Samples"] if "Samples" in data.columns else pd.Series([[]] * len(data), index=data.index)
+        frame = data[["Threads", "ChunkMB", "Throughput"]].copy()
+        frame.insert(0, "Op", op)
+        frame["N"] = [len(s) for s in samples]
+        frame["CVPct"] = [float(np.std(s, ddof=1) / np.mean(s) * 100.0) if len(s) > 1 else float("nan") for s in samples]
+        frame["CIPct"] = [relative_half_width(s) for s in samples]
+        frame["NeighbourPct"] = neighbour_residual(data)
+        frames.append(frame)
+    if not frames:
+        return pd.DataFrame()
+    cells = pd.concat(frames, ignore_index=True)
+    cells["Unstable"] = (cells["CVPct"] > max_cv) | (cells["CIPct"] > target)
+    cells["Spike"] = cells["NeighbourPct"].abs() > spike
+    return cells
+
+
+def environment_warnings(environment: dict[str, str], max_load: float) -> list[str]:
+    """Describe the recorded host conditions that are known to add noise."""
+    warnings = []
+    governor = environment.get("governor")
+    if governor and governor != "performance":
+        warnings.append(f"CPU governor is '{governor}'; frequency scaling adds run-to-run jitter (use 'performance')")
+    if environment.get("turbo") == "on":
+        warnings.append("turbo boost is on; clocks depend on temperature and how many cores are busy")
+    try:
+        load = float(environment.get("loadAverage1", "nan"))
+    except ValueError:
+        load = float("nan")
+    if load > max_load:
+        warnings.append(f"1-minute load average was {load:g} at the start of the sweep; other work competed for the CPU")
+    return warnings
+
+
+def create_stability_plots(cells: pd.DataFrame):
+    """Heatmap per op of CV% (or neighbour deviation when no samples exist), flagged cells outlined."""
+    ops = [op for op in SWEEP_SECTIONS if op in set(cells["Op"])]
+    fig, axes = plt.subplots(1, len(ops), figsize=(7 * len(ops), 6), squeeze=False)
+    fig.suptitle("Sweep Stability  (red outline = unstable or spike)", fontsize=16, fontweight="bold")
+    for ax, op in zip(axes[0], ops):
+        data = cells[cells["Op"] == op]
+        has_samples = data["CVPct"].notna().any()
+        metric = "CVPct" if has_samples else "NeighbourPct"
+        threads = sorted(data["Threads"].unique())
+        chunks = sorted(data["ChunkMB"].unique())
+        grid = data.pivot_table(index="Threads", columns="ChunkMB", values=metric, dropna=False).reindex(index=threads, columns=chunks)
+        values = grid.values if has_samples else np.abs(grid.values)
+        im = ax.imshow(values, cmap="YlOrRd", aspect="auto", origin="lower", vmin=0)
+        for row in data.itertuples():
+            i, j = threads.index(row.Threads), chunks.index(row.ChunkMB)
+            value = getattr(row, metric)
+            label = "" if math.isnan(value) else f"{value:.1f}%" + (f"\nn={row.N}" if has_samples else "")
+            ax.text(j, i, label, ha="center", va="center", fontsize=7)
+            if row.Unstable or row.Spike:
+                ax.add_patch(plt.Rectangle((j - 0.5, i - 0.5), 1, 1, fill=False, edgecolor="red", linewidth=2.5))
+        ax.set_xticks(range(len(chunks)))
+        ax.set_xticklabels([f"{c:g}" for c in chunks])
+        ax.set_yticks(range(len(threads)))
+        ax.set_yticklabels([str(t) for t in threads])
+        ax.set_xlabel("Chunk Size (MB)")
+        ax.set_ylabel("Threads")
+        ax.set_title(f"{op}: {'coefficient of variation' if has_samples else '|deviation from neighbours|'}", fontsize=13, fontweight="bold")
+        fig.colorbar(im, ax=ax, shrink=0.8, label="%")
+    fig.tight_layout(rect=(0, 0, 1, 0.94))
+    return fig
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Report per-cell CV, flag unstable cells and save the stability heatmap."""
+    p = argparse.ArgumentParser(description="Flag unstable cells and report the coefficient of variation of crypto sweeps")
+    p.add_argument("input", nargs="?", type=Path, default=MYLIB_INPUT_DEFAULT, help="PerformanceTests output")
+    p.add_argument("--max-cv", type=float, default=3.0, help="Flag cells whose coefficient of variation exceeds this percent")
+    p.add_argument("--target", type=float, default=2.0, help="Flag cells whose 95%% CI half-width exceeds this percent of the mean")
+    p.add_argument("--spike", type=float, default=5.0, help="Flag cells deviating from their neighbours by more than this percent")
+    p.add_argument("--max-load", type=float, default=1.0, help="Warn when the recorded 1-minute load average is above this")
+    p.add_argument("--strict", action="store_true", help="Exit with 3 if any cell is flagged")
+    p.add_argument("--out", type=Path, default=ROOT / "stability.png", help="Output PNG path")
+    args = p.parse_args(sys.argv[1:] if argv is None else argv)
+
+    if not args.input.exists():
+        print(f"[error] Input not found: {args.input}")
+        return 1
+
+    text = args.input.read_text(encoding="utf-8", errors="ignore")
+    cells = analyze_sweeps(text, args.max_cv, args.target, args.spike)
+    if cells.empty:
+        print(f"[error] No sweep sections in {args.input}")
+        return 2
+
+    fig = create_stability_plots(cells)
+    fig.savefig(args.out, dpi=200, bbox_inches="tight")
+    print(f"[ok] Saved {args.out.name}")
+
+    for op, title in SWEEP_SECTIONS.items():
+        if op not in set(cells["Op"]):
+            continue
+        data = cells[cells["Op"] == op]
+        environment = parse_sweep_environment(text, title)
+        print(f"\n{op}: {len(data)} cells, {int(data['N'].sum())} samples")
+        if data["CVPct"].notna().any():
+            print(f"  CV median {data['CVPct'].median():.1f}%, max {data['CVPct'].max():.1f}%; samples per cell {data['N'].min()}..{data['N'].max()}")
+        else:
+            print("  [info] No per-iteration samples; only neighbour spikes can be detected")
+        if environment:
+            print("  Environment: " + ", ".join(f"{k}={v}" for k, v in environment.items()))
+        for warning in environment_warnings(environment, args.max_load):
+            print(f"  [warn] {warning}")
+
+    flagged = cells[cells["Unstable"] | cells["Spike"]]
+    if flagged.empty:
+        print("\nAll cells are stable.")
+        return 0
+
+    print(f"\nFlagged cells ({len(flagged)}); rerun these before trusting them:")
+    print(flagged[["Op", "Threads", "ChunkMB", "Throughput", "N", "CVPct", "CIPct", "NeighbourPct", "Unstable", "Spike"]]
+          .to_string(index=False, float_format=lambda v: f"{v:.1f}", na_rep="-", formatters={"ChunkMB": lambda c: f"{c:g}"}))
+    return 3 if args.strict else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,171 @@
+"""A/B diff of two crypto sweeps or benchmark run documents (sweep_diff.png).
+
+Baseline and candidate are either PerformanceTests output (``input.txt`` style) or
+Cotton.Benchmark run documents (``*.json``). Cells are aligned by
+(op, threads, chunk) for sweeps and by benchmark name for run documents; a cell
+is marked significant when a Welch t-test on the per-iteration samples rejects
+"no change" at ``--alpha``.
+"""
+
+import argparse
+import math
+import sys
+from pathlib import Path
+from typing import Optional
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+from matplotlib.colors import TwoSlopeNorm
+
+from chart_common import ROOT, SWEEP_SECTIONS, parse_benchmark_run, parse_sweep_section, welch_t_test
+
+KEY = ["Op", "Threads", "ChunkMB"]
+
+
+def load_side(path: Path) -> pd.DataFrame:
+    """Normalize a sweep file or run document to Op/Threads/ChunkMB/Mean/Std/N rows."""
+    if path.suffix.lower() == ".json":
+        df = parse_benchmark_run(path)
+        if df.empty:
+            return pd.DataFrame(columns=KEY + ["Mean", "Std", "N"])
+        return pd.DataFrame({
+            "Op": df["Name"],
+            "Threads": 0,
+            "ChunkMB": 0.0,
+            "Mean": df["AvgThroughputMBps"],
+            "Std": df["StdDevThroughputMBps"] if "StdDevThroughputMBps" in df.columns else np.nan,
+            "N": df["Iterations"].fillna(1).astype(int) if "Iterations" in df.columns else 1,
+        })
+
+    text = path.read_text(encoding="utf-8", errors="ignore")
+    frames = []
+    for op, title in SWEEP_SECTIONS.items():
+        data = parse_sweep_section(text, title)
+        if data.empty:
+            continue
+        samples = data["Samples"] if "Samples" in data.columns else pd.Series([[]] * len(data), index=data.index)
+        frames.append(pd.DataFrame({
+            "Op": op,
+            "Threads": data["Threads"],
+            "ChunkMB": data["ChunkMB"],
+            "Mean": data["Throughput"],
+            "Std": [np.std(s, ddof=1) if len(s) > 1 else np.nan for s in samples],
+            "N": [max(len(s), 1) for s in samples],
+        }))
+    return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=KEY + ["Mean", "Std", "N"])
+
+
+def diff_sides(baseline: pd.DataFrame, candidate: pd.DataFrame, alpha: float = 0.05) -> pd.DataFrame:
+    """Align both sides by (op, threads, chunk) and add DeltaPct, PValue and Significant columns."""
+    merged = baseline.merge(candidate, on=KEY, how="inner", suffixes=("Base", "Cand"))
+    merged["DeltaPct"] = (merged["MeanCand"] - merged["MeanBase"]) / merged["MeanBase"] * 100.0
+    merged["PValue"] = [
+        welch_t_test(r.MeanBase, r.StdBase, r.NBase, r.MeanCand, r.StdCand, r.NCand)
+        if not (math.isnan(r.StdBase) or math.isnan(r.StdCand)) else float("nan")
+        for r in merged.itertuples()
+    ]
+    merged["Significant"] = merged["PValue"] < alpha
+    return merged
+
+
+def _cell_label(row) -> str:
+    return f"{row['DeltaPct']:+.1f}%" + ("*" if row["Significant"] else "")
+
+
+def create_diff_plots(diff: pd.DataFrame, title: str):
+    """Delta-percent heatmaps per op (threads x chunk), or one bar panel for run documents."""
+    limit = max(float(diff["DeltaPct"].abs().max()), 1.0)
+    norm = TwoSlopeNorm(vmin=-limit, vcenter=0.0, vmax=limit)
+    cmap = plt.get_cmap("RdYlGn")
+
+    if (diff["Threads"] == 0).all():
+        data = diff.sort_values("DeltaPct")
+        fig, ax = plt.subplots(figsize=(12, max(4, 0.35 * len(data) + 1.5)))
+        bars = ax.barh(data["Op"], data["DeltaPct"], color=[cmap(norm(v)) for v in data["DeltaPct"]], edgecolor="black")
+        for bar, (_, row) in zip(bars, data.iterrows()):
+            ax.annotate(_cell_label(row), (bar.get_width(), bar.get_y() + bar.get_height() / 2),
+                        xytext=(4 if row["DeltaPct"] >= 0 else -4, 0), textcoords="offset points",
+                        ha="left" if row["DeltaPct"] >= 0 else "right", va="center", fontsize=8)
+        ax.axvline(0, color="black", linewidth=1)
+        ax.set_xlabel("Throughput delta, candidate vs baseline (%)")
+        ax.grid(True, axis="x", alpha=0.3)
+        ax.set_title(f"{title}  (* = significant)", fontsize=14, fontweight="bold")
+        fig.tight_layout()
+        return fig
+
+    ops = [op for op in SWEEP_SECTIONS if op in set(diff["Op"])]
+    fig, axes = plt.subplots(1, len(ops), figsize=(7 * len(ops), 6), squeeze=False)
+    fig.suptitle(f"{title}  (* = significant)", fontsize=16, fontweight="bold")
+    for ax, op in zip(axes[0], ops):
+        data = diff[diff["Op"] == op]
+        threads = sorted(data["Threads"].unique())
+        chunks = sorted(data["ChunkMB"].unique())
+        pivot = data.set_index(["Threads", "ChunkMB"])
+        grid = data.pivot_table(index="Threads", columns="ChunkMB", values="DeltaPct").reindex(index=threads, columns=chunks)
+        im = ax.imshow(grid.values, cmap=cmap, norm=norm, aspect="auto", origin="lower")
+        for i, t in enumerate(threads):
+            for j, c in enumerate(chunks):
+                if (t, c) in pivot.index:
+                    ax.text(j, i, _cell_label(pivot.loc[(t, c)]), ha="center", va="center", fontsize=8)
+        ax.set_xticks(range(len(chunks)))
+        ax.set_xticklabels([f"{c:g}" for c in chunks])
+        ax.set_yticks(range(len(threads)))
+        ax.set_yticklabels([str(t) for t in threads])
+        ax.set_xlabel("Chunk Size (MB)")
+        ax.set_ylabel("Threads")
+        ax.set_title(f"{op}: delta %", fontsize=13, fontweight="bold")
+        fig.colorbar(im, ax=ax, shrink=0.8)
+    fig.tight_layout(rect=(0, 0, 1, 0.94))
+    return fig
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Diff two sweeps, save the heatmap and print the biggest wins and losses."""
+    p = argparse.ArgumentParser(description="A/B diff of two crypto sweeps or benchmark run documents")
+    p.add_argument("baseline", type=Path, help="Baseline sweep output or run document")
+    p.add_argument("candidate", type=Path, help="Candidate sweep output or run document")
+    p.add_argument("--alpha", type=float, default=0.05, help="Significance level for the Welch t-test")
+    p.add_argument("--top", type=int, default=5, help="How many wins/losses to print")
+    p.add_argument("--fail-on-loss", type=float, help="Exit with 3 if any significant loss exceeds this percent")
+    p.add_argument("--out", type=Path, default=ROOT / "sweep_diff.png", help="Output PNG path")
+    args = p.parse_args(sys.argv[1:] if argv is None else argv)
+
+    for path in (args.baseline, args.candidate):
+        if not path.exists():
+            print(f"[error] Input not found: {path}")
+            return 1
+
+    diff = diff_sides(load_side(args.baseline), load_side(args.candidate), args.alpha)
+    if diff.empty:
+        print("[error] Baseline and candidate share no cells")
+        return 2
+
+    fig = create_diff_plots(diff, f"{args.candidate.name} vs {args.baseline.name}")
+    fig.savefig(args.out, dpi=200, bbox_inches="tight")
+    print(f"[ok] Saved {args.out.name}")
+
+    tested = diff["PValue"].notna().sum()
+    print(f"\n{len(diff)} aligned cells, {tested} with sample data, {int(diff['Significant'].sum())} significant at alpha={args.alpha}")
+    if tested == 0:
+        print("[info] No per-iteration sample data; deltas are shown without significance")
+
+    columns = (["Op"] if (diff["Threads"] == 0).all() else KEY) + ["MeanBase", "MeanCand", "DeltaPct", "PValue"]
+    fmt = {"float_format": lambda v: f"{v:.3g}" if abs(v) < 1 else f"{v:.1f}", "index": False}
+    wins = diff[diff["DeltaPct"] > 0].nlargest(args.top, "DeltaPct")
+    losses = diff[diff["DeltaPct"] < 0].nsmallest(args.top, "DeltaPct")
+    print("\nBiggest wins:")
+    print(wins[columns].to_string(**fmt) if not wins.empty else "  none")
+    print("\nBiggest losses:")
+    print(losses[columns].to_string(**fmt) if not losses.empty else "  none")
+
+    if args.fail_on_loss is not None:
+        bad = diff[diff["Significant"] & (diff["DeltaPct"] < -abs(args.fail_on_loss))]
+        if not bad.empty:
+            print(f"\n[fail] {len(bad)} significant loss(es) worse than -{abs(args.fail_on_loss):g}%")
+            return 3
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
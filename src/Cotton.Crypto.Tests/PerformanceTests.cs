@@ -3,6 +3,8 @@
 
 using Cotton.Crypto.Tests.TestUtils;
 using System.Diagnostics;
+using System.Globalization;
+using System.Runtime.InteropServices;
 
 namespace Cotton.Crypto.Tests
 {
@@ -16,7 +18,7 @@ namespace Cotton.Crypto.Tests
         private static byte[]? _masterKey;
         private const int OneMb = 1024 * 1024;
         private const int TestDataSizeMb = 1000;
-        private const int Iterations = 2;
+        private const int StreamDataSizeMb = 64;
         private static readonly int[] chunkSizesInKBytes = [64, 128, 512, 1024, 4096, 8192, 16384];
 
         [SetUp]
@@ -68,31 +70,29 @@ namespace Cotton.Crypto.Tests
             int[] threadCounts = [.. GetThreadSweep()];
             int[] chunkSizes = GetChunkSweep();
 
-            TestContext.Out.WriteLine("=== ENCRYPTION THREAD/CHUNK SWEEP ===");
-            TestContext.Out.WriteLine($"Data size: {TestDataSizeMb} MB");
-            TestContext.Out.WriteLine($"Threads: {string.Join(", ", threadCounts)}");
-            TestContext.Out.WriteLine($"Chunk sizes: {string.Join(", ", chunkSizes.Select(x => $"{x / (double)OneMb:F1}MB"))}");
-            TestContext.Out.WriteLine("Threads | ChunkMB | Avg MB/s");
+            async Task EncryptOnceAsync(AesGcmStreamCipher cipher, int chunkSize)
+            {
+                using var inputStream = new MemoryStream(source, 0, totalBytes, writable: false, publiclyVisible: true);
+                using var encryptedStream = new DevNullStream();
+                await cipher.EncryptAsync(inputStream, encryptedStream, chunkSize: chunkSize);
+            }
+
+            double warmUp;
+            using (AesGcmStreamCipher warmUpCipher = CreateTimed(() => new AesGcmStreamCipher(masterKey, keyId: 1, threads: threadCounts[0]), out _))
+            {
+                warmUp = await MeasureOnceAsync(() => EncryptOnceAsync(warmUpCipher, chunkSizes[0]));
+            }
+
+            WriteSweepHeader("ENCRYPTION THREAD/CHUNK SWEEP", threadCounts, chunkSizes, warmUp);
 
             foreach (int threads in threadCounts)
             {
                 foreach (int chunkSize in chunkSizes)
                 {
-                    List<double> throughputs = [];
-                    for (int i = 0; i < Iterations; i++)
-                    {
-                        var cipher = new AesGcmStreamCipher(masterKey, keyId: 1, threads: threads);
-                        using var inputStream = new MemoryStream(source, 0, totalBytes, writable: false, publiclyVisible: true);
-                        using var encryptedStream = new DevNullStream();
-                        long t0 = Stopwatch.GetTimestamp();
-                        await cipher.EncryptAsync(inputStream, encryptedStream, chunkSize: chunkSize);
-                        long t1 = Stopwatch.GetTimestamp();
-                        double timeSeconds = (t1 - t0) / (double)Stopwatch.Frequency;
-                        double throughputMBps = TestDataSizeMb / timeSeconds;
-                        throughputs.Add(throughputMBps);
-                    }
-                    double avg = throughputs.Average();
-                    TestContext.Out.WriteLine($"{threads,7} | {chunkSize / (double)OneMb,7:F3} | {avg,9:F1}");
+                    using AesGcmStreamCipher cipher = CreateTimed(() => new AesGcmStreamCipher(masterKey, keyId: 1, threads: threads), out double setupMs);
+                    double first = await MeasureOnceAsync(() => EncryptOnceAsync(cipher, chunkSize));
+                    List<double> throughputs = await SampleAsync(() => EncryptOnceAsync(cipher, chunkSize));
+                    WriteSweepRow(threads, chunkSize, throughputs, setupMs, first);
                 }
             }
         }
@@ -123,35 +123,257 @@ namespace Cotton.Crypto.Tests
             int[] threadCounts = [.. GetThreadSweep()];
             int[] chunkSizes = GetChunkSweep();
 
-            TestContext.Out.WriteLine("=== DECRYPTION THREAD/CHUNK SWEEP ===");
-            TestContext.Out.WriteLine($"Data size: {TestDataSizeMb} MB");
-            TestContext.Out.WriteLine($"Threads: {string.Join(", ", threadCounts)}");
-            TestContext.Out.WriteLine($"Chunk sizes: {string.Join(", ", chunkSizes.Select(x => $"{x / (double)OneMb:F1}MB"))}");
-            TestContext.Out.WriteLine("Threads | ChunkMB | Avg MB/s");
+            async Task DecryptOnceAsync(AesGcmStreamCipher cipher)
+            {
+                using var encryptedStream = new MemoryStream(encryptedPayload, writable: false);
+                var decryptedStream = new DevNullStream();
+                await cipher.DecryptAsync(encryptedStream, decryptedStream);
+            }
+
+            double warmUp;
+            using (AesGcmStreamCipher warmUpCipher = CreateTimed(() => new AesGcmStreamCipher(masterKey, keyId: 1, threads: threadCounts[0]), out _))
+            {
+                warmUp = await MeasureOnceAsync(() => DecryptOnceAsync(warmUpCipher));
+            }
+
+            WriteSweepHeader("DECRYPTION THREAD/CHUNK SWEEP", threadCounts, chunkSizes, warmUp);
+
+            foreach (int threads in threadCounts)
+            {
+                foreach (int chunkSize in chunkSizes)
+                {
+                    using AesGcmStreamCipher cipher = CreateTimed(() => new AesGcmStreamCipher(masterKey, keyId: 1, threads: threads), out double setupMs);
+                    double first = await MeasureOnceAsync(() => DecryptOnceAsync(cipher));
+                    List<double> throughputs = await SampleAsync(() => DecryptOnceAsync(cipher));
+                    WriteSweepRow(threads, chunkSize, throughputs, setupMs, first);
+                }
+            }
+        }
+
+        /// <summary>
+        /// Memory-bandwidth baseline for the cipher sweeps: the same source buffer is copied
+        /// chunk by chunk into per-worker buffers at the same thread and chunk sizes, so each
+        /// cipher cell can be read as a fraction of what the memory hierarchy can deliver.
+        /// </summary>
+        [Test]
+        public async Task MemoryBandwidth_ThreadSweep_ChunkSweep()
+        {
+            Assert.That(_sharedData, Is.Not.Null);
+
+            byte[] source = _sharedData!;
+            int totalBytes = TestDataSizeMb * OneMb;
+
+            int[] threadCounts = [.. GetThreadSweep()];
+            int[] chunkSizes = GetChunkSweep();
+
+            static byte[][] CreateBuffers(int threads, int chunkSize)
+                => [.. Enumerable.Range(0, threads).Select(_ => new byte[chunkSize])];
+
+            byte[][] warmUpBuffers = CreateBuffers(threadCounts[0], chunkSizes[0]);
+            double warmUp = await MeasureOnceAsync(() => CopyInChunksAsync(source, totalBytes, warmUpBuffers));
+            WriteSweepHeader("MEMORY BANDWIDTH THREAD/CHUNK SWEEP", threadCounts, chunkSizes, warmUp);
 
             foreach (int threads in threadCounts)
             {
                 foreach (int chunkSize in chunkSizes)
                 {
-                    List<double> throughputs = [];
-                    for (int i = 0; i < Iterations; i++)
+                    byte[][] buffers = CreateTimed(() => CreateBuffers(threads, chunkSize), out double setupMs);
+                    double first = await MeasureOnceAsync(() => CopyInChunksAsync(source, totalBytes, buffers));
+                    List<double> throughputs = await SampleAsync(() => CopyInChunksAsync(source, totalBytes, buffers));
+                    WriteSweepRow(threads, chunkSize, throughputs, setupMs, first);
+                }
+            }
+        }
+
+        /// <summary>
+        /// Many tenants encrypting at once: S independent streams, each with its own cipher and T threads,
+        /// all started together on the same machine. Stream counts go past the core count, so the cells
+        /// that matter for a busy server are the ones where S x T oversubscribes the cores.
+        /// </summary>
+        [Test]
+        public async Task Encrypt_StreamSweep_ThreadsPerStreamSweep()
+        {
+            using (Assert.EnterMultipleScope())
+            {
+                Assert.That(_sharedData, Is.Not.Null);
+                Assert.That(_masterKey, Is.Not.Null);
+            }
+
+            byte[] source = _sharedData!;
+            byte[] masterKey = _masterKey!;
+            int coreBudget = Environment.ProcessorCount;
+            int[] streamCounts = [.. GetPowersOfTwo(2 * coreBudget)];
+            int[] threadCounts = [.. GetPowersOfTwo(coreBudget)];
+            int streamBytes = StreamDataSizeMb * OneMb;
+            int slices = TestDataSizeMb / StreamDataSizeMb;
+
+            // One pass: every stream encrypts its own slice; returns the wall time and each stream's completion time.
+            async Task<(double TotalMs, double[] StreamMs)> EncryptStreamsAsync(AesGcmStreamCipher[] ciphers)
+            {
+                long t0 = Stopwatch.GetTimestamp();
+                double[] streamMs = await Task.WhenAll(ciphers.Select((cipher, i) => Task.Run(async () =>
+                {
+                    using var input = new MemoryStream(source, i % slices * streamBytes, streamBytes, writable: false, publiclyVisible: true);
+                    using var output = new DevNullStream();
+                    await cipher.EncryptAsync(input, output);
+                    return Stopwatch.GetElapsedTime(t0).TotalMilliseconds;
+                })));
+                return (Stopwatch.GetElapsedTime(t0).TotalMilliseconds, streamMs);
+            }
+
+            double warmUp;
+            using (var warmUpCipher = new AesGcmStreamCipher(masterKey, keyId: 1, threads: threadCounts[0]))
+            {
+                (double warmUpMs, _) = await EncryptStreamsAsync([warmUpCipher]);
+                warmUp = StreamDataSizeMb / (warmUpMs / 1000);
+            }
+
+            WriteContentionHeader(coreBudget, streamCounts, threadCounts, warmUp);
+
+            foreach (int streams in streamCounts)
+            {
+                foreach (int threads in threadCounts.Where(t => streams * t <= 4 * coreBudget))
+                {
+                    AesGcmStreamCipher[] ciphers = [.. Enumerable.Range(0, streams).Select(_ => new AesGcmStreamCipher(masterKey, keyId: 1, threads: threads))];
+                    try
+                    {
+                        // The first pass pays cipher and thread-pool warm-up for this many streams; it is not sampled.
+                        await EncryptStreamsAsync(ciphers);
+                        List<double> throughputs = [];
+                        List<double> streamMs = [];
+                        while (!AdaptiveSampling.IsDone(throughputs))
+                        {
+                            (double totalMs, double[] perStream) = await EncryptStreamsAsync(ciphers);
+                            throughputs.Add(streams * StreamDataSizeMb / (totalMs / 1000));
+                            streamMs.AddRange(perStream);
+                        }
+
+                        WriteContentionRow(streams, threads, throughputs, streamMs);
+                    }
+                    finally
                     {
-                        var cipher = new AesGcmStreamCipher(masterKey, keyId: 1, threads: threads);
-                        using var encryptedStream = new MemoryStream(encryptedPayload, writable: false);
-                        var decryptedStream = new DevNullStream();
-                        long t0 = Stopwatch.GetTimestamp();
-                        await cipher.DecryptAsync(encryptedStream, decryptedStream);
-                        long t1 = Stopwatch.GetTimestamp();
-                        double timeSeconds = (t1 - t0) / (double)Stopwatch.Frequency;
-                        double throughputMBps = TestDataSizeMb / timeSeconds;
-                        throughputs.Add(throughputMBps);
+                        foreach (AesGcmStreamCipher cipher in ciphers)
+                        {
+                            cipher.Dispose();
+                        }
                     }
-                    double avg = throughputs.Average();
-                    TestContext.Out.WriteLine($"{threads,7} | {chunkSize / (double)OneMb,7:F3} | {avg,9:F1}");
                 }
             }
         }
 
+        private static Task CopyInChunksAsync(byte[] source, int totalBytes, byte[][] buffers)
+        {
+            int chunkSize = buffers[0].Length;
+            int chunkCount = (totalBytes + chunkSize - 1) / chunkSize;
+            int next = -1;
+
+            Task[] workers = [.. buffers.Select(buffer => Task.Run(() =>
+            {
+                int index;
+                while ((index = Interlocked.Increment(ref next)) < chunkCount)
+                {
+                    int offset = index * chunkSize;
+                    int length = Math.Min(chunkSize, totalBytes - offset);
+                    source.AsSpan(offset, length).CopyTo(buffer);
+                }
+            }))];
+            return Task.WhenAll(workers);
+        }
+
+        /// <summary>
+        /// Runs the per-cell setup (cipher construction, buffer allocation) outside the timed passes and reports its cost.
+        /// </summary>
+        private static T CreateTimed<T>(Func<T> factory, out double setupMs)
+        {
+            long t0 = Stopwatch.GetTimestamp();
+            T value = factory();
+            setupMs = Stopwatch.GetElapsedTime(t0).TotalMilliseconds;
+            return value;
+        }
+
+        /// <summary>
+        /// Times one pass over the shared data and returns its throughput in MB/s.
+        /// </summary>
+        private static async Task<double> MeasureOnceAsync(Func<Task> iteration)
+        {
+            long t0 = Stopwatch.GetTimestamp();
+            await iteration();
+            long t1 = Stopwatch.GetTimestamp();
+            double timeSeconds = (t1 - t0) / (double)Stopwatch.Frequency;
+            return TestDataSizeMb / timeSeconds;
+        }
+
+        private static async Task<List<double>> SampleAsync(Func<Task> iteration)
+        {
+            List<double> throughputs = [];
+            while (!AdaptiveSampling.IsDone(throughputs))
+            {
+                throughputs.Add(await MeasureOnceAsync(iteration));
+            }
+
+            return throughputs;
+        }
+
+        // The warm-up pass (JIT, thread pool growth, first touch of the buffers) runs once per sweep and is
+        // reported on its own so it does not widen the confidence interval of the first cell.
+        private static void WriteSweepHeader(string title, int[] threadCounts, int[] chunkSizes, double warmUpMBps)
+        {
+            TestContext.Out.WriteLine($"=== {title} ===");
+            TestContext.Out.WriteLine($"Data size: {TestDataSizeMb} MB");
+            // Constant dimensions of this sweep; the chart tooling turns every key=value into a column.
+            TestContext.Out.WriteLine($"Dimensions: Profile=byte-ramp, Runtime={RuntimeInformation.FrameworkDescription}");
+            TestContext.Out.WriteLine($"Threads: {string.Join(", ", threadCounts)}");
+            TestContext.Out.WriteLine($"Chunk sizes: {string.Join(", ", chunkSizes.Select(x => FormattableString.Invariant($"{x / (double)OneMb:F1}MB")))}");
+            TestContext.Out.WriteLine($"Cache: {CpuCacheInfo.Describe()}");
+            TestContext.Out.WriteLine($"Topology: {CpuTopologyInfo.Describe()}");
+            TestContext.Out.WriteLine($"Environment: {RunEnvironmentInfo.Describe()}");
+            TestContext.Out.WriteLine($"Sampling: {AdaptiveSampling.Describe()}");
+            TestContext.Out.WriteLine(FormattableString.Invariant($"Warm-up: {warmUpMBps:F1} MB/s (excluded from samples)"));
+            TestContext.Out.WriteLine("Threads | ChunkMB | Avg MB/s | Samples MB/s | Setup ms | First MB/s");
+        }
+
+        // Numbers are culture-invariant: the chart parsers expect '.' decimals and ';' between samples.
+        // Per-iteration samples let the chart tooling test A/B differences for significance;
+        // with adaptive sampling their count also shows how hard a cell was to pin down.
+        // Each cell gets a fresh cipher: its construction and first pass are reported next to the
+        // warm samples instead of being averaged into them.
+        private static void WriteSweepRow(int threads, int chunkSize, List<double> throughputs, double setupMs, double firstMBps)
+        {
+            string samples = string.Join(";", throughputs.Select(x => x.ToString("F1", CultureInfo.InvariantCulture)));
+            TestContext.Out.WriteLine(FormattableString.Invariant($"{threads,7} | {chunkSize / (double)OneMb,7:F3} | {throughputs.Average(),9:F1} | {samples} | {setupMs,8:F3} | {firstMBps,9:F1}"));
+        }
+
+        private static void WriteContentionHeader(int coreBudget, int[] streamCounts, int[] threadCounts, double warmUpMBps)
+        {
+            TestContext.Out.WriteLine("=== MULTI-STREAM CONTENTION SWEEP ===");
+            TestContext.Out.WriteLine($"Data size: {StreamDataSizeMb} MB per stream");
+            TestContext.Out.WriteLine($"Core budget: {coreBudget}");
+            TestContext.Out.WriteLine($"Streams: {string.Join(", ", streamCounts)}");
+            TestContext.Out.WriteLine($"Threads per stream: {string.Join(", ", threadCounts)} (cells with streams x threads > {4 * coreBudget} skipped)");
+            TestContext.Out.WriteLine($"Topology: {CpuTopologyInfo.Describe()}");
+            TestContext.Out.WriteLine($"Environment: {RunEnvironmentInfo.Describe()}");
+            TestContext.Out.WriteLine($"Sampling: {AdaptiveSampling.Describe()}");
+            TestContext.Out.WriteLine(FormattableString.Invariant($"Warm-up: {warmUpMBps:F1} MB/s (excluded from samples)"));
+            TestContext.Out.WriteLine("Streams | Threads/stream | Aggregate MB/s | Samples MB/s | Stream ms");
+        }
+
+        // Stream ms holds the completion time of every stream in every sampled pass, measured from the common start,
+        // so the chart tooling can compute per-stream fairness and tail latency itself.
+        private static void WriteContentionRow(int streams, int threads, List<double> throughputs, List<double> streamMs)
+        {
+            string samples = string.Join(";", throughputs.Select(x => x.ToString("F1", CultureInfo.InvariantCulture)));
+            string completions = string.Join(";", streamMs.Select(x => x.ToString("F1", CultureInfo.InvariantCulture)));
+            TestContext.Out.WriteLine(FormattableString.Invariant($"{streams,7} | {threads,14} | {throughputs.Average(),14:F1} | {samples} | {completions}"));
+        }
+
+        private static IEnumerable<int> GetPowersOfTwo(int max)
+        {
+            for (int i = 1; i <= max; i *= 2)
+            {
+                yield return i;
+            }
+        }
+
         private static IEnumerable<int> GetThreadSweep()
         {
             int threads = Math.Max(8, Environment.ProcessorCount);
@@ -0,0 +1,50 @@
+// SPDX-License-Identifier: MIT
+// Copyright (c) 2025–2026 Vadim Belov <https://belov.us>
+
+namespace Cotton.Crypto.Tests.TestUtils
+{
+    /// <summary>
+    /// Sequential sampling for sweep cells: keep measuring until the 95% confidence
+    /// interval of the mean is within <see cref="TargetRelativeHalfWidth"/> of it,
+    /// between <see cref="MinIterations"/> and <see cref="MaxIterations"/> samples.
+    /// </summary>
+    /// <remarks>
+    /// The floor matches the old fixed iteration count, so stable cells cost no more than before. With two samples
+    /// the t critical value is 12.7, so only cells whose samples agree within a fraction of a percent stop there.
+    /// </remarks>
+    internal static class AdaptiveSampling
+    {
+        public const int MinIterations = 2;
+        public const int MaxIterations = 10;
+        public const double TargetRelativeHalfWidth = 0.02;
+
+        // Two-sided 95% Student t critical values for 1..10 degrees of freedom.
+        private static readonly double[] TCritical95 = [12.706, 4.303, 3.182, 2.776, 2.571, 2.447, 2.365, 2.306, 2.262, 2.228];
+
+        public static string Describe()
+            => FormattableString.Invariant($"min={MinIterations}, max={MaxIterations}, target=±{TargetRelativeHalfWidth * 100:0.#}% (95% CI)");
+
+        public static bool IsDone(IReadOnlyList<double> samples)
+        {
+            if (samples.Count < MinIterations)
+            {
+                return false;
+            }
+
+            return samples.Count >= MaxIterations || RelativeHalfWidth(samples) <= TargetRelativeHalfWidth;
+        }
+
+        public static double RelativeHalfWidth(IReadOnlyList<double> samples)
+        {
+            if (samples.Count < 2)
+            {
+                return double.PositiveInfinity;
+            }
+
+            double mean = samples.Average();
+            double variance = samples.Sum(x => (x - mean) * (x - mean)) / (samples.Count - 1);
+            double t = TCritical95[Math.Min(samples.Count - 1, TCritical95.Length) - 1];
+            return t * Math.Sqrt(variance / samples.Count) / mean;
+        }
+    }
+}
@@ -0,0 +1,39 @@
+// SPDX-License-Identifier: MIT
+// Copyright (c) 2025–2026 Vadim Belov <https://belov.us>
+
+using Cotton.Benchmark.Infrastructure;
+
+namespace Cotton.Crypto.Tests.TestUtils
+{
+    /// <summary>
+    /// Reads the data/unified cache sizes of the first CPU so sweep output can be
+    /// related to the L2/L3 boundaries. Only Linux sysfs is supported.
+    /// </summary>
+    internal static class CpuCacheInfo
+    {
+        private const string CacheRoot = "/sys/devices/system/cpu/cpu0/cache";
+
+        public static string Describe()
+        {
+            List<string> parts = [];
+            if (Directory.Exists(CacheRoot))
+            {
+                foreach (string index in Directory.GetDirectories(CacheRoot, "index*").Order())
+                {
+                    string? level = SysFs.TryRead(Path.Combine(index, "level"));
+                    string? type = SysFs.TryRead(Path.Combine(index, "type"));
+                    string? size = SysFs.TryRead(Path.Combine(index, "size"));
+                    if (level is null || size is null || type == "Instruction")
+                    {
+                        continue;
+                    }
+
+                    string suffix = type == "Data" ? "d" : string.Empty;
+                    parts.Add($"L{level}{suffix} {size}");
+                }
+            }
+
+            return parts.Count == 0 ? "unknown" : string.Join(", ", parts);
+        }
+    }
+}
@@ -0,0 +1,30 @@
+// SPDX-License-Identifier: MIT
+// Copyright (c) 2025–2026 Vadim Belov <https://belov.us>
+
+using Cotton.Benchmark.Infrastructure;
+
+namespace Cotton.Crypto.Tests.TestUtils
+{
+    /// <summary>
+    /// Formats the host core layout for sweep headers using the Cotton.Benchmark <see cref="CpuTopology"/>
+    /// reader (linked into this project), with the same property names as the hardware fingerprint.
+    /// </summary>
+    internal static class CpuTopologyInfo
+    {
+        public static string Describe()
+        {
+            CpuTopology? topology = CpuTopology.TryReadLinux();
+            if (topology is null)
+            {
+                return $"logicalProcessors={Environment.ProcessorCount}";
+            }
+
+            var properties = new Dictionary<string, string>
+            {
+                ["logicalProcessors"] = topology.LogicalProcessors.ToString()
+            };
+            topology.AddProperties(properties);
+            return string.Join(", ", properties.Select(pair => $"{pair.Key}={pair.Value}"));
+        }
+    }
+}
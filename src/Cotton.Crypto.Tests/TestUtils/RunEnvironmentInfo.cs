@@ -0,0 +1,53 @@
+// SPDX-License-Identifier: MIT
+// Copyright (c) 2025–2026 Vadim Belov <https://belov.us>
+
+using Cotton.Benchmark.Infrastructure;
+using System.Globalization;
+
+namespace Cotton.Crypto.Tests.TestUtils
+{
+    /// <summary>
+    /// Captures host conditions that add noise to throughput sweeps: CPU frequency
+    /// governor, turbo state and load average. Only Linux exposes these; elsewhere
+    /// only the process count is reported.
+    /// </summary>
+    internal static class RunEnvironmentInfo
+    {
+        public static string Describe()
+        {
+            List<string> parts = [];
+
+            string? governor = SysFs.TryRead("/sys/devices/system/cpu/cpu0/cpufreq/scaling_governor");
+            if (governor is not null)
+            {
+                parts.Add($"governor={governor}");
+            }
+
+            string? noTurbo = SysFs.TryRead("/sys/devices/system/cpu/intel_pstate/no_turbo");
+            string? boost = SysFs.TryRead("/sys/devices/system/cpu/cpufreq/boost");
+            if (noTurbo is not null)
+            {
+                parts.Add($"turbo={(noTurbo == "0" ? "on" : "off")}");
+            }
+            else if (boost is not null)
+            {
+                parts.Add($"turbo={(boost == "1" ? "on" : "off")}");
+            }
+
+            string? loadAverage = SysFs.TryRead("/proc/loadavg");
+            if (loadAverage is not null)
+            {
+                string[] fields = loadAverage.Split(' ', StringSplitOptions.RemoveEmptyEntries);
+                if (fields.Length >= 3)
+                {
+                    parts.Add($"loadAverage1={fields[0]}");
+                    parts.Add($"loadAverage5={fields[1]}");
+                    parts.Add($"loadAverage15={fields[2]}");
+                }
+            }
+
+            parts.Add($"processes={System.Diagnostics.Process.GetProcesses().Length.ToString(CultureInfo.InvariantCulture)}");
+            return string.Join(", ", parts);
+        }
+    }
+}
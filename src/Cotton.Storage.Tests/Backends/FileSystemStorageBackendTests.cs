@@ -93,6 +93,27 @@ namespace Cotton.Storage.Tests.Backends
             Assert.That(result.ToArray(), Is.EqualTo(originalData));
         }
 
+        [Test]
+        public async Task FileSystemBackend_WriteWithFlushToDisk_SmokeTest_ReturnsOriginalData()
+        {
+            // Smoke test only: durability cannot be observed without a power cut, so this just checks
+            // that the fsync branch completes and the committed chunk round-trips.
+            // Arrange
+            var logger = new Mock<ILogger<FileSystemStorageBackend>>();
+            var durableBackend = new FileSystemStorageBackend(logger.Object, flushToDisk: true);
+            string uid = NewUid();
+            var originalData = Encoding.UTF8.GetBytes("Durable content");
+
+            // Act
+            await durableBackend.WriteAsync(uid, new MemoryStream(originalData));
+            await using Stream readStream = await durableBackend.ReadAsync(uid);
+
+            // Assert
+            using var result = new MemoryStream();
+            await readStream.CopyToAsync(result);
+            Assert.That(result.ToArray(), Is.EqualTo(originalData));
+        }
+
         [Test]
         public async Task FileSystemBackend_Delete_AfterWrite_ReturnsTrue()
         {
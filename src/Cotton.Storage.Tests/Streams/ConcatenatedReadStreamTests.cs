@@ -15,6 +15,8 @@ namespace Cotton.Storage.Tests.Streams
         {
             private readonly Dictionary<string, byte[]> _data = [];
 
+            public List<string> Reads { get; } = [];
+
             public void AddData(string uid, byte[] data)
             {
                 _data[uid] = data;
@@ -38,6 +40,7 @@ namespace Cotton.Storage.Tests.Streams
 
             public Task<Stream> ReadAsync(string uid, PipelineContext? context = null)
             {
+                Reads.Add(uid);
                 if (!_data.TryGetValue(uid, out var data))
                 {
                     throw new FileNotFoundException($"UID not found: {uid}");
@@ -630,5 +633,142 @@ namespace Cotton.Storage.Tests.Streams
                 }
             }
         }
+
+        [Test]
+        public async Task ConcatenatedReadStream_Prefetch_RequestsNextChunksBeforeTheyAreRead()
+        {
+            // Arrange
+            var storage = new FakeStoragePipeline();
+            storage.AddData("uid1", Encoding.UTF8.GetBytes("AB"));
+            storage.AddData("uid2", Encoding.UTF8.GetBytes("CD"));
+            storage.AddData("uid3", Encoding.UTF8.GetBytes("EF"));
+            storage.AddData("uid4", Encoding.UTF8.GetBytes("GH"));
+
+            Stream stream = storage.GetBlobStream(["uid1", "uid2", "uid3", "uid4"], prefetchDepth: 2);
+
+            // Act
+            var first = new byte[1];
+            await stream.ReadExactlyAsync(first);
+            string[] readsAfterFirstByte = [.. storage.Reads];
+            using var reader = new StreamReader(stream);
+            string rest = await reader.ReadToEndAsync();
+
+            using (Assert.EnterMultipleScope())
+            {
+                // Assert
+                Assert.That(readsAfterFirstByte, Is.EqualTo(new[] { "uid1", "uid2", "uid3" }));
+                Assert.That(Encoding.UTF8.GetString(first) + rest, Is.EqualTo("ABCDEFGH"));
+                Assert.That(storage.Reads, Is.EqualTo(new[] { "uid1", "uid2", "uid3", "uid4" }));
+            }
+        }
+
+        [Test]
+        public async Task ConcatenatedReadStream_NoPrefetch_OpensChunksOnlyWhenReached()
+        {
+            // Arrange
+            var storage = new FakeStoragePipeline();
+            storage.AddData("uid1", Encoding.UTF8.GetBytes("Hello"));
+            storage.AddData("uid2", Encoding.UTF8.GetBytes("World"));
+
+            var context = new PipelineContext
+            {
+                FileSizeBytes = 10,
+                ChunkLengths = new Dictionary<string, long>
+                {
+                    ["uid1"] = 5,
+                    ["uid2"] = 5
+                }
+            };
+
+            Stream stream = storage.GetBlobStream(["uid1", "uid2"], context, prefetchDepth: 0);
+
+            // Act
+            var first = new byte[3];
+            await stream.ReadExactlyAsync(first);
+            string[] readsAfterFirstRead = [.. storage.Reads];
+            stream.Seek(1, SeekOrigin.Begin); // behind the current position: reopens uid1
+            var rest = new byte[9];
+            await stream.ReadExactlyAsync(rest);
+
+            using (Assert.EnterMultipleScope())
+            {
+                // Assert
+                Assert.That(readsAfterFirstRead, Is.EqualTo(new[] { "uid1" }));
+                Assert.That(Encoding.UTF8.GetString(rest), Is.EqualTo("elloWorld"));
+                Assert.That(storage.Reads, Is.EqualTo(new[] { "uid1", "uid1", "uid2" }));
+            }
+        }
+
+        [Test]
+        public async Task ConcatenatedReadStream_Prefetch_MissingChunkFailsWhenReached()
+        {
+            // Arrange
+            var storage = new FakeStoragePipeline();
+            storage.AddData("uid1", Encoding.UTF8.GetBytes("Test"));
+
+            Stream stream = storage.GetBlobStream(["uid1", "nonexistent"], prefetchDepth: 1);
+
+            // Act - the missing chunk is already requested, but the first one still reads
+            var buffer = new byte[4];
+            int read = await stream.ReadAsync(buffer);
+
+            // Assert
+            Assert.That(read, Is.EqualTo(4));
+            Assert.ThrowsAsync<FileNotFoundException>(async () => await stream.ReadExactlyAsync(buffer.AsMemory(0, 1)));
+        }
+
+        [Test]
+        public void ConcatenatedReadStream_NegativePrefetchDepth_Throws()
+        {
+            var storage = new FakeStoragePipeline();
+
+            Assert.Throws<ArgumentOutOfRangeException>(() => storage.GetBlobStream(["uid1"], prefetchDepth: -1));
+        }
+
+        [Test]
+        public async Task ConcatenatedReadStream_PrefetchWithSeeks_MatchesReferenceFile()
+        {
+            const int chunkSize = 1000;
+            const int rangeOps = 2_000;
+
+            var rng = new Random(54321);
+            var fileBytes = new byte[(chunkSize * 12) + 345];
+            rng.NextBytes(fileBytes);
+
+            var storage = new FakeStoragePipeline();
+            var uids = new List<string>();
+            var chunkLengths = new Dictionary<string, long>(StringComparer.OrdinalIgnoreCase);
+            for (int offset = 0, index = 0; offset < fileBytes.Length; offset += chunkSize, index++)
+            {
+                int len = Math.Min(chunkSize, fileBytes.Length - offset);
+                string uid = $"uid{index}";
+                uids.Add(uid);
+                chunkLengths[uid] = len;
+                storage.AddData(uid, fileBytes.AsSpan(offset, len).ToArray());
+            }
+
+            var context = new PipelineContext
+            {
+                FileSizeBytes = fileBytes.Length,
+                ChunkLengths = chunkLengths,
+            };
+
+            await using Stream stream = storage.GetBlobStream([.. uids], context, prefetchDepth: 3);
+
+            for (int i = 0; i < rangeOps; i++)
+            {
+                int start = rng.Next(0, fileBytes.Length);
+                int len = rng.Next(0, Math.Min(fileBytes.Length - start, chunkSize * 4) + 1);
+
+                stream.Seek(start, SeekOrigin.Begin);
+                var buffer = new byte[len];
+                await stream.ReadExactlyAsync(buffer);
+
+                if (!buffer.AsSpan().SequenceEqual(fileBytes.AsSpan(start, len)))
+                {
+                    Assert.Fail($"Mismatch at op={i}, start={start}, len={len}.");
+                }
+            }
+        }
     }
 }
@@ -10,7 +10,13 @@ namespace Cotton.Storage.Backends
     /// <summary>
     /// Filesystem backend that stores opaque Cotton chunks under a sharded directory layout.
     /// </summary>
-    public class FileSystemStorageBackend(ILogger<FileSystemStorageBackend> _logger, string? basePath = null) : IStorageBackend, IStorageCapacityReporter
+    /// <remarks>
+    /// When <paramref name="flushToDisk"/> is set, each temp file is flushed to the device before it is renamed into
+    /// place, at the cost of one fsync per write. The chunk's contents are then durable before it becomes visible, so
+    /// after a crash a chunk is never torn; the rename itself is not fsynced (the parent directory is not flushed), so
+    /// a chunk written just before power loss may still be missing and has to be re-uploaded.
+    /// </remarks>
+    public class FileSystemStorageBackend(ILogger<FileSystemStorageBackend> _logger, string? basePath = null, bool flushToDisk = false) : IStorageBackend, IStorageCapacityReporter
     {
         private const string ChunkFileExtension = ".ctn";
         private const string BaseDirectoryName = "files";
@@ -198,6 +204,10 @@ namespace Cotton.Storage.Backends
                 }
                 await stream.CopyToAsync(tmp, WriteBufferSize).ConfigureAwait(false);
                 await tmp.FlushAsync().ConfigureAwait(false);
+                if (flushToDisk)
+                {
+                    tmp.Flush(flushToDisk: true);
+                }
             }
             catch (Exception)
             {
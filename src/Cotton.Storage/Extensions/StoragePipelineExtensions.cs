@@ -9,9 +9,12 @@ namespace Cotton.Storage.Extensions
 {
     public static class StoragePipelineExtensions
     {
-        public static Stream GetBlobStream(this IStoragePipeline _storage, string[] uids, PipelineContext? pipelineContext = null)
+        /// <summary>
+        /// Opens the chunks as one stream; <paramref name="prefetchDepth"/> chunks ahead of the reader are requested early.
+        /// </summary>
+        public static Stream GetBlobStream(this IStoragePipeline _storage, string[] uids, PipelineContext? pipelineContext = null, int prefetchDepth = 0)
         {
-            return new ConcatenatedReadStream(storage: _storage, hashes: uids, pipelineContext);
+            return new ConcatenatedReadStream(storage: _storage, hashes: uids, pipelineContext, prefetchDepth);
         }
     }
 }
@@ -6,13 +6,22 @@ using Cotton.Storage.Pipelines;
 
 namespace Cotton.Storage.Streams
 {
+    /// <summary>
+    /// Reads a file as the concatenation of its chunks. With a non-zero <c>prefetchDepth</c> the next chunks are
+    /// requested while the current one is consumed, so their fetch and decryption overlap with it.
+    /// </summary>
     internal class ConcatenatedReadStream(
         IStoragePipeline storage,
         IEnumerable<string> hashes,
-        PipelineContext? pipelineContext = null) : Stream
+        PipelineContext? pipelineContext = null,
+        int prefetchDepth = 0) : Stream
     {
         private readonly Materialized _materialized = Materialize(hashes, pipelineContext);
         private readonly bool _canSeek = pipelineContext?.ChunkLengths is not null;
+        private readonly int _prefetchDepth = prefetchDepth >= 0
+            ? prefetchDepth
+            : throw new ArgumentOutOfRangeException(nameof(prefetchDepth), prefetchDepth, "Prefetch depth cannot be negative.");
+        private readonly Dictionary<int, Task<Stream>> _prefetched = [];
         private Stream? _current;
         private int _currentChunkIndex = -1;
         private long _position;
@@ -138,7 +147,7 @@ namespace Cotton.Storage.Streams
             if (_currentChunkIndex != targetChunkIndex || _current is null)
             {
                 _current?.Dispose();
-                _current = storage.ReadAsync(Hashes[targetChunkIndex], pipelineContext).GetAwaiter().GetResult()
+                _current = OpenChunkAsync(targetChunkIndex).GetAwaiter().GetResult()
                     ?? throw new InvalidOperationException("Storage pipeline returned null stream.");
 
                 _currentChunkIndex = targetChunkIndex;
@@ -160,7 +169,7 @@ namespace Cotton.Storage.Streams
 
             // _currentChunkPosition > requiredOffset : reopen same chunk and skip from start
             _current.Dispose();
-            _current = storage.ReadAsync(Hashes[targetChunkIndex], pipelineContext).GetAwaiter().GetResult()
+            _current = OpenChunkAsync(targetChunkIndex).GetAwaiter().GetResult()
                 ?? throw new InvalidOperationException("Storage pipeline returned null stream.");
             _currentChunkPosition = 0;
 
@@ -187,7 +196,7 @@ namespace Cotton.Storage.Streams
                     await _current.DisposeAsync().ConfigureAwait(false);
                 }
 
-                _current = await storage.ReadAsync(Hashes[targetChunkIndex], pipelineContext).ConfigureAwait(false)
+                _current = await OpenChunkAsync(targetChunkIndex).ConfigureAwait(false)
                     ?? throw new InvalidOperationException("Storage pipeline returned null stream.");
 
                 _currentChunkIndex = targetChunkIndex;
@@ -209,7 +218,7 @@ namespace Cotton.Storage.Streams
 
             // _currentChunkPosition > requiredOffset : reopen same chunk and skip from start
             await _current.DisposeAsync().ConfigureAwait(false);
-            _current = await storage.ReadAsync(Hashes[targetChunkIndex], pipelineContext).ConfigureAwait(false)
+            _current = await OpenChunkAsync(targetChunkIndex).ConfigureAwait(false)
                 ?? throw new InvalidOperationException("Storage pipeline returned null stream.");
             _currentChunkPosition = 0;
 
@@ -222,6 +231,76 @@ namespace Cotton.Storage.Streams
             return true;
         }
 
+        private Task<Stream> OpenChunkAsync(int chunkIndex)
+        {
+            if (_prefetchDepth == 0)
+            {
+                return storage.ReadAsync(Hashes[chunkIndex], pipelineContext);
+            }
+
+            if (!_prefetched.Remove(chunkIndex, out Task<Stream>? opening))
+            {
+                opening = storage.ReadAsync(Hashes[chunkIndex], pipelineContext);
+            }
+
+            // Keep the window at [chunkIndex + 1, chunkIndex + depth]; anything outside it was left behind by a seek.
+            // Dictionary allows Remove while its keys are enumerated.
+            int last = Math.Min(chunkIndex + _prefetchDepth, Hashes.Count - 1);
+            foreach (int index in _prefetched.Keys)
+            {
+                if (index <= chunkIndex || index > last)
+                {
+                    _prefetched.Remove(index, out Task<Stream>? abandoned);
+                    ReleaseWhenOpened(abandoned!);
+                }
+            }
+
+            for (int i = chunkIndex + 1; i <= last; i++)
+            {
+                if (!_prefetched.ContainsKey(i))
+                {
+                    _prefetched[i] = ReadAheadAsync(Hashes[i]);
+                }
+            }
+
+            return opening;
+        }
+
+        // Awaited so a storage failure surfaces when that chunk is reached, not while an earlier one is opened.
+        private async Task<Stream> ReadAheadAsync(string hash)
+        {
+            return await storage.ReadAsync(hash, pipelineContext).ConfigureAwait(false);
+        }
+
+        private static void ReleaseWhenOpened(Task<Stream> opening)
+        {
+            _ = opening.ContinueWith(
+                static task =>
+                {
+                    if (task.IsCompletedSuccessfully)
+                    {
+                        task.Result?.Dispose();
+                    }
+                    else
+                    {
+                        _ = task.Exception;
+                    }
+                },
+                CancellationToken.None,
+                TaskContinuationOptions.ExecuteSynchronously,
+                TaskScheduler.Default);
+        }
+
+        private void ReleasePrefetched()
+        {
+            foreach (Task<Stream> opening in _prefetched.Values)
+            {
+                ReleaseWhenOpened(opening);
+            }
+
+            _prefetched.Clear();
+        }
+
         private static void SkipBytes(Stream stream, long count)
         {
             if (count <= 0)
@@ -312,7 +391,7 @@ namespace Cotton.Storage.Streams
                     return 0;
                 }
 
-                _current = storage.ReadAsync(Hashes[0], pipelineContext).GetAwaiter().GetResult();
+                _current = OpenChunkAsync(0).GetAwaiter().GetResult();
             }
 
             if (_current is null)
@@ -332,7 +411,7 @@ namespace Cotton.Storage.Streams
                     return 0;
                 }
 
-                _current = storage.ReadAsync(Hashes[_currentChunkIndex], pipelineContext).GetAwaiter().GetResult();
+                _current = OpenChunkAsync(_currentChunkIndex).GetAwaiter().GetResult();
                 return ReadSequential(buffer, offset, count);
             }
 
@@ -388,7 +467,7 @@ namespace Cotton.Storage.Streams
                     return 0;
                 }
 
-                _current = await storage.ReadAsync(Hashes[0], pipelineContext).ConfigureAwait(false);
+                _current = await OpenChunkAsync(0).ConfigureAwait(false);
             }
 
             if (_current is null)
@@ -408,7 +487,7 @@ namespace Cotton.Storage.Streams
                     return 0;
                 }
 
-                _current = await storage.ReadAsync(Hashes[_currentChunkIndex], pipelineContext).ConfigureAwait(false);
+                _current = await OpenChunkAsync(_currentChunkIndex).ConfigureAwait(false);
                 return await ReadSequentialAsync(buffer, cancellationToken).ConfigureAwait(false);
             }
 
@@ -451,6 +530,7 @@ namespace Cotton.Storage.Streams
             if (disposing)
             {
                 _current?.Dispose();
+                ReleasePrefetched();
             }
             base.Dispose(disposing);
         }
@@ -466,6 +546,7 @@ namespace Cotton.Storage.Streams
                 _current?.Dispose();
             }
 
+            ReleasePrefetched();
             await base.DisposeAsync().ConfigureAwait(false);
             GC.SuppressFinalize(this);
         }